@@ -0,0 +1,157 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Generic, Hashable, Iterable, Optional, Set, Tuple, TypeVar
+
+from app.core.config import settings
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class TTLCache(Generic[V]):
+    """
+    Size-bounded in-process cache with per-entry expiry and LRU eviction.
+
+    Entries may carry tags (e.g. ``("user", 42)``) so that a write can drop every
+    entry built from a given row without knowing the cache keys.
+    """
+
+    def __init__(self, *, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, V, Tuple[Hashable, ...]]]" = OrderedDict()
+        self._tags: Dict[Hashable, Set[Hashable]] = {}
+        self._lock = threading.Lock()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for ``key`` or ``default`` if absent or expired."""
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            expires_at, value, _ = entry
+            if expires_at <= time.monotonic():
+                self._discard(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: V,
+        *,
+        ttl: Optional[float] = None,
+        tags: Iterable[Hashable] = (),
+        generation: Optional[int] = None,
+    ) -> bool:
+        """
+        Store ``value`` under ``key``.
+        If ``generation`` is given and an invalidation happened since it was read,
+        the value is considered stale and is not stored. Returns whether it was stored.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0 or self.maxsize <= 0:
+            return False
+        tags = tuple(tags)
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return False
+            if key in self._data:
+                self._discard(key)
+            self._data[key] = (time.monotonic() + ttl, value, tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._data) > self.maxsize:
+                oldest = next(iter(self._data))
+                self._discard(oldest)
+                self.evictions += 1
+        return True
+
+    def pop(self, key: Hashable) -> None:
+        """Remove ``key`` from the cache if present."""
+        with self._lock:
+            self.generation += 1
+            if key in self._data:
+                self._discard(key)
+                self.invalidations += 1
+
+    def invalidate_tag(self, tag: Hashable) -> int:
+        """Remove every entry carrying ``tag``. Returns the number of entries removed."""
+        with self._lock:
+            self.generation += 1
+            keys = self._tags.pop(tag, set())
+            for key in keys:
+                self._discard(key)
+            self.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._data.clear()
+            self._tags.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters describing how effective the cache is."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+    def _discard(self, key: Hashable) -> None:
+        _, _, tags = self._data.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+# Authenticated users keyed by token subject, tagged with ("user", id),
+# ("candidate_profile", id) and ("recruiter_profile", id).
+# The cache is per process: other workers only see a write once their entry expires.
+principal_cache: TTLCache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+# (token_version, is_active, profile_id) per user id, used to revoke access tokens without a
+# query per request. Writes in this process update it directly; other workers
+# pick changes up within TOKEN_VERSION_CACHE_TTL_SECONDS.
+token_version_cache: TTLCache = TTLCache(
+    maxsize=settings.TOKEN_VERSION_CACHE_MAX_SIZE,
+    ttl=settings.TOKEN_VERSION_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_principal(tag: str, value: Any) -> None:
+    """Drop cached principals built from the row identified by ``(tag, value)``."""
+    if value is not None:
+        principal_cache.invalidate_tag((tag, value))
+        if tag == "user":
+            # The token state carries the user's profile ID, which profile writes change.
+            token_version_cache.pop(value)
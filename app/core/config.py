@@ -10,6 +10,53 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_MINUTES: int = 7 * 24 * 60
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_MAX_SIZE: int = 1024
+    PASSWORD_HASH_MAX_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 256
+    TOKEN_VERSION_CACHE_TTL_SECONDS: int = 30
+    TOKEN_VERSION_CACHE_MAX_SIZE: int = 10000
+    VERIFIED_TOKEN_CACHE_MAX_SIZE: int = 10000
+    REVOCATION_BLOOM_CAPACITY: int = 100000
+    REVOCATION_BLOOM_ERROR_RATE: float = 0.001
+    REVOCATION_SYNC_SECONDS: int = 30
+    # How far behind the newest revoked_at each sync re-reads: revoked_at is the transaction's
+    # start time, so a revocation can commit after a later one has already been seen.
+    REVOCATION_SYNC_OVERLAP_SECONDS: int = 300
+    # Purges expired revocations and rebuilds the Bloom filter without them; 0 disables.
+    REVOCATION_REBUILD_SECONDS: int = 3600
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 100
+    PAGE_MAX_LIMIT: int = 500
+    BULK_CHUNK_SIZE: int = 500
+    BULK_MAX_ITEMS: int = 1000
+    RATE_LIMIT_SHARDS: int = 64
+    COUNTER_RECONCILE_SECONDS: int = 3600
+    DASHBOARD_MATCH_SCORE_THRESHOLD: int = 50
+    DASHBOARD_CACHE_TTL_SECONDS: int = 30
+    DASHBOARD_CACHE_MAX_SIZE: int = 1024
+    CANDIDATE_MATCHES_TOP_K: int = 20
+    CANDIDATE_MATCH_REFRESH_DELAY_SECONDS: float = 1.0
+    # "remote" (AGENTIC_RAG_API_URL only), "local" (in-process BM25) or "auto" (remote, local if it is unavailable).
+    AI_SEARCH_MODE: str = "auto"
+    AI_SEARCH_REMOTE_TIMEOUT_SECONDS: float = 300.0
+    # Candidates kept by the local pre-filter for the remote call; 0 sends them all.
+    AI_SEARCH_PREFILTER_TOP_K: int = 20
+    RESUME_TERM_CACHE_MAX_SIZE: int = 10000
+    RESUME_TERM_CACHE_TTL_SECONDS: int = 24 * 60 * 60
+    # Distinct terms kept for the cached resume term counts before they are all dropped.
+    RESUME_TERM_CACHE_MAX_TERMS: int = 500000
+    LOGIN_RATE_LIMIT_PER_USERNAME: int = 5
+    LOGIN_RATE_LIMIT_PER_IP: int = 20
+    LOGIN_RATE_LIMIT_WINDOW_SECONDS: int = 60
+    # Number of reverse proxies in front of the app that append to X-Forwarded-For; 0 ignores the header.
+    TRUSTED_PROXY_HOPS: int = 0
     model_config = SettingsConfigDict(env_file=".env", extra="ignore", env_file_encoding='utf-8')
 
 @lru_cache() 
@@ -0,0 +1,112 @@
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+
+class DashboardCacheBackend(ABC):
+    """
+    Storage for serialized recruiter dashboards. A shared implementation (e.g. Redis)
+    lets every worker see an invalidation; ``invalidate`` runs in after-commit hooks,
+    so it must not block and should schedule any network I/O.
+    """
+
+    @abstractmethod
+    def marker(self, key: str) -> Any:
+        """
+        Opaque value read before the dashboard under ``key`` is computed and passed back
+        to ``set``, which skips the write if ``key`` was invalidated in between.
+        """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """Returns the cached dashboard under ``key``, or None."""
+
+    @abstractmethod
+    async def set(self, key: str, value: str, *, ttl: float, marker: Any = None) -> None:
+        """Caches ``value`` under ``key`` for ``ttl`` seconds, unless ``marker`` is stale."""
+
+    @abstractmethod
+    def invalidate(self, key: str) -> None:
+        """Drops ``key`` and cancels the fills of ``key`` that are in flight."""
+
+    def stats(self) -> Dict[str, Any]:
+        return {}
+
+
+class LocalDashboardCacheBackend(DashboardCacheBackend):
+    """
+    In-process backend on a TTLCache. Invalidations only reach this worker, so other
+    workers serve their copy until it expires.
+    Each invalidation stamps its key with a new sequence number and ``marker`` returns the
+    key's stamp, so it only cancels the fills of its own key. Stamps are kept for the
+    ``maxsize`` most recently invalidated keys; the others read the highest dropped stamp,
+    which may cancel a fill needlessly but never lets a stale one through.
+    Stands in for a shared backend in development and single-worker deployments.
+    """
+
+    def __init__(self, *, maxsize: int, ttl: float):
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._maxsize = maxsize
+        self._stamps: "OrderedDict[str, int]" = OrderedDict()
+        self._dropped_stamp = 0
+        self._sequence = 0
+        self._lock = threading.Lock()
+        self.cancelled_fills = 0
+
+    def marker(self, key: str) -> Any:
+        with self._lock:
+            return self._stamps.get(key, self._dropped_stamp)
+
+    async def get(self, key: str) -> Optional[str]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: str, *, ttl: float, marker: Any = None) -> None:
+        with self._lock:
+            if marker is not None and marker != self._stamps.get(key, self._dropped_stamp):
+                self.cancelled_fills += 1
+                return
+            self._cache.set(key, value, ttl=ttl)
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._sequence += 1
+            self._stamps[key] = self._sequence
+            self._stamps.move_to_end(key)
+            while len(self._stamps) > self._maxsize:
+                _, stamp = self._stamps.popitem(last=False)
+                self._dropped_stamp = max(self._dropped_stamp, stamp)
+            self._cache.pop(key)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "local", **self._cache.stats(), "cancelled_fills": self.cancelled_fills}
+
+
+_backend: DashboardCacheBackend = LocalDashboardCacheBackend(
+    maxsize=settings.DASHBOARD_CACHE_MAX_SIZE,
+    ttl=settings.DASHBOARD_CACHE_TTL_SECONDS,
+)
+
+
+def get_dashboard_cache_backend() -> DashboardCacheBackend:
+    return _backend
+
+
+def set_dashboard_cache_backend(backend: DashboardCacheBackend) -> None:
+    """Installs a shared backend (e.g. at startup) so invalidations reach every worker process."""
+    global _backend
+    _backend = backend
+
+
+def recruiter_dashboard_key(recruiter_profile_id: int) -> str:
+    return f"dashboard:recruiter:{recruiter_profile_id}"
+
+
+def invalidate_recruiter_dashboards(recruiter_profile_ids: Iterable[Optional[int]]) -> None:
+    """Drop the cached dashboards of the given recruiter profiles."""
+    for recruiter_profile_id in set(recruiter_profile_ids):
+        if recruiter_profile_id is not None:
+            _backend.invalidate(recruiter_dashboard_key(recruiter_profile_id))
@@ -0,0 +1,71 @@
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded for the requested listing."""
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encodes the sort-key values of the last row of a page into an opaque cursor."""
+    payload = [value.isoformat() if isinstance(value, (datetime, date)) else value for value in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence[Any]) -> Tuple[Any, ...]:
+    """Decodes a cursor produced by ``encode_cursor`` for the given sort-key columns."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, list) or len(payload) != len(columns):
+            raise ValueError("cursor does not match the sort key")
+        values = []
+        for column, value in zip(columns, payload):
+            python_type = column.type.python_type
+            if python_type is datetime:
+                value = datetime.fromisoformat(value)
+            elif not isinstance(value, python_type):
+                raise ValueError("cursor value has the wrong type")
+            values.append(value)
+        return tuple(values)
+    except (ValueError, TypeError, NotImplementedError) as e:
+        raise InvalidCursorError("Invalid pagination cursor.") from e
+
+
+async def paginate(
+    db: AsyncSession,
+    statement: Select,
+    *,
+    order_by: Sequence[Any],
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    descending: bool = False,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Keyset pagination: orders ``statement`` by the ``order_by`` columns (which must end in a
+    unique column such as the primary key) and resumes strictly after ``cursor``.
+    The cost of a page does not depend on how deep it is, unlike OFFSET.
+    Returns the rows of the page and the cursor of the next page (None on the last page).
+    """
+    if cursor:
+        values = decode_cursor(cursor, order_by)
+        key = tuple_(*order_by)
+        statement = statement.where(key < tuple_(*values) if descending else key > tuple_(*values))
+    statement = statement.order_by(
+        *[column.desc() if descending else column.asc() for column in order_by]
+    ).limit(limit + 1)
+
+    result = await db.execute(statement)
+    rows = list(result.scalars().unique().all())
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor([getattr(last, column.key) for column in order_by])
+    return rows, next_cursor
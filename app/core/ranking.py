@@ -0,0 +1,225 @@
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict, Hashable, List, Mapping, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+# Words with inner dots, dashes, pluses or hashes stay whole ("node.js", "c++", "c#").
+_TOKEN = re.compile(r"[\w+#]+(?:[.\-][\w+#]+)*")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or our the this to was we will with you your".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Case-folded word tokens of ``text`` without common English stopwords."""
+    return [token for token in _TOKEN.findall(text.casefold()) if token not in _STOPWORDS]
+
+
+class TermCounts(NamedTuple):
+    """Bag of words of one document: term IDs of a ``Vocabulary`` with their counts, and its token count."""
+
+    term_ids: np.ndarray
+    counts: np.ndarray
+    length: int
+
+
+class Vocabulary:
+    """
+    Append-only term -> ID mapping. Documents counted against the same vocabulary can be
+    indexed together without looking their terms up again.
+    """
+
+    def __init__(self) -> None:
+        self.ids: Dict[str, int] = {}
+        self.terms: List[str] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def term_counts(self, text: str) -> TermCounts:
+        tokens = tokenize(text)
+        counted = Counter(tokens)
+        with self._lock:
+            for term in counted:
+                if term not in self.ids:
+                    self.ids[term] = len(self.terms)
+                    self.terms.append(term)
+            term_ids = [self.ids[term] for term in counted]
+        return TermCounts(
+            np.asarray(term_ids, dtype=np.int32),
+            np.fromiter(counted.values(), dtype=np.int32, count=len(counted)),
+            len(tokens),
+        )
+
+
+class BM25Index:
+    """
+    Okapi BM25 over a fixed set of documents, held as a sparse document-term matrix in
+    CSR layout (numpy arrays). Scoring a query is a handful of vectorized operations over
+    the non-zero entries, so it costs O(total distinct terms per document), not O(vocabulary).
+    IDF is computed over the indexed documents themselves.
+
+    The matrix is assembled from precomputed ``TermCounts`` (see ``TermCountCache``);
+    ``from_texts`` tokenizes the documents first.
+    """
+
+    def __init__(
+        self,
+        documents: Mapping[Hashable, TermCounts],
+        vocabulary: Vocabulary,
+        *,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ):
+        self.keys: List[Hashable] = list(documents)
+        self.k1 = k1
+        self.b = b
+        self._vocabulary = vocabulary
+        rows = [documents[key] for key in self.keys]
+        self.indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum([len(row.term_ids) for row in rows], out=self.indptr[1:])
+        term_ids = np.concatenate([row.term_ids for row in rows]) if rows else np.zeros(0, dtype=np.int32)
+        # Columns are the terms present in these documents, in vocabulary ID order.
+        self._term_ids, indices = np.unique(term_ids, return_inverse=True)
+        self.indices = indices.astype(np.int64).reshape(-1)
+        self.counts = np.concatenate([row.counts for row in rows]).astype(np.float64) if rows else np.zeros(0)
+        self.lengths = np.asarray([row.length for row in rows], dtype=np.float64)
+        # Row (document) of every non-zero entry.
+        self.rows = np.repeat(np.arange(len(self.keys)), np.diff(self.indptr))
+
+        size = len(self.keys)
+        document_frequency = np.bincount(self.indices, minlength=len(self._term_ids))
+        self.idf = np.log1p((size - document_frequency + 0.5) / (document_frequency + 0.5))
+        average_length = self.lengths.mean() if size and self.lengths.any() else 1.0
+        # Per-entry BM25 term-frequency saturation; depends on the document only, not the query.
+        norm = self.k1 * (1 - self.b + self.b * self.lengths[self.rows] / average_length)
+        self._saturated = self.counts * (self.k1 + 1) / (self.counts + norm)
+
+    @classmethod
+    def from_texts(cls, documents: Mapping[Hashable, str], **kwargs: float) -> "BM25Index":
+        vocabulary = Vocabulary()
+        return cls({key: vocabulary.term_counts(text) for key, text in documents.items()}, vocabulary, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _query_weights(self, query: Mapping[str, float]) -> np.ndarray:
+        weights = np.zeros(len(self._term_ids), dtype=np.float64)
+        for term, weight in query.items():
+            term_id = self._vocabulary.ids.get(term)
+            if term_id is None:
+                continue
+            column = np.searchsorted(self._term_ids, term_id)
+            if column < len(self._term_ids) and self._term_ids[column] == term_id:
+                weights[column] += weight
+        return weights * self.idf
+
+    def _contributions(self, query: Mapping[str, float]) -> np.ndarray:
+        """Score contribution of every non-zero entry of the document-term matrix."""
+        return self._query_weights(query)[self.indices] * self._saturated
+
+    def score(self, query: Mapping[str, float]) -> np.ndarray:
+        """BM25 score of every document for ``query`` (term -> weight), in ``keys`` order."""
+        return np.bincount(self.rows, weights=self._contributions(query), minlength=len(self.keys))
+
+    def rank(
+        self, query: Mapping[str, float], *, limit: int, explain: int = 5
+    ) -> List[Tuple[Hashable, float, List[str]]]:
+        """
+        The ``limit`` best documents as (key, score, top matching terms), best first.
+        Documents sharing no term with the query are left out.
+        """
+        contributions = self._contributions(query)
+        scores = np.bincount(self.rows, weights=contributions, minlength=len(self.keys))
+        candidates = np.flatnonzero(scores > 0)
+        if candidates.size > limit:
+            candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+        # Highest score first, ties by original order.
+        candidates = candidates[np.lexsort((candidates, -scores[candidates]))]
+
+        terms = self._vocabulary.terms
+        ranked = []
+        for row in candidates:
+            start, end = self.indptr[row], self.indptr[row + 1]
+            row_contributions = contributions[start:end]
+            best = np.argsort(-row_contributions)[:explain]
+            matched = [terms[self._term_ids[self.indices[start + i]]] for i in best if row_contributions[i] > 0]
+            ranked.append((self.keys[row], float(scores[row]), matched))
+        return ranked
+
+
+class TermCountCache:
+    """
+    Term counts of documents by key (resumes by candidate profile ID), so that ranking the
+    same documents again does not tokenize them again. An entry is only used for the text
+    it was counted from. Once the shared vocabulary outgrows ``max_terms`` it is replaced,
+    together with every entry counted against it.
+    """
+
+    def __init__(self, *, maxsize: int, ttl: float, max_terms: int):
+        self.entries: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.max_terms = max_terms
+        self.vocabulary = Vocabulary()
+        self.stale = 0
+        self.resets = 0
+
+    def _current_vocabulary(self) -> Vocabulary:
+        if len(self.vocabulary) > self.max_terms:
+            self.vocabulary = Vocabulary()
+            self.entries.clear()
+            self.resets += 1
+        return self.vocabulary
+
+    def put(self, key: Hashable, text: str) -> TermCounts:
+        """Counts ``text`` and caches the result under ``key``."""
+        counts = self._current_vocabulary().term_counts(text)
+        self.entries.set(key, (hash(text), counts))
+        return counts
+
+    def get_many(self, documents: Mapping[Hashable, str]) -> Tuple[Dict[Hashable, TermCounts], Vocabulary]:
+        """Term counts of every document, counting and caching the ones missing or changed."""
+        vocabulary = self._current_vocabulary()
+        found: Dict[Hashable, TermCounts] = {}
+        for key, text in documents.items():
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] == hash(text):
+                found[key] = entry[1]
+                continue
+            if entry is not None:
+                self.stale += 1
+            found[key] = vocabulary.term_counts(text)
+            self.entries.set(key, (hash(text), found[key]))
+        return found, vocabulary
+
+    def index(self, documents: Mapping[Hashable, str], **kwargs: float) -> BM25Index:
+        """A BM25Index of ``documents`` built from their cached term counts."""
+        counts, vocabulary = self.get_many(documents)
+        return BM25Index(counts, vocabulary, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self.entries.stats(), "stale": self.stale, "terms": len(self.vocabulary), "resets": self.resets}
+
+
+# Term counts of resume texts keyed by candidate profile ID, filled when a resume is
+# uploaded and on the first ranking that sees it. Per process; entries are checked
+# against the resume text, so writes from other workers are never served stale.
+resume_term_cache = TermCountCache(
+    maxsize=settings.RESUME_TERM_CACHE_MAX_SIZE,
+    ttl=settings.RESUME_TERM_CACHE_TTL_SECONDS,
+    max_terms=settings.RESUME_TERM_CACHE_MAX_TERMS,
+)
+
+
+def weighted_query(fields: Sequence[Tuple[str, float]]) -> Dict[str, float]:
+    """Query term weights from (text, weight) fields; a term's weights add up over its occurrences."""
+    query: Dict[str, float] = {}
+    for text, weight in fields:
+        for token in tokenize(text):
+            query[token] = query.get(token, 0.0) + weight
+    return query
@@ -0,0 +1,136 @@
+import time
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Tuple
+
+from app.core.config import settings
+
+
+class RateLimitBackend(ABC):
+    """
+    Storage for token buckets. Implementations must make ``acquire`` atomic per key;
+    a shared implementation (e.g. Redis with a Lua script) makes limits hold across workers.
+    """
+
+    @abstractmethod
+    async def acquire(
+        self, key: str, *, capacity: float, refill_per_second: float, cost: float = 1.0
+    ) -> Tuple[bool, float]:
+        """
+        Takes ``cost`` tokens from the bucket for ``key``.
+        Returns (allowed, retry_after_seconds).
+        """
+
+    def stats(self) -> Dict[str, Any]:
+        return {}
+
+
+class LocalRateLimitBackend(RateLimitBackend):
+    """
+    In-process token buckets, split across shards by key hash.
+    ``acquire`` never awaits, so on the event loop it runs without locks. Buckets idle
+    for longer than ``idle_seconds`` are pruned from a shard as it is touched, so memory
+    stays bounded by the keys seen within that sliding window.
+    Stands in for a shared backend in development and single-worker deployments.
+    """
+
+    def __init__(self, *, shards: int = 64, idle_seconds: float = 900.0):
+        self._shards: List[Dict[str, List[float]]] = [{} for _ in range(shards)]
+        self._next_prune = [0.0] * shards
+        self.idle_seconds = idle_seconds
+        self.allowed = 0
+        self.rejected = 0
+
+    async def acquire(
+        self, key: str, *, capacity: float, refill_per_second: float, cost: float = 1.0
+    ) -> Tuple[bool, float]:
+        now = time.monotonic()
+        index = zlib.crc32(key.encode()) % len(self._shards)
+        shard = self._shards[index]
+        if now >= self._next_prune[index]:
+            self._prune(shard, now)
+            self._next_prune[index] = now + self.idle_seconds / 4
+
+        bucket = shard.get(key)
+        if bucket is None:
+            bucket = shard[key] = [capacity, now]
+        tokens = min(capacity, bucket[0] + (now - bucket[1]) * refill_per_second)
+        bucket[1] = now
+        if tokens >= cost:
+            bucket[0] = tokens - cost
+            self.allowed += 1
+            return True, 0.0
+        bucket[0] = tokens
+        self.rejected += 1
+        return False, (cost - tokens) / refill_per_second
+
+    def _prune(self, shard: Dict[str, List[float]], now: float) -> None:
+        stale = [key for key, (_, updated_at) in shard.items() if now - updated_at > self.idle_seconds]
+        for key in stale:
+            del shard[key]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "local",
+            "shards": len(self._shards),
+            "tracked_keys": sum(len(shard) for shard in self._shards),
+            "allowed": self.allowed,
+            "rejected": self.rejected,
+        }
+
+
+class TokenBucketLimiter:
+    """
+    Token-bucket rate limit: bursts of up to ``limit`` requests, refilled continuously so
+    that at most ``limit`` requests are admitted per ``window_seconds``.
+    """
+
+    def __init__(self, name: str, *, limit: int, window_seconds: float, backend: RateLimitBackend):
+        self.name = name
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.backend = backend
+
+    async def hit(self, key: str) -> Tuple[bool, float]:
+        return await self.backend.acquire(
+            f"{self.name}:{key}",
+            capacity=self.limit,
+            refill_per_second=self.limit / self.window_seconds,
+        )
+
+
+_backend: RateLimitBackend = LocalRateLimitBackend(shards=settings.RATE_LIMIT_SHARDS)
+
+
+def get_rate_limit_backend() -> RateLimitBackend:
+    return _backend
+
+
+def set_rate_limit_backend(backend: RateLimitBackend) -> None:
+    """Installs a shared backend (e.g. at startup) so limits hold across worker processes."""
+    global _backend
+    _backend = backend
+    for limiter in _limiters:
+        limiter.backend = backend
+
+
+_limiters: List[TokenBucketLimiter] = []
+
+
+def make_limiter(name: str, *, limit: int, window_seconds: float) -> TokenBucketLimiter:
+    limiter = TokenBucketLimiter(name, limit=limit, window_seconds=window_seconds, backend=_backend)
+    _limiters.append(limiter)
+    return limiter
+
+
+# Login attempts, checked before the user lookup and bcrypt verify on /auth/token.
+login_username_limiter = make_limiter(
+    "login:username",
+    limit=settings.LOGIN_RATE_LIMIT_PER_USERNAME,
+    window_seconds=settings.LOGIN_RATE_LIMIT_WINDOW_SECONDS,
+)
+login_ip_limiter = make_limiter(
+    "login:ip",
+    limit=settings.LOGIN_RATE_LIMIT_PER_IP,
+    window_seconds=settings.LOGIN_RATE_LIMIT_WINDOW_SECONDS,
+)
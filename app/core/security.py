@@ -1,5 +1,11 @@
+import asyncio
+import hashlib
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Union, Optional
+from typing import Any, Callable, Dict, Union, Optional, TypeVar
 from jose import jwt, JWTError
 from passlib.context import CryptContext
 from app.core.config import settings
@@ -9,22 +15,61 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession 
 from jose import JWTError, jwt
-from app.dependencies import deps  
+from app.database.database import get_db
+from app.core.cache import TTLCache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/token")
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 ALGORITHM = settings.ALGORITHM
 
+# Verified payloads keyed by the SHA-256 of the token; each entry expires at the
+# token's own ``exp``, so the signature is checked once per token per process.
+verified_token_cache: TTLCache = TTLCache(
+    maxsize=settings.VERIFIED_TOKEN_CACHE_MAX_SIZE,
+    ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+
+def decode_token(token: str, verify_exp: bool = True) -> Dict[str, Any]:
+    """
+    Decodes and verifies a JWT, reusing the verified payload of a token seen before.
+    :param token: The encoded JWT.
+    :param verify_exp: Whether to reject expired tokens. Unverified-expiry decodes bypass the cache.
+    :return: A copy of the token payload.
+    :raises JWTError: If the token is invalid or expired.
+    """
+    if not verify_exp:
+        return jwt.decode(
+            token, settings.SECRET_KEY, algorithms=[ALGORITHM], options={"verify_exp": False}
+        )
+
+    key = hashlib.sha256(token.encode()).digest()
+    payload = verified_token_cache.get(key)
+    if payload is None:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            verified_token_cache.set(key, payload, ttl=exp - time.time())
+    return dict(payload)
+
 def create_access_token(
     subject: Union[str, Any],
     expires_delta: Optional[timedelta] = None,
-    role: Optional[str] = None
+    role: Optional[str] = None,
+    *,
+    user_id: Optional[int] = None,
+    profile_id: Optional[int] = None,
+    token_version: Optional[int] = None,
+    is_superuser: bool = False
 ) -> str:
     """
     Creates a new JWT access token.
     :param subject: The subject of the token (e.g., user ID or email).
     :param expires_delta: Optional timedelta for token expiration. If None, uses default.
-    :param roles: Optional list of roles to include in the token payload.
+    :param role: Optional role to include in the token payload.
+    :param user_id: User ID, embedded as the ``uid`` claim.
+    :param profile_id: Candidate or recruiter profile ID, embedded as the ``pid`` claim.
+    :param token_version: The user's token version (``ver``); tokens with an older version are rejected.
+    :param is_superuser: Embedded as the ``su`` claim.
     :return: The encoded JWT token string.
     """
     if expires_delta:
@@ -34,10 +79,17 @@ def create_access_token(
             minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
         )
 
-    to_encode = {"exp": expire, "sub": str(subject)}
+    to_encode = {"exp": expire, "sub": str(subject), "jti": uuid.uuid4().hex}
     if role is not None:
         to_encode["role"] = role
-
+    if user_id is not None:
+        to_encode["uid"] = user_id
+    if profile_id is not None:
+        to_encode["pid"] = profile_id
+    if token_version is not None:
+        to_encode["ver"] = token_version
+    if is_superuser:
+        to_encode["su"] = True
 
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
@@ -58,7 +110,7 @@ def create_refresh_token(
             minutes=settings.REFRESH_TOKEN_EXPIRE_MINUTES 
         )
 
-    to_encode = {"exp": expire, "sub": str(subject)}
+    to_encode = {"exp": expire, "sub": str(subject), "jti": uuid.uuid4().hex}
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
@@ -79,8 +131,109 @@ def get_password_hash(password: str) -> str:
     """
     return pwd_context.hash(password)
 
+T = TypeVar("T")
+
+class PasswordHashPool:
+    """
+    Bounded thread pool for bcrypt work. bcrypt releases the GIL, so hashing on
+    worker threads keeps the event loop responsive during login bursts.
+    At most ``max_workers`` hashes run at once; once ``max_queue`` calls are
+    waiting (0 means unbounded), new calls are rejected with a 503. A call cancelled
+    while it waits (client disconnect, timeout) leaves the queue and its hash is skipped.
+    """
+
+    def __init__(self, *, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hash")
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.rejected = 0
+        self.peak_queued = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        with self._lock:
+            if self.max_queue and self.queued >= self.max_queue:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Authentication service is busy, please retry shortly.",
+                    headers={"Retry-After": "1"},
+                )
+            self.queued += 1
+            self.peak_queued = max(self.peak_queued, self.queued)
+        submitted_at = time.perf_counter()
+        # Guarded by the lock: whichever of ``task`` (starting) and ``run`` (being cancelled
+        # while the job waits) comes first takes the job off the queue count.
+        job = {"started": False, "abandoned": False}
+
+        def task() -> Optional[T]:
+            waited = time.perf_counter() - submitted_at
+            with self._lock:
+                if job["abandoned"]:
+                    return None
+                job["started"] = True
+                self.queued -= 1
+                self.running += 1
+                self.total_wait_seconds += waited
+                self.max_wait_seconds = max(self.max_wait_seconds, waited)
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self.completed += 1
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, task)
+        finally:
+            with self._lock:
+                if not job["started"]:
+                    job["abandoned"] = True
+                    self.queued -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "queued": self.queued,
+                "running": self.running,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "peak_queued": self.peak_queued,
+                "avg_wait_ms": round(self.total_wait_seconds / self.completed * 1000, 3) if self.completed else 0.0,
+                "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+            }
+
+password_hash_pool = PasswordHashPool(
+    max_workers=settings.PASSWORD_HASH_MAX_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verifies a plain password against a hashed password off the event loop.
+    :param plain_password: The plain text password.
+    :param hashed_password: The hashed password from storage.
+    :return: True if passwords match, False otherwise.
+    """
+    return await password_hash_pool.run(pwd_context.verify, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    Hashes a plain text password off the event loop.
+    :param password: The plain text password.
+    :return: The hashed password string.
+    """
+    return await password_hash_pool.run(pwd_context.hash, password)
+
 async def get_current_user(
-    db: AsyncSession = Depends(deps.get_db), 
+    db: AsyncSession = Depends(get_db), 
     token: str = Depends(oauth2_scheme)
 ) -> schemas.User:
     """
@@ -93,15 +246,14 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
+        payload = decode_token(token)
+        if payload.get("sub") is None:
             raise credentials_exception
-        token_data = schemas.TokenPayload(email=email)
-    except JWTError:
+        token_data = schemas.TokenPayload(**payload)
+    except (JWTError, ValueError):
         raise credentials_exception
 
-    user = await crud.get_user_by_email(db, email=token_data.email)
+    user = await crud.get_user_by_email(db, email=token_data.sub)
     if user is None:
         raise credentials_exception
     return user
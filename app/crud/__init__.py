@@ -1,6 +1,8 @@
 from .crud_user import (
     get_user,
     get_user_by_email,
+    get_user_identity,
+    get_profile_id,
     get_users,
     create_user,
     update_user,
@@ -12,6 +14,10 @@ from .crud_recruiter_profile import recruiter_profile
 
 from .crud_education import education
 from .crud_experience import experience 
-from .crud_skill import candidate_skill 
-from .crud_job_posting import skills_string_to_list 
+from .crud_skill import candidate_skill, skill, normalize_skill_name
 from .crud_job_posting import job_posting as job
+from .crud_revoked_token import revoked_token
+from . import crud_stats as stats
+from . import crud_activity as activity
+from . import crud_dashboard as dashboard
+from . import crud_job_match as job_match
@@ -1,46 +1,122 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import Any, Dict, Generic, Iterator, List, Optional, Sequence, Tuple, Type, TypeVar, Union
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
+from sqlalchemy import bindparam, delete, func, insert, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession 
 from sqlalchemy.future import select #for async queries
 from sqlalchemy.orm import selectinload # For eager loading relationships
+from app.core.cache import invalidate_principal
+from app.core.config import settings
+from app.core.pagination import paginate
+from app.database.database import after_commit, save
 
 ModelType = TypeVar("ModelType")
+T = TypeVar("T")
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
+def dialect_insert(db: AsyncSession, table: Any):
+    """
+    INSERT construct of the session's dialect, which supports ON CONFLICT clauses.
+    Postgres is the production database; SQLite is accepted for local runs.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(table)
+    if dialect == "sqlite":
+        return sqlite.insert(table)
+    raise NotImplementedError(f"ON CONFLICT inserts are not supported on {dialect}")
+
+def dialect_string_agg(db: AsyncSession, column: Any, separator: str):
+    """Aggregate concatenating ``column`` with ``separator``: string_agg on Postgres, group_concat elsewhere."""
+    if db.get_bind().dialect.name == "postgresql":
+        return func.string_agg(column, separator)
+    return func.group_concat(column, separator)
+
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """
     CRUD object with default async methods to Create, Read, Update, Delete (CRUD).
     """
+    # (tag, attribute) linking a row to the principals cached by get_current_user,
+    # e.g. ("user", "user_id"). None for models outside the cached user graph.
+    principal_tag: Optional[Tuple[str, str]] = None
+    # Sort key of get_page, ending in a unique column so the order is stable.
+    page_order: Tuple[str, ...] = ("id",)
+    page_descending: bool = False
+
     def __init__(self, model: Type[ModelType]):
         """
         A SQLAlchemy model class.
         """
         self.model = model
+        # Built once per model; get() only binds the id.
+        self._get_statement = select(model).where(model.id == bindparam("id"))
+
+    def _invalidate_principal(self, db: AsyncSession, db_obj: ModelType) -> None:
+        """Drop cached principals whose loaded graph contains ``db_obj`` once ``db`` commits."""
+        if self.principal_tag is not None:
+            tag, attribute = self.principal_tag
+            value = getattr(db_obj, attribute, None)
+            after_commit(db, lambda: invalidate_principal(tag, value))
+
+    def _invalidate_principals(self, db: AsyncSession, values: Sequence[Any]) -> None:
+        """Like ``_invalidate_principal`` for every distinct tag value in ``values``."""
+        if self.principal_tag is not None:
+            tag = self.principal_tag[0]
+            for value in set(values):
+                after_commit(db, lambda value=value: invalidate_principal(tag, value))
+
+    @staticmethod
+    def _chunks(items: Sequence[T], chunk_size: Optional[int]) -> Iterator[Sequence[T]]:
+        size = chunk_size or settings.BULK_CHUNK_SIZE
+        for start in range(0, len(items), size):
+            yield items[start:start + size]
 
     async def get(self, db: AsyncSession, id: Any) -> Optional[ModelType]:
         """Retrieve a single object by ID."""
-        statement = select(self.model).where(self.model.id == id)
-        result = await db.execute(statement)
+        result = await db.execute(self._get_statement, {"id": id})
         return result.scalar_one_or_none()
 
     async def get_multi(
         self, db: AsyncSession, *, skip: int = 0, limit: int = 100
     ) -> List[ModelType]:
-        """Retrieve multiple objects with optional pagination."""
-        statement = select(self.model).offset(skip).limit(limit)
+        """Retrieve multiple objects with optional pagination. Prefer get_page for deep listings."""
+        statement = select(self.model).order_by(self.model.id).offset(skip).limit(limit)
         result = await db.execute(statement)
         return result.scalars().all()
 
-    async def create(self, db: AsyncSession, *, obj_in: CreateSchemaType) -> ModelType:
-        """Create a new object."""
+    async def get_page(
+        self,
+        db: AsyncSession,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        options: Sequence[Any] = ()
+    ) -> Tuple[List[ModelType], Optional[str]]:
+        """
+        Retrieve one page of objects ordered by ``page_order``, starting after ``cursor``.
+        Returns the objects and the cursor of the next page (None on the last page).
+        """
+        return await paginate(
+            db,
+            select(self.model).options(*options),
+            order_by=[getattr(self.model, column) for column in self.page_order],
+            cursor=cursor,
+            limit=limit,
+            descending=self.page_descending
+        )
+
+    async def create(
+        self, db: AsyncSession, *, obj_in: CreateSchemaType, commit: bool = False
+    ) -> ModelType:
+        """Create a new object. It is flushed, and committed only if ``commit`` is True."""
         # Convert Pydantic schema to dictionary, excluding unset fields
         obj_in_data = obj_in.model_dump(exclude_unset=True) 
         db_obj = self.model(**obj_in_data)  # type: ignore
         db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
+        self._invalidate_principal(db, db_obj)
+        await save(db, commit=commit)
         return db_obj
 
     async def update(
@@ -48,9 +124,10 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db: AsyncSession,
         *,
         db_obj: ModelType, # Existing SQLAlchemy object
-        obj_in: Union[UpdateSchemaType, Dict[str, Any]]
+        obj_in: Union[UpdateSchemaType, Dict[str, Any]],
+        commit: bool = False
     ) -> ModelType:
-        """Update an existing object."""
+        """Update an existing object. It is flushed, and committed only if ``commit`` is True."""
         if isinstance(obj_in, dict):
             update_data = obj_in
         else:
@@ -60,19 +137,111 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 setattr(db_obj, field, value)
 
         db.add(db_obj) 
-        await db.commit()
-        await db.refresh(db_obj)
+        self._invalidate_principal(db, db_obj)
+        await save(db, commit=commit)
         return db_obj
 
-    async def remove(self, db: AsyncSession, *, id: int) -> Optional[ModelType]:
-        """Remove an object by ID."""
+    async def remove(
+        self, db: AsyncSession, *, id: int, commit: bool = False
+    ) -> Optional[ModelType]:
+        """Remove an object by ID. The delete is flushed, and committed only if ``commit`` is True."""
         statement = select(self.model).where(self.model.id == id)
         result = await db.execute(statement)
         db_obj = result.scalar_one_or_none()
 
         if db_obj:
             await db.delete(db_obj)
-            await db.commit()
+            self._invalidate_principal(db, db_obj)
+            await save(db, commit=commit)
             return db_obj
         return None
 
+
+    async def create_many(
+        self,
+        db: AsyncSession,
+        *,
+        objs_in: Sequence[Union[CreateSchemaType, Dict[str, Any]]],
+        chunk_size: Optional[int] = None,
+        commit: bool = False
+    ) -> List[ModelType]:
+        """
+        Create many objects with one INSERT ... RETURNING per chunk of ``chunk_size`` rows
+        (default BULK_CHUNK_SIZE). Returns the new objects in input order.
+        """
+        rows = [
+            obj_in if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)
+            for obj_in in objs_in
+        ]
+        created: List[ModelType] = []
+        for chunk in self._chunks(rows, chunk_size):
+            result = await db.scalars(
+                insert(self.model).returning(self.model, sort_by_parameter_order=True), chunk
+            )
+            created.extend(result.all())
+        if self.principal_tag is not None:
+            attribute = self.principal_tag[1]
+            self._invalidate_principals(db, [getattr(db_obj, attribute) for db_obj in created])
+        await save(db, commit=commit)
+        return created
+
+    async def update_many(
+        self,
+        db: AsyncSession,
+        *,
+        values: Sequence[Dict[str, Any]],
+        chunk_size: Optional[int] = None,
+        commit: bool = False
+    ) -> List[int]:
+        """
+        Update many objects by primary key. Each dict in ``values`` holds an ``id`` and the
+        columns to set; rows sharing the same columns are sent as one executemany per chunk.
+        The IDs of each chunk are first locked with SELECT ... FOR UPDATE; IDs that do not
+        exist (e.g. deleted concurrently) are skipped. Returns the IDs updated, in input order.
+        """
+        updated: List[int] = []
+        for chunk in self._chunks(values, chunk_size):
+            result = await db.execute(
+                select(self.model.id).where(self.model.id.in_([row["id"] for row in chunk])).with_for_update()
+            )
+            existing = set(result.scalars().all())
+            rows = [row for row in chunk if row["id"] in existing]
+            if rows:
+                await db.execute(update(self.model), rows)
+                updated.extend(row["id"] for row in rows)
+        if updated and self.principal_tag is not None:
+            attribute = getattr(self.model, self.principal_tag[1])
+            result = await db.execute(select(attribute).where(self.model.id.in_(updated)).distinct())
+            self._invalidate_principals(db, result.scalars().all())
+        await save(db, commit=commit)
+        return updated
+
+    async def remove_many(
+        self,
+        db: AsyncSession,
+        *,
+        ids: Sequence[int],
+        chunk_size: Optional[int] = None,
+        commit: bool = False
+    ) -> List[int]:
+        """
+        Delete many objects by ID with one DELETE ... RETURNING per chunk.
+        Returns the IDs that existed and were deleted. Relationship cascades are left to
+        the database's ON DELETE rules.
+        """
+        deleted: List[int] = []
+        tag_values: List[Any] = []
+        columns = [self.model.id]
+        if self.principal_tag is not None:
+            columns.append(getattr(self.model, self.principal_tag[1]))
+        for chunk in self._chunks(list(ids), chunk_size):
+            result = await db.execute(
+                delete(self.model).where(self.model.id.in_(chunk)).returning(*columns)
+            )
+            for row in result.all():
+                deleted.append(row[0])
+                if self.principal_tag is not None:
+                    tag_values.append(row[1])
+        self._invalidate_principals(db, tag_values)
+        await save(db, commit=commit)
+        return deleted
@@ -0,0 +1,85 @@
+from collections import defaultdict
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+from sqlalchemy import insert, literal
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from app.core.pagination import paginate
+from app.models.activity_event import ActivityEvent, ActivityType
+from app.models.job_application import ApplicationStatus, JobApplication
+from app.models.job_posting import JobPosting
+
+# Events are appended in the transaction of the write they describe and never updated.
+# Application events are built with INSERT ... SELECT, so the recruiter, applicant name
+# and job title are resolved by the database in the same statement.
+
+_EVENT_COLUMNS = ["recruiter_profile_id", "type", "job_posting_id", "job_application_id", "message"]
+
+def _type_literal(activity_type: ActivityType):
+    return literal(activity_type, ActivityEvent.__table__.c.type.type)
+
+async def record_job_postings(db: AsyncSession, job_postings: Sequence[JobPosting]) -> None:
+    """Appends a ``job_posted`` event for each of the given (flushed) job postings."""
+    rows = [
+        {
+            "recruiter_profile_id": db_obj.recruiter_profile_id,
+            "type": ActivityType.job_posted,
+            "job_posting_id": db_obj.id,
+            "message": f"Posted {db_obj.title}",
+        }
+        for db_obj in job_postings
+    ]
+    if rows:
+        await db.execute(insert(ActivityEvent), rows)
+
+def _application_events(activity_type: ActivityType, message, job_application_ids: Sequence[int]):
+    source = (
+        select(
+            JobPosting.recruiter_profile_id,
+            _type_literal(activity_type),
+            JobApplication.job_posting_id,
+            JobApplication.id,
+            message,
+        )
+        .join(JobPosting, JobPosting.id == JobApplication.job_posting_id)
+        .where(JobApplication.id.in_(list(job_application_ids)))
+        .order_by(JobApplication.id)
+    )
+    return insert(ActivityEvent).from_select(_EVENT_COLUMNS, source)
+
+async def record_applications(db: AsyncSession, job_application_ids: Sequence[int]) -> None:
+    """Appends a ``new_application`` event for each of the given applications."""
+    if job_application_ids:
+        await db.execute(_application_events(
+            ActivityType.new_application,
+            JobApplication.full_name + " applied for " + JobPosting.title,
+            job_application_ids,
+        ))
+
+async def record_status_changes(db: AsyncSession, changes: Mapping[int, ApplicationStatus]) -> None:
+    """Appends an ``application_status_changed`` event per application ID in ``changes`` (ID -> new status)."""
+    by_status: Dict[ApplicationStatus, List[int]] = defaultdict(list)
+    for job_application_id, status in changes.items():
+        by_status[ApplicationStatus(status)].append(job_application_id)
+    for status, job_application_ids in by_status.items():
+        await db.execute(_application_events(
+            ActivityType.application_status_changed,
+            JobApplication.full_name + "'s application for " + JobPosting.title + f" is now {status.value}",
+            job_application_ids,
+        ))
+
+async def get_page(
+    db: AsyncSession, *, recruiter_profile_id: int, cursor: Optional[str] = None, limit: int = 20
+) -> Tuple[List[ActivityEvent], Optional[str]]:
+    """
+    One page of a recruiter's activity feed, newest first: a single range scan of
+    ix_activity_events_recruiter_profile_id_created_at.
+    Returns the events and the cursor of the next page.
+    """
+    return await paginate(
+        db,
+        select(ActivityEvent).where(ActivityEvent.recruiter_profile_id == recruiter_profile_id),
+        order_by=[ActivityEvent.created_at, ActivityEvent.id],
+        cursor=cursor,
+        limit=limit,
+        descending=True
+    )
@@ -1,13 +1,28 @@
-from typing import Any, Dict, Optional, Union, List
+from typing import Any, Dict, Optional, Sequence, Union, List
+from sqlalchemy import bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload 
+from app.core.ranking import resume_term_cache
+from app.database.database import after_commit, save
+from app.crud import crud_job_match
 from app.crud.base import CRUDBase
 from app.models.candidate_profile import CandidateProfile 
 from app.schemas.candidate_profile import CandidateProfileCreate, CandidateProfileUpdate 
 
 
+_by_user_id_statement = (
+    select(CandidateProfile)
+    .where(CandidateProfile.user_id == bindparam("user_id"))
+    .options(
+        selectinload(CandidateProfile.experiences),
+        selectinload(CandidateProfile.educations),
+        selectinload(CandidateProfile.candidate_skills)
+    )
+)
+
 class CRUDCandidateProfile(CRUDBase[CandidateProfile, CandidateProfileCreate, CandidateProfileUpdate]):
+    principal_tag = ("user", "user_id")
 
     async def get_by_user_id(
         self, db: AsyncSession, *, user_id: int
@@ -15,44 +30,42 @@ class CRUDCandidateProfile(CRUDBase[CandidateProfile, CandidateProfileCreate, Ca
         """
         Retrieves a candidate profile by user ID, eagerly loading related data.
         """
-        statement = (
-            select(self.model)
-            .where(self.model.user_id == user_id)
-            .options(
-                selectinload(self.model.experiences),
-                selectinload(self.model.educations),
-                selectinload(self.model.candidate_skills)
-            )
-        )
-        result = await db.execute(statement)
+        result = await db.execute(_by_user_id_statement, {"user_id": user_id})
         return result.scalar_one_or_none()
 
     async def create_with_owner(
-        self, db: AsyncSession, *, obj_in: CandidateProfileCreate, user_id: int
+        self, db: AsyncSession, *, obj_in: CandidateProfileCreate, user_id: int, commit: bool = False
     ) -> CandidateProfile:
         """
         Creates a new candidate profile linked to a user.
+        Its collections start out empty and loaded, so they can be read without a query.
         """
         create_data = obj_in.model_dump(exclude_unset=True)
-        db_obj = self.model(**create_data, user_id=user_id)
+        db_obj = self.model(
+            **create_data,
+            user_id=user_id,
+            experiences=[],
+            educations=[],
+            candidate_skills=[]
+        )
         db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
-
-        loaded_db_obj = await self.get_by_user_id(db, user_id=user_id)
-        if not loaded_db_obj:
-            raise Exception("Failed to retrieve newly created profile with relationships.")
-        return loaded_db_obj
+        self._invalidate_principal(db, db_obj)
+        await save(db, commit=commit)
+        return db_obj
 
     async def update(
         self,
         db: AsyncSession,
         *,
         db_obj: CandidateProfile,
-        obj_in: Union[CandidateProfileUpdate, Dict[str, Any]]
+        obj_in: Union[CandidateProfileUpdate, Dict[str, Any]],
+        commit: bool = False
     ) -> CandidateProfile:
         """
         Updates an existing candidate profile.
+        Relationships keep whatever the caller already loaded on ``db_obj``.
+        A new resume text queues a refresh of the candidate's job matches and, once committed,
+        is counted into the resume term cache used by the AI search ranking.
         """
         if isinstance(obj_in, dict):
             update_data = obj_in
@@ -64,14 +77,29 @@ class CRUDCandidateProfile(CRUDBase[CandidateProfile, CandidateProfileCreate, Ca
                 setattr(db_obj, field, value)
 
         db.add(db_obj)
-        await db.commit()
+        self._invalidate_principal(db, db_obj)
+        if "resume_text" in update_data:
+            crud_job_match.schedule_refresh(db, candidate_profile_ids=[db_obj.id])
+            if db_obj.resume_text:
+                profile_id, resume_text = db_obj.id, db_obj.resume_text
+                after_commit(db, lambda: resume_term_cache.put(profile_id, resume_text))
+        await save(db, commit=commit)
+        return db_obj
 
-        await db.refresh(db_obj)
-
-        loaded_db_obj = await self.get_by_user_id(db, user_id=db_obj.user_id)
-        if not loaded_db_obj:
-            raise Exception("Failed to retrieve updated profile with relationships.")
-        return loaded_db_obj
+    async def get_resume_texts(
+        self, db: AsyncSession, *, ids: Sequence[int], chunk_size: Optional[int] = None
+    ) -> Dict[int, Optional[str]]:
+        """
+        Resume text by profile ID, with one ``SELECT id, resume_text ... WHERE id IN`` per chunk.
+        IDs without a profile are left out.
+        """
+        resume_texts: Dict[int, Optional[str]] = {}
+        for chunk in self._chunks(list(ids), chunk_size):
+            result = await db.execute(
+                select(self.model.id, self.model.resume_text).where(self.model.id.in_(chunk))
+            )
+            resume_texts.update(result.all())
+        return resume_texts
 
     # The base CRUDBase provides:
     # async def get(self, db: AsyncSession, id: Any) -> Optional[CandidateProfile]:
@@ -0,0 +1,208 @@
+from typing import Any, Dict, Iterable, Optional, Sequence
+from sqlalchemy import case, func, literal, null, true, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from app.core.config import settings
+from app.core.dashboard_cache import invalidate_recruiter_dashboards
+from app.crud.base import dialect_string_agg
+from app.database.database import after_commit
+from app.models.activity_event import ActivityEvent, ActivityType
+from app.models.candidate_profile import CandidateProfile
+from app.models.experience import Experience
+from app.models.job_application import ApplicationStatus, JobApplication
+from app.models.job_posting import JobPosting
+from app.models.skill import CandidateSkill, Skill, job_posting_skills
+from app.models.stats import JobPostingStatusCount, RecruiterStats
+from app.models.user import User
+from app.schemas.dashboard import RecentActivityItem, RecruiterCandidateMatch
+
+# Skill names never contain newlines (see crud_skill.clean_skill_name).
+_NAME_SEPARATOR = "\n"
+
+def invalidate_after_commit(db: AsyncSession, recruiter_profile_ids: Iterable[Optional[int]]) -> None:
+    """Drop the cached dashboards of the given recruiter profiles once ``db`` commits."""
+    ids = set(recruiter_profile_ids) - {None}
+    if ids:
+        after_commit(db, lambda: invalidate_recruiter_dashboards(ids))
+
+async def invalidate_for_job_postings_after_commit(db: AsyncSession, job_posting_ids: Sequence[int]) -> None:
+    """Like ``invalidate_after_commit`` for the recruiters owning the given job postings."""
+    if not job_posting_ids:
+        return
+    result = await db.execute(
+        select(JobPosting.recruiter_profile_id).distinct().where(JobPosting.id.in_(set(job_posting_ids)))
+    )
+    invalidate_after_commit(db, result.scalars().all())
+
+async def get_recruiter_dashboard(
+    db: AsyncSession, *, recruiter_profile_id: int, top_candidates: int = 5, recent_activity: int = 5
+) -> Dict[str, Any]:
+    """
+    Computes the recruiter dashboard figures with a single CTE-based query:
+    posting and applicant totals and the per-status breakdown (from the crud_stats counters),
+    the number of candidates with an application scoring at least DASHBOARD_MATCH_SCORE_THRESHOLD, the best
+    scored candidates (one entry per candidate) and the latest events of the activity feed.
+
+    An application's score is the percentage of its job posting's skills that the candidate
+    has (postings without skills score 0). It is stored on the application by
+    crud_job_application.refresh_scores, so loading the dashboard does not rescore.
+    """
+    # Every application to the recruiter's postings, with the score stored when it was
+    # submitted or when the candidate's or the posting's skills last changed.
+    scored = (
+        select(
+            JobApplication.id,
+            JobApplication.candidate_profile_id,
+            JobApplication.job_posting_id,
+            JobApplication.applied_at,
+            JobApplication.matched_skills.label("matched"),
+            JobApplication.required_skills.label("required"),
+            JobApplication.match_score.label("score"),
+        )
+        .join(JobPosting, JobPosting.id == JobApplication.job_posting_id)
+        .where(JobPosting.recruiter_profile_id == recruiter_profile_id)
+        .cte("scored")
+    )
+
+    # One row of totals; the breakdown reads the per-posting status counters.
+    stats = select(RecruiterStats).where(RecruiterStats.recruiter_profile_id == recruiter_profile_id).subquery()
+    totals = (
+        select(
+            func.coalesce(select(stats.c.job_postings_count).scalar_subquery(), 0).label("total_jobs"),
+            func.coalesce(select(stats.c.applications_count).scalar_subquery(), 0).label("total_applicants"),
+            select(func.count(func.distinct(scored.c.candidate_profile_id))).select_from(scored).where(
+                scored.c.score >= settings.DASHBOARD_MATCH_SCORE_THRESHOLD
+            ).scalar_subquery().label("total_matched"),
+            *[
+                func.coalesce(func.sum(case((JobPostingStatusCount.status == status, JobPostingStatusCount.count))), 0)
+                .label(f"status_{status.name}")
+                for status in ApplicationStatus
+            ],
+        )
+        .select_from(JobPosting)
+        .outerjoin(JobPostingStatusCount, JobPostingStatusCount.job_posting_id == JobPosting.id)
+        .where(JobPosting.recruiter_profile_id == recruiter_profile_id)
+        .subquery("totals")
+    )
+
+    # The best application of each candidate. A candidate applies to a posting at most once,
+    # so the best top_candidates candidates all show up within the first
+    # top_candidates * (number of postings) applications in score order: only those are ranked.
+    score_order = (scored.c.score.desc(), scored.c.applied_at.desc(), scored.c.id.desc())
+    postings_count = (
+        select(func.count())
+        .select_from(JobPosting)
+        .where(JobPosting.recruiter_profile_id == recruiter_profile_id)
+        .scalar_subquery()
+    )
+    leading = select(scored).order_by(*score_order).limit(postings_count * top_candidates).subquery("leading")
+    best = select(
+        leading,
+        func.row_number().over(
+            partition_by=leading.c.candidate_profile_id,
+            order_by=(leading.c.score.desc(), leading.c.applied_at.desc(), leading.c.id.desc())
+        ).label("candidate_rank"),
+    ).subquery("best")
+    top = (
+        select(best.c.id, best.c.candidate_profile_id, best.c.job_posting_id, best.c.applied_at,
+               best.c.matched, best.c.required, best.c.score)
+        .where(best.c.candidate_rank == 1)
+        .order_by(best.c.score.desc(), best.c.applied_at.desc(), best.c.id.desc())
+        .limit(top_candidates)
+        .subquery("top")
+    )
+    # The latest events of the activity feed (see crud_activity).
+    recent = (
+        select(ActivityEvent.id, ActivityEvent.type, ActivityEvent.message, ActivityEvent.created_at)
+        .where(ActivityEvent.recruiter_profile_id == recruiter_profile_id)
+        .order_by(ActivityEvent.created_at.desc(), ActivityEvent.id.desc())
+        .limit(recent_activity)
+        .subquery("recent")
+    )
+
+    matched_skills = (
+        select(dialect_string_agg(db, Skill.name, _NAME_SEPARATOR))
+        .select_from(job_posting_skills)
+        .join(Skill, Skill.id == job_posting_skills.c.skill_id)
+        .join(CandidateSkill, CandidateSkill.skill_id == job_posting_skills.c.skill_id)
+        .where(job_posting_skills.c.job_posting_id == top.c.job_posting_id)
+        .where(CandidateSkill.candidate_profile_id == top.c.candidate_profile_id)
+        .scalar_subquery()
+    )
+    latest_title = (
+        select(Experience.title)
+        .where(Experience.candidate_profile_id == top.c.candidate_profile_id)
+        .order_by(Experience.start_date.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    top_entries = (
+        select(
+            literal("top").label("kind"),
+            top.c.id,
+            top.c.applied_at.label("occurred_at"),
+            top.c.candidate_profile_id,
+            top.c.matched,
+            top.c.required,
+            top.c.score,
+            User.first_name,
+            User.last_name,
+            User.email,
+            CandidateProfile.location,
+            JobPosting.title.label("job_title"),
+            latest_title.label("latest_title"),
+            matched_skills.label("matched_skills"),
+            null().label("event_type"),
+            null().label("message"),
+        )
+        .select_from(top)
+        .join(CandidateProfile, CandidateProfile.id == top.c.candidate_profile_id)
+        .join(User, User.id == CandidateProfile.user_id)
+        .join(JobPosting, JobPosting.id == top.c.job_posting_id)
+    )
+    recent_entries = select(
+        literal("recent"), recent.c.id, recent.c.created_at,
+        *[null()] * 11,
+        recent.c.type, recent.c.message,
+    )
+
+    listed = union_all(top_entries, recent_entries).subquery("listed")
+    statement = select(totals, listed).select_from(totals.outerjoin(listed, true()))
+    rows = (await db.execute(statement)).all()
+
+    first = rows[0]
+    dashboard: Dict[str, Any] = {
+        "total_active_jobs": first.total_jobs,
+        "total_applicants": first.total_applicants,
+        "total_ai_matched_candidates": first.total_matched,
+        "applicants_by_status": {status.value: getattr(first, f"status_{status.name}") for status in ApplicationStatus},
+        "top_candidate_matches": [],
+        "recent_activity": [],
+    }
+    top_rows = sorted(
+        (row for row in rows if row.kind == "top"),
+        key=lambda row: (row.score, row.occurred_at, row.id), reverse=True
+    )
+    recent_rows = sorted(
+        (row for row in rows if row.kind == "recent"),
+        key=lambda row: (row.occurred_at, row.id), reverse=True
+    )
+    for row in top_rows:
+        name = f"{row.first_name or ''} {row.last_name or ''}".strip() or row.email
+        dashboard["top_candidate_matches"].append(RecruiterCandidateMatch(
+            id=row.candidate_profile_id,
+            name=name,
+            title=row.latest_title or row.job_title,
+            location=row.location,
+            skills=sorted(row.matched_skills.split(_NAME_SEPARATOR)) if row.matched_skills else [],
+            match_reasons=[f"Has {row.matched} of {row.required} skills required for {row.job_title}"] if row.required else [],
+            match_score=row.score,
+        ))
+    for row in recent_rows:
+        dashboard["recent_activity"].append(RecentActivityItem(
+            id=row.id,
+            type=ActivityType(row.event_type).value,
+            message=row.message,
+            timestamp=row.occurred_at.isoformat(),
+        ))
+    return dashboard
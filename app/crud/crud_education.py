@@ -1,11 +1,13 @@
 from typing import Any, Dict, Optional, Union, List
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from app.database.database import save
 from app.crud.base import CRUDBase 
 from app.models.education import Education 
 from app.schemas.education import EducationCreate, EducationUpdate 
 
 class CRUDEducation(CRUDBase[Education, EducationCreate, EducationUpdate]):
+    principal_tag = ("candidate_profile", "candidate_profile_id")
 
     async def get_by_candidate_profile_id(
         self, db: AsyncSession, *, candidate_profile_id: int, skip: int = 0, limit: int = 100
@@ -25,7 +27,7 @@ class CRUDEducation(CRUDBase[Education, EducationCreate, EducationUpdate]):
         return result.scalars().all()
 
     async def create_with_profile(
-        self, db: AsyncSession, *, obj_in: EducationCreate, candidate_profile_id: int
+        self, db: AsyncSession, *, obj_in: EducationCreate, candidate_profile_id: int, commit: bool = False
     ) -> Education:
         """
         Crée une nouvelle entrée d'éducation liée à un profil candidat.
@@ -35,8 +37,8 @@ class CRUDEducation(CRUDBase[Education, EducationCreate, EducationUpdate]):
         db_obj = self.model(**obj_in_data, candidate_profile_id=candidate_profile_id) 
 
         db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
+        self._invalidate_principal(db, db_obj)
+        await save(db, commit=commit)
         return db_obj
 
 education = CRUDEducation(Education)
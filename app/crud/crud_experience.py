@@ -1,11 +1,13 @@
 from typing import Any, Dict, Optional, Union, List
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from app.database.database import save
 from app.crud.base import CRUDBase 
 from app.models.experience import Experience 
 from app.schemas.experience import ExperienceCreate, ExperienceUpdate 
 
 class CRUDExperience(CRUDBase[Experience, ExperienceCreate, ExperienceUpdate]):
+    principal_tag = ("candidate_profile", "candidate_profile_id")
 
     async def get_by_candidate_profile_id(
         self, db: AsyncSession, *, candidate_profile_id: int, skip: int = 0, limit: int = 100
@@ -24,7 +26,7 @@ class CRUDExperience(CRUDBase[Experience, ExperienceCreate, ExperienceUpdate]):
         return result.scalars().all()
 
     async def create_with_profile(
-        self, db: AsyncSession, *, obj_in: ExperienceCreate, candidate_profile_id: int
+        self, db: AsyncSession, *, obj_in: ExperienceCreate, candidate_profile_id: int, commit: bool = False
     ) -> Experience:
         """
         Crée une nouvelle entrée d'expérience liée à un profil candidat.
@@ -34,8 +36,8 @@ class CRUDExperience(CRUDBase[Experience, ExperienceCreate, ExperienceUpdate]):
         db_obj = self.model(**obj_in_data, candidate_profile_id=candidate_profile_id) 
 
         db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
+        self._invalidate_principal(db, db_obj)
+        await save(db, commit=commit)
         return db_obj
 
 experience = CRUDExperience(Experience)
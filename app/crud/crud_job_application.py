@@ -1,69 +1,282 @@
+from collections import Counter
+from sqlalchemy import case, delete, func, or_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from typing import List, Optional
-from app.crud.base import CRUDBase
-from app.models.job_application import JobApplication
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from app.database.database import save
+from app.crud import crud_activity, crud_dashboard, crud_stats
+from app.core.pagination import paginate
+from app.crud.base import CRUDBase, dialect_insert
+from app.models.job_application import ApplicationStatus, JobApplication
+from app.models.job_posting import JobPosting
+from app.models.skill import CandidateSkill, job_posting_skills
 from app.schemas.job_application import JobApplicationCreate, JobApplicationUpdate
 
+def _score_values() -> Dict[str, Any]:
+    """The stored score columns of an application, as subqueries correlated with the updated row."""
+    required = (
+        select(func.count())
+        .select_from(job_posting_skills)
+        .where(job_posting_skills.c.job_posting_id == JobApplication.job_posting_id)
+        .scalar_subquery()
+    )
+    matched = (
+        select(func.count(func.distinct(job_posting_skills.c.skill_id)))
+        .select_from(job_posting_skills)
+        .join(CandidateSkill, CandidateSkill.skill_id == job_posting_skills.c.skill_id)
+        .where(job_posting_skills.c.job_posting_id == JobApplication.job_posting_id)
+        .where(CandidateSkill.candidate_profile_id == JobApplication.candidate_profile_id)
+        .scalar_subquery()
+    )
+    return {
+        "matched_skills": matched,
+        "required_skills": required,
+        "match_score": case((required > 0, matched * 100 // required), else_=0),
+    }
+
+async def refresh_scores(
+    db: AsyncSession,
+    *,
+    application_ids: Iterable[int] = (),
+    candidate_profile_ids: Iterable[int] = (),
+    job_posting_ids: Iterable[int] = ()
+) -> None:
+    """
+    Recomputes, with one UPDATE, the stored scores of the given applications and of every
+    application of the given candidates and job postings. Called in the transaction that
+    submits an application or changes a candidate's or a posting's skills, so the recruiter
+    dashboard reads scores instead of computing them. Loaded objects are not refreshed.
+    """
+    conditions = [
+        column.in_(ids)
+        for column, ids in (
+            (JobApplication.id, sorted(set(application_ids) - {None})),
+            (JobApplication.candidate_profile_id, sorted(set(candidate_profile_ids) - {None})),
+            (JobApplication.job_posting_id, sorted(set(job_posting_ids) - {None})),
+        )
+        if ids
+    ]
+    if conditions:
+        await db.execute(
+            update(JobApplication)
+            .where(or_(*conditions))
+            .values(**_score_values())
+            .execution_options(synchronize_session=False)
+        )
+
 class CRUDJobApplication(CRUDBase[JobApplication, JobApplicationCreate, JobApplicationUpdate]):
     """
     CRUD operations for JobApplication model.
+    Submissions store the application's match score (see refresh_scores).
+    Writes keep the application counters of crud_stats and the activity feed of
+    crud_activity in step, in the same transaction, and drop the affected cached
+    recruiter dashboards once it commits.
     """
+    page_order = ("applied_at", "id")
+    page_descending = True
+
     async def create_with_candidate(
         self, 
         db: AsyncSession, 
         *, 
         obj_in: JobApplicationCreate, 
-        candidate_profile_id: int
-    ) -> JobApplication:
+        candidate_profile_id: int,
+        commit: bool = False
+    ) -> Optional[JobApplication]:
         """
         Create a new job application and associate it with a candidate profile.
+        Uses a single INSERT ... ON CONFLICT DO NOTHING RETURNING, so concurrent double
+        submissions cannot both succeed. Returns None if the candidate already applied.
         """
-        db_obj_data = obj_in.model_dump()
-        db_obj = self.model(**db_obj_data, candidate_profile_id=candidate_profile_id)
-        
-        db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
+        statement = (
+            dialect_insert(db, self.model)
+            .values(**obj_in.model_dump(), candidate_profile_id=candidate_profile_id)
+            .on_conflict_do_nothing(index_elements=["job_posting_id", "candidate_profile_id"])
+            .returning(self.model)
+        )
+        result = await db.scalars(statement)
+        db_obj = result.one_or_none()
+        if db_obj is not None:
+            await refresh_scores(db, application_ids=[db_obj.id])
+            await crud_stats.add_status_counts(db, {(db_obj.job_posting_id, db_obj.status): 1})
+            await crud_stats.add_recruiter_applications_by_posting(db, {db_obj.job_posting_id: 1})
+            await crud_activity.record_applications(db, [db_obj.id])
+            await crud_dashboard.invalidate_for_job_postings_after_commit(db, [db_obj.job_posting_id])
+        await save(db, commit=commit)
         return db_obj
 
+    async def update(
+        self,
+        db: AsyncSession,
+        *,
+        db_obj: JobApplication,
+        obj_in: Union[JobApplicationUpdate, Dict[str, Any]],
+        commit: bool = False
+    ) -> JobApplication:
+        """
+        Update an application, moving it between the status counters if its status changes.
+        The previous status is re-read with FOR UPDATE, like update_many, so a change committed
+        since ``db_obj`` was loaded cannot skew the counters.
+        """
+        update_data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)
+        if "status" in update_data:
+            await db.refresh(db_obj, attribute_names=["status"], with_for_update=True)
+        previous_status = db_obj.status
+        db_obj = await super().update(db, db_obj=db_obj, obj_in=obj_in)
+        if db_obj.status != previous_status:
+            await crud_stats.add_status_counts(
+                db, {(db_obj.job_posting_id, previous_status): -1, (db_obj.job_posting_id, db_obj.status): 1}
+            )
+            await crud_activity.record_status_changes(db, {db_obj.id: db_obj.status})
+            await crud_dashboard.invalidate_for_job_postings_after_commit(db, [db_obj.job_posting_id])
+        await save(db, commit=commit)
+        return db_obj
+
+    async def update_many(
+        self,
+        db: AsyncSession,
+        *,
+        values: Sequence[Dict[str, Any]],
+        chunk_size: Optional[int] = None,
+        commit: bool = False
+    ) -> List[int]:
+        """
+        Update many applications by ID. Status changes are applied to the status counters;
+        the previous statuses are read with FOR UPDATE so concurrent changes cannot skew them.
+        Returns the IDs updated; IDs that no longer exist are skipped.
+        """
+        status_rows = [row for row in values if "status" in row]
+        previous: Dict[int, Tuple[int, ApplicationStatus]] = {}
+        if status_rows:
+            result = await db.execute(
+                select(self.model.id, self.model.job_posting_id, self.model.status)
+                .where(self.model.id.in_([row["id"] for row in status_rows]))
+                .with_for_update()
+            )
+            previous = {row.id: (row.job_posting_id, row.status) for row in result.all()}
+        updated = await super().update_many(db, values=values, chunk_size=chunk_size)
+
+        deltas: Counter = Counter()
+        changed: Dict[int, ApplicationStatus] = {}
+        for row in status_rows:
+            if row["id"] not in previous:
+                continue
+            job_posting_id, previous_status = previous[row["id"]]
+            new_status = ApplicationStatus(row["status"])
+            if new_status != previous_status:
+                deltas[(job_posting_id, previous_status)] -= 1
+                deltas[(job_posting_id, new_status)] += 1
+                previous[row["id"]] = (job_posting_id, new_status)
+                changed[row["id"]] = new_status
+        await crud_stats.add_status_counts(db, deltas)
+        await crud_activity.record_status_changes(db, changed)
+        await crud_dashboard.invalidate_for_job_postings_after_commit(
+            db, [job_posting_id for (job_posting_id, _), delta in deltas.items() if delta]
+        )
+        await save(db, commit=commit)
+        return updated
+
+    async def remove(
+        self, db: AsyncSession, *, id: int, commit: bool = False
+    ) -> Optional[JobApplication]:
+        """
+        Remove an application by ID and take it off the counters.
+        """
+        db_obj = await super().remove(db, id=id)
+        if db_obj is not None:
+            await crud_stats.add_status_counts(db, {(db_obj.job_posting_id, db_obj.status): -1})
+            await crud_stats.add_recruiter_applications_by_posting(db, {db_obj.job_posting_id: -1})
+            await crud_dashboard.invalidate_for_job_postings_after_commit(db, [db_obj.job_posting_id])
+        await save(db, commit=commit)
+        return db_obj
+
+    async def remove_many(
+        self,
+        db: AsyncSession,
+        *,
+        ids: Sequence[int],
+        chunk_size: Optional[int] = None,
+        commit: bool = False
+    ) -> List[int]:
+        """
+        Delete many applications by ID with one DELETE ... RETURNING per chunk and take them
+        off the counters. Returns the IDs that existed and were deleted.
+        """
+        deleted: List[int] = []
+        status_deltas: Counter = Counter()
+        posting_deltas: Counter = Counter()
+        for chunk in self._chunks(list(ids), chunk_size):
+            result = await db.execute(
+                delete(self.model)
+                .where(self.model.id.in_(chunk))
+                .returning(self.model.id, self.model.job_posting_id, self.model.status)
+            )
+            for row in result.all():
+                deleted.append(row.id)
+                status_deltas[(row.job_posting_id, row.status)] -= 1
+                posting_deltas[row.job_posting_id] -= 1
+        await crud_stats.add_status_counts(db, status_deltas)
+        await crud_stats.add_recruiter_applications_by_posting(db, posting_deltas)
+        await crud_dashboard.invalidate_for_job_postings_after_commit(db, list(posting_deltas))
+        await save(db, commit=commit)
+        return deleted
+
+    async def get_recruiter_profile_ids(
+        self, db: AsyncSession, *, ids: Sequence[int]
+    ) -> Dict[int, int]:
+        """
+        Maps each existing application ID in ``ids`` to the recruiter profile owning its job posting.
+        """
+        if not ids:
+            return {}
+        result = await db.execute(
+            select(self.model.id, JobPosting.recruiter_profile_id)
+            .join(JobPosting, JobPosting.id == self.model.job_posting_id)
+            .where(self.model.id.in_(ids))
+        )
+        return {row.id: row.recruiter_profile_id for row in result.all()}
+
     async def get_multi_by_job_posting(
         self, 
         db: AsyncSession, 
         *, 
         job_posting_id: int, 
-        skip: int = 0, 
+        cursor: Optional[str] = None, 
         limit: int = 100
-    ) -> List[JobApplication]:
+    ) -> Tuple[List[JobApplication], Optional[str]]:
         """
-        Retrieve all applications for a specific job posting.
+        Retrieve one page of applications for a specific job posting, newest first.
+        Returns the applications and the cursor of the next page.
         """
-        result = await db.execute(
-            select(self.model)
-            .where(JobApplication.job_posting_id == job_posting_id)
-            .offset(skip)
-            .limit(limit)
+        return await paginate(
+            db,
+            select(self.model).where(JobApplication.job_posting_id == job_posting_id),
+            order_by=[self.model.applied_at, self.model.id],
+            cursor=cursor,
+            limit=limit,
+            descending=True
         )
-        return result.scalars().all()
 
     async def get_multi_by_candidate(
         self, 
         db: AsyncSession, 
         *, 
         candidate_profile_id: int, 
-        skip: int = 0, 
+        cursor: Optional[str] = None, 
         limit: int = 100
-    ) -> List[JobApplication]:
+    ) -> Tuple[List[JobApplication], Optional[str]]:
         """
-        Retrieve all applications submitted by a specific candidate.
+        Retrieve one page of applications submitted by a specific candidate, newest first.
+        Returns the applications and the cursor of the next page.
         """
-        result = await db.execute(
-            select(self.model)
-            .where(JobApplication.candidate_profile_id == candidate_profile_id)
-            .offset(skip)
-            .limit(limit)
+        return await paginate(
+            db,
+            select(self.model).where(JobApplication.candidate_profile_id == candidate_profile_id),
+            order_by=[self.model.applied_at, self.model.id],
+            cursor=cursor,
+            limit=limit,
+            descending=True
         )
-        return result.scalars().all()
 
 job_application = CRUDJobApplication(JobApplication)
 
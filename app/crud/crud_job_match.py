@@ -0,0 +1,312 @@
+import asyncio
+import re
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+from sqlalchemy import case, delete, func, insert, or_, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from app.core.config import settings
+from app.crud.base import dialect_string_agg
+from app.database.database import after_commit
+from app.models.candidate_profile import CandidateProfile
+from app.models.job_application import ApplicationStatus, JobApplication
+from app.models.job_match import JobMatch
+from app.models.job_posting import JobPosting
+from app.models.recruiter_profile import RecruiterProfile
+from app.models.skill import CandidateSkill, Skill, job_posting_skills
+from app.schemas.dashboard import CandidateJobMatch
+
+# A candidate's rankings depend on their skills, the skills named in their resume and the
+# skills of every job posting. Writes to any of these queue the affected candidates or
+# postings once their transaction commits; the worker started in main.py drains the queue
+# in its own session (refresh_pending). Queued work is per process and is lost on restart;
+# POST /admin/maintenance/refresh-job-matches recomputes everyone.
+
+_pending_candidates: Set[int] = set()
+_pending_job_postings: Set[int] = set()
+_pending_event = asyncio.Event()
+
+_SKILL_NAME_SEPARATOR = "\n"
+_RESUME_PHRASE_WORDS = 3
+_LOOKUP_CHUNK_SIZE = 500
+# Whitespace-separated words without leading or trailing punctuation ("(c++)," -> "c++").
+_RESUME_WORD = re.compile(r"[^\s\w+#]*([\w+#](?:\S*[\w+#])?)[^\s\w+#]*")
+
+def _enqueue(candidate_profile_ids: Set[int], job_posting_ids: Set[int]) -> None:
+    _pending_candidates.update(candidate_profile_ids)
+    _pending_job_postings.update(job_posting_ids)
+    _pending_event.set()
+
+def schedule_refresh(
+    db: AsyncSession, *, candidate_profile_ids: Iterable[int] = (), job_posting_ids: Iterable[int] = ()
+) -> None:
+    """Queues the rankings of the given candidates, and of the candidates the given postings may match, once ``db`` commits."""
+    candidate_profile_ids = set(candidate_profile_ids) - {None}
+    job_posting_ids = set(job_posting_ids) - {None}
+    if candidate_profile_ids or job_posting_ids:
+        after_commit(db, lambda: _enqueue(candidate_profile_ids, job_posting_ids))
+
+async def wait_for_pending() -> None:
+    """Returns once refresh work has been queued."""
+    await _pending_event.wait()
+    _pending_event.clear()
+
+async def get_matched_candidate_ids(db: AsyncSession, *, job_posting_ids: Sequence[int]) -> List[int]:
+    """IDs of the candidates currently ranked against any of the given job postings."""
+    if not job_posting_ids:
+        return []
+    result = await db.execute(
+        select(JobMatch.candidate_profile_id).distinct().where(JobMatch.job_posting_id.in_(list(job_posting_ids)))
+    )
+    return list(result.scalars().all())
+
+def _chunks(values: Sequence[Any]) -> Iterable[Sequence[Any]]:
+    for start in range(0, len(values), _LOOKUP_CHUNK_SIZE):
+        yield values[start:start + _LOOKUP_CHUNK_SIZE]
+
+async def _skill_dictionary(db: AsyncSession) -> Tuple[Dict[str, int], Dict[str, List[int]]]:
+    """
+    Skill ID by normalized name, for the names of up to _RESUME_PHRASE_WORDS words, and the word
+    counts of those names by first word. Loaded with a single query.
+    """
+    skill_by_name: Dict[str, int] = {}
+    lengths_by_first_word: Dict[str, Set[int]] = {}
+    result = await db.execute(select(Skill.normalized_name, Skill.id))
+    for name, skill_id in result.all():
+        length = name.count(" ") + 1
+        if length <= _RESUME_PHRASE_WORDS:
+            skill_by_name[name] = skill_id
+            lengths_by_first_word.setdefault(name.split(" ", 1)[0], set()).add(length)
+    return skill_by_name, {word: sorted(lengths) for word, lengths in lengths_by_first_word.items()}
+
+def _resume_skill_ids(
+    text: str, skill_by_name: Dict[str, int], lengths_by_first_word: Dict[str, List[int]]
+) -> Set[int]:
+    """IDs of the skills ``text`` names: runs of up to _RESUME_PHRASE_WORDS words, normalized like skill names."""
+    words = _RESUME_WORD.findall(text.casefold())
+    found: Set[int] = set()
+    for start, word in enumerate(words):
+        for length in lengths_by_first_word.get(word, ()):
+            if start + length <= len(words):
+                skill_id = skill_by_name.get(" ".join(words[start:start + length]))
+                if skill_id is not None:
+                    found.add(skill_id)
+    return found
+
+async def get_candidate_skill_ids(
+    db: AsyncSession,
+    candidate_profile_ids: Sequence[int],
+    *,
+    resume_texts: Optional[Mapping[int, Optional[str]]] = None,
+) -> Dict[int, Set[int]]:
+    """
+    Skill dictionary IDs per candidate: their listed skills plus the skills their resume names.
+    Resumes are matched in memory against the skill dictionary; pass ``resume_texts`` when the
+    caller has already loaded them.
+    """
+    skill_ids: Dict[int, Set[int]] = {candidate_profile_id: set() for candidate_profile_id in candidate_profile_ids}
+    texts: Dict[int, Optional[str]] = dict(resume_texts) if resume_texts is not None else {}
+    for chunk in _chunks(list(candidate_profile_ids)):
+        result = await db.execute(
+            select(CandidateSkill.candidate_profile_id, CandidateSkill.skill_id)
+            .where(CandidateSkill.candidate_profile_id.in_(chunk))
+            .where(CandidateSkill.skill_id.isnot(None))
+        )
+        for candidate_profile_id, skill_id in result.all():
+            skill_ids[candidate_profile_id].add(skill_id)
+
+        if resume_texts is None:
+            result = await db.execute(
+                select(CandidateProfile.id, CandidateProfile.resume_text)
+                .where(CandidateProfile.id.in_(chunk))
+                .where(CandidateProfile.resume_text.isnot(None))
+            )
+            texts.update(result.all())
+    skill_by_name, lengths_by_first_word = await _skill_dictionary(db)
+    for candidate_profile_id in skill_ids:
+        text = texts.get(candidate_profile_id)
+        if text:
+            skill_ids[candidate_profile_id].update(_resume_skill_ids(text, skill_by_name, lengths_by_first_word))
+    return skill_ids
+
+def _ranking_statement(skill_ids: Set[int], limit: int):
+    """Best job postings for a set of skills: score is the percentage of a posting's skills covered."""
+    matched = (
+        select(job_posting_skills.c.job_posting_id, func.count().label("matched"))
+        .where(job_posting_skills.c.skill_id.in_(sorted(skill_ids)))
+        .group_by(job_posting_skills.c.job_posting_id)
+        .subquery("matched")
+    )
+    required = (
+        select(job_posting_skills.c.job_posting_id, func.count().label("required"))
+        .where(job_posting_skills.c.job_posting_id.in_(select(matched.c.job_posting_id)))
+        .group_by(job_posting_skills.c.job_posting_id)
+        .subquery("required")
+    )
+    score = matched.c.matched * 100 // required.c.required
+    return (
+        select(matched.c.job_posting_id, matched.c.matched, required.c.required, score.label("score"))
+        .join(required, required.c.job_posting_id == matched.c.job_posting_id)
+        .order_by(score.desc(), matched.c.job_posting_id.desc())
+        .limit(limit)
+    )
+
+async def refresh_candidates(db: AsyncSession, *, candidate_profile_ids: Sequence[int]) -> int:
+    """Recomputes and replaces the stored rankings of the given candidates. Returns the number of rows written."""
+    written = 0
+    for chunk in _chunks(sorted(set(candidate_profile_ids))):
+        skill_ids = await get_candidate_skill_ids(db, chunk)
+        rows = []
+        for candidate_profile_id, candidate_skill_ids in skill_ids.items():
+            if not candidate_skill_ids:
+                continue
+            result = await db.execute(_ranking_statement(candidate_skill_ids, settings.CANDIDATE_MATCHES_TOP_K))
+            rows.extend(
+                {
+                    "candidate_profile_id": candidate_profile_id,
+                    "job_posting_id": row.job_posting_id,
+                    "score": row.score,
+                    "matched_skills": row.matched,
+                    "required_skills": row.required,
+                }
+                for row in result.all()
+            )
+        await db.execute(delete(JobMatch).where(JobMatch.candidate_profile_id.in_(list(skill_ids))))
+        if rows:
+            await db.execute(insert(JobMatch), rows)
+        written += len(rows)
+    return written
+
+async def _candidates_for_job_postings(db: AsyncSession, job_posting_ids: Sequence[int]) -> Set[int]:
+    """Candidates whose ranking the given postings may enter or leave."""
+    candidate_profile_ids = set(await get_matched_candidate_ids(db, job_posting_ids=job_posting_ids))
+    result = await db.execute(
+        select(Skill.id, Skill.normalized_name)
+        .join(job_posting_skills, job_posting_skills.c.skill_id == Skill.id)
+        .where(job_posting_skills.c.job_posting_id.in_(list(job_posting_ids)))
+    )
+    skills = dict(result.all())
+    if skills:
+        result = await db.execute(
+            select(CandidateSkill.candidate_profile_id).distinct()
+            .where(CandidateSkill.skill_id.in_(list(skills)))
+        )
+        candidate_profile_ids.update(result.scalars().all())
+        # Resumes are free text, so this is a scan; refresh_candidates checks word boundaries.
+        result = await db.execute(
+            select(CandidateProfile.id).where(or_(*[
+                func.lower(CandidateProfile.resume_text).contains(name, autoescape=True)
+                for name in set(skills.values())
+            ]))
+        )
+        candidate_profile_ids.update(result.scalars().all())
+    return candidate_profile_ids
+
+async def refresh_pending(db: AsyncSession) -> Dict[str, int]:
+    """
+    Refreshes the rankings queued by schedule_refresh. The caller commits.
+    If it fails, the work is queued again.
+    """
+    candidate_profile_ids = set(_pending_candidates)
+    job_posting_ids = set(_pending_job_postings)
+    _pending_candidates.clear()
+    _pending_job_postings.clear()
+    try:
+        if job_posting_ids:
+            candidate_profile_ids |= await _candidates_for_job_postings(db, sorted(job_posting_ids))
+        written = await refresh_candidates(db, candidate_profile_ids=sorted(candidate_profile_ids))
+    except Exception:
+        _enqueue(candidate_profile_ids, job_posting_ids)
+        raise
+    return {"candidates": len(candidate_profile_ids), "matches": written}
+
+async def schedule_all(db: AsyncSession) -> int:
+    """Queues every candidate for a refresh. Returns how many were queued."""
+    result = await db.execute(select(CandidateProfile.id))
+    candidate_profile_ids = set(result.scalars().all())
+    _enqueue(candidate_profile_ids, set())
+    return len(candidate_profile_ids)
+
+async def get_candidate_dashboard(
+    db: AsyncSession, *, candidate_profile_id: int, top_matches: int = 5
+) -> Dict[str, Any]:
+    """
+    Reads the candidate dashboard with a single statement: the application counts per
+    status, whether a resume was uploaded, and the best stored job matches (an index
+    range scan of ix_candidate_job_matches_candidate_profile_id_score).
+    """
+    totals = (
+        select(
+            func.count(JobApplication.id).label("total_applications"),
+            *[
+                func.coalesce(func.sum(case((JobApplication.status == status, 1))), 0).label(f"status_{status.name}")
+                for status in ApplicationStatus
+            ],
+            select(CandidateProfile.resume_text.isnot(None))
+            .where(CandidateProfile.id == candidate_profile_id)
+            .scalar_subquery()
+            .label("has_resume"),
+        )
+        .where(JobApplication.candidate_profile_id == candidate_profile_id)
+        .subquery("totals")
+    )
+    top = (
+        select(JobMatch)
+        .where(JobMatch.candidate_profile_id == candidate_profile_id)
+        .order_by(JobMatch.score.desc(), JobMatch.job_posting_id.desc())
+        .limit(top_matches)
+        .subquery("top")
+    )
+    skill_names = (
+        select(dialect_string_agg(db, Skill.name, _SKILL_NAME_SEPARATOR))
+        .select_from(job_posting_skills)
+        .join(Skill, Skill.id == job_posting_skills.c.skill_id)
+        .where(job_posting_skills.c.job_posting_id == top.c.job_posting_id)
+        .scalar_subquery()
+    )
+    listed = (
+        select(
+            top.c.job_posting_id,
+            top.c.score,
+            top.c.matched_skills,
+            top.c.required_skills,
+            JobPosting.title,
+            JobPosting.location,
+            JobPosting.salary_range,
+            JobPosting.created_at,
+            RecruiterProfile.company_name,
+            skill_names.label("skill_names"),
+        )
+        .select_from(top)
+        .join(JobPosting, JobPosting.id == top.c.job_posting_id)
+        .join(RecruiterProfile, RecruiterProfile.id == JobPosting.recruiter_profile_id)
+        .subquery("listed")
+    )
+    statement = select(totals, listed).select_from(totals.outerjoin(listed, true()))
+    rows = (await db.execute(statement)).all()
+
+    first = rows[0]
+    matches = sorted(
+        (row for row in rows if row.job_posting_id is not None),
+        key=lambda row: (row.score, row.job_posting_id), reverse=True
+    )
+    return {
+        "total_applications": first.total_applications,
+        "applications_by_status": {
+            status.value: getattr(first, f"status_{status.name}") for status in ApplicationStatus
+        },
+        "has_resume": bool(first.has_resume),
+        "top_job_matches": [
+            CandidateJobMatch(
+                id=row.job_posting_id,
+                title=row.title,
+                company=row.company_name,
+                location=row.location,
+                posted_date=row.created_at.date().isoformat() if row.created_at else "",
+                salary=row.salary_range,
+                skills=sorted(row.skill_names.split(_SKILL_NAME_SEPARATOR)) if row.skill_names else [],
+                match_reasons=[f"You have {row.matched_skills} of the {row.required_skills} required skills"],
+                match_score=row.score,
+            )
+            for row in matches
+        ],
+    }
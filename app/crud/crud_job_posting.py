@@ -1,63 +1,261 @@
-from typing import Any, Dict, Optional, Union, List
+import re
+from typing import Any, Dict, Optional, Sequence, Tuple, Union, List
+from sqlalchemy import Float, delete, func, insert, literal_column, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm.attributes import set_committed_value
+from app.database.database import save
+from app.core.pagination import decode_cursor, encode_cursor, paginate
+from app.crud import crud_activity, crud_dashboard, crud_job_application, crud_job_match, crud_stats
 from app.crud.base import CRUDBase 
-from app.models.job_posting import JobPosting 
+from app.crud.crud_skill import normalize_skill_name, skill as crud_skill
+from app.models.job_posting import ExperienceLevel, JobPosting, JobType
+from app.models.skill import Skill, job_posting_skills
 from app.schemas.job_posting import JobPostingCreate, JobPostingUpdate 
 
-def skills_list_to_string(skills: List[str]) -> str:
-    """Converts a list of skill strings into a single string for storage."""
-    return ", ".join(skill.strip() for skill in skills if skill.strip()) 
+def _skills_filter(skills: Sequence[str]):
+    """IDs of the job postings requiring every skill in ``skills``, resolved through the skill indexes."""
+    keys = {normalize_skill_name(name) for name in skills} - {""}
+    return (
+        select(job_posting_skills.c.job_posting_id)
+        .join(Skill, Skill.id == job_posting_skills.c.skill_id)
+        .where(Skill.normalized_name.in_(keys))
+        .group_by(job_posting_skills.c.job_posting_id)
+        .having(func.count() == len(keys))
+    )
 
-def skills_string_to_list(skills_string: Optional[str]) -> List[str]:
-    """Converts a string of skills (e.g., comma-separated) back into a list."""
-    if not skills_string:
-        return []
-    return [skill.strip() for skill in skills_string.split(',') if skill.strip()]
+# Text search configuration of JobPosting.search_vector; changing it requires rebuilding the column.
+SEARCH_CONFIG = "english"
+# Columns whose changes require the search vector to be rebuilt.
+SEARCH_FIELDS = ("title", "description", "skills")
+# ts_rank's default weights for the A, B and C labels, used by the pure-Python ranking.
+_SEARCH_WEIGHTS = (1.0, 0.4, 0.2)
 
+def _search_vector_expression():
+    """Weighted tsvector of a job posting: title (A), skill names (B) and description (C)."""
+    config = literal_column(f"'{SEARCH_CONFIG}'::regconfig")
+    skill_names = (
+        select(func.string_agg(Skill.name, literal_column("' '")))
+        .select_from(job_posting_skills.join(Skill, Skill.id == job_posting_skills.c.skill_id))
+        .where(job_posting_skills.c.job_posting_id == JobPosting.id)
+        .scalar_subquery()
+    )
+
+    def weighted(text, weight):
+        return func.setweight(
+            func.to_tsvector(config, func.coalesce(text, literal_column("''"))), literal_column(f"'{weight}'")
+        )
+
+    return (
+        weighted(JobPosting.title, "A")
+        .op("||")(weighted(skill_names, "B"))
+        .op("||")(weighted(JobPosting.description, "C"))
+    )
+
+def _search_terms(text: Optional[str]) -> List[str]:
+    return re.findall(r"\w+", (text or "").casefold())
+
+def _python_rank(db_obj: JobPosting, terms: Sequence[str]) -> Optional[float]:
+    """
+    Local stand-in for ts_rank: requires every term and weighs its occurrences like the
+    search vector's labels. It does not stem words or understand websearch operators.
+    """
+    fields = [
+        _search_terms(db_obj.title),
+        _search_terms(" ".join(skill.name for skill in db_obj.skills)),
+        _search_terms(db_obj.description),
+    ]
+    if not all(any(term in field for field in fields) for term in terms):
+        return None
+    return float(sum(
+        weight * field.count(term) / len(field)
+        for weight, field in zip(_SEARCH_WEIGHTS, fields) if field
+        for term in terms
+    ))
 
 
 class CRUDJobPosting(CRUDBase[JobPosting, JobPostingCreate, JobPostingUpdate]):
+    principal_tag = ("recruiter_profile", "recruiter_profile_id")
+    page_order = ("created_at", "id")
+    page_descending = True
 
     async def get_by_recruiter_profile_id(
-        self, db: AsyncSession, *, recruiter_profile_id: int, skip: int = 0, limit: int = 100
-    ) -> List[JobPosting]:
+        self,
+        db: AsyncSession,
+        *,
+        recruiter_profile_id: int,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        skills: Sequence[str] = ()
+    ) -> Tuple[List[JobPosting], Optional[str]]:
+        """
+        Retrieves one page of a recruiter profile's job postings, newest first,
+        optionally only those requiring every skill in ``skills``.
+        Returns the postings and the cursor of the next page.
+        """
+        statement = select(self.model).where(self.model.recruiter_profile_id == recruiter_profile_id)
+        if skills:
+            statement = statement.where(self.model.id.in_(_skills_filter(skills)))
+        return await paginate(
+            db,
+            statement,
+            order_by=[self.model.created_at, self.model.id],
+            cursor=cursor,
+            limit=limit,
+            descending=True
+        )
+
+    async def get_page(
+        self,
+        db: AsyncSession,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        options: Sequence[Any] = (),
+        skills: Sequence[str] = ()
+    ) -> Tuple[List[JobPosting], Optional[str]]:
         """
-        Retrieves job postings associated with a specific recruiter profile.
+        Retrieves one page of job postings, newest first, optionally only those
+        requiring every skill in ``skills``.
+        Returns the postings and the cursor of the next page.
         """
-        statement = (
-            select(self.model) 
-            .where(self.model.recruiter_profile_id == recruiter_profile_id)
-            .offset(skip)
-            .limit(limit)
-            .order_by(self.model.created_at.desc()) 
+        statement = select(self.model).options(*options)
+        if skills:
+            statement = statement.where(self.model.id.in_(_skills_filter(skills)))
+        return await paginate(
+            db,
+            statement,
+            order_by=[self.model.created_at, self.model.id],
+            cursor=cursor,
+            limit=limit,
+            descending=True
         )
-        result = await db.execute(statement)
-        return result.scalars().all()
+
+    async def _link_skills(
+        self, db: AsyncSession, skills_by_id: Dict[int, Sequence[str]]
+    ) -> Dict[int, List[Skill]]:
+        """
+        Links job postings to their skills with one batched INSERT into job_posting_skills.
+        Returns the skills of each posting, ordered like the ``skills`` relationship.
+        """
+        skills = await crud_skill.get_or_create_many(
+            db, names=[name for names in skills_by_id.values() for name in names]
+        )
+        by_key = {skill.normalized_name: skill for skill in skills}
+        linked = {
+            job_posting_id: sorted(
+                {by_key[key] for key in map(normalize_skill_name, names) if key},
+                key=lambda skill: skill.name
+            )
+            for job_posting_id, names in skills_by_id.items()
+        }
+        rows = [
+            {"job_posting_id": job_posting_id, "skill_id": skill.id}
+            for job_posting_id, posting_skills in linked.items()
+            for skill in posting_skills
+        ]
+        if rows:
+            await db.execute(insert(job_posting_skills), rows)
+        return linked
+
+    async def _refresh_search_vectors(self, db: AsyncSession, ids: Sequence[int]) -> None:
+        """Rebuilds the search vector of the given job postings with one UPDATE (Postgres only)."""
+        if not ids or db.get_bind().dialect.name != "postgresql":
+            return
+        table = self.model.__table__
+        await db.execute(
+            update(table)
+            .where(table.c.id.in_(list(ids)))
+            # Keep updated_at: the vector is derived data, not an edit of the posting.
+            .values(search_vector=_search_vector_expression(), updated_at=table.c.updated_at)
+        )
+
+    async def search(
+        self,
+        db: AsyncSession,
+        *,
+        query: str,
+        location: Optional[str] = None,
+        type: Optional[JobType] = None,
+        experience_level: Optional[ExperienceLevel] = None,
+        salary_range: Optional[str] = None,
+        skills: Sequence[str] = (),
+        cursor: Optional[str] = None,
+        limit: int = 100
+    ) -> Tuple[List[JobPosting], Optional[str]]:
+        """
+        Full-text search over title, skills and description, best matches first.
+        On Postgres the GIN-indexed search vector is matched with websearch_to_tsquery and
+        ranked with ts_rank; other databases fall back to ranking the filtered postings in Python.
+        Pages are keyed on (rank, id). Returns the postings and the cursor of the next page.
+        """
+        statement = select(self.model)
+        if location:
+            statement = statement.where(self.model.location.ilike(f"%{location}%"))
+        if type is not None:
+            statement = statement.where(self.model.type == type)
+        if experience_level is not None:
+            statement = statement.where(self.model.experience_level == experience_level)
+        if salary_range:
+            statement = statement.where(self.model.salary_range.ilike(f"%{salary_range}%"))
+        if skills:
+            statement = statement.where(self.model.id.in_(_skills_filter(skills)))
+
+        tsquery = func.websearch_to_tsquery(literal_column(f"'{SEARCH_CONFIG}'::regconfig"), query)
+        rank = func.ts_rank(self.model.search_vector, tsquery, type_=Float)
+        after = decode_cursor(cursor, [rank, self.model.id]) if cursor else None
+
+        if db.get_bind().dialect.name == "postgresql":
+            statement = statement.add_columns(rank).where(self.model.search_vector.op("@@")(tsquery))
+            if after is not None:
+                statement = statement.where(tuple_(rank, self.model.id) < tuple_(*after))
+            statement = statement.order_by(rank.desc(), self.model.id.desc()).limit(limit + 1)
+            result = await db.execute(statement)
+            ranked = [(row[0], row[1]) for row in result.all()]
+        else:
+            terms = _search_terms(query)
+            result = await db.execute(statement)
+            ranked = [
+                (db_obj, score) for db_obj in result.scalars().all()
+                if (score := _python_rank(db_obj, terms)) is not None
+                and (after is None or (score, db_obj.id) < after)
+            ]
+            ranked.sort(key=lambda item: (item[1], item[0].id), reverse=True)
+            ranked = ranked[:limit + 1]
+
+        next_cursor = None
+        if len(ranked) > limit:
+            ranked = ranked[:limit]
+            last, score = ranked[-1]
+            next_cursor = encode_cursor([score, last.id])
+        return [db_obj for db_obj, _ in ranked], next_cursor
 
     async def create_with_recruiter_profile(
-        self, db: AsyncSession, *, obj_in: JobPostingCreate, recruiter_profile_id: int
+        self, db: AsyncSession, *, obj_in: JobPostingCreate, recruiter_profile_id: int, commit: bool = False
     ) -> JobPosting:
         """
         Creates a new job posting linked to a recruiter profile.
-        Handles conversion of skills list to string.
+        Its skill names are resolved to entries of the skill dictionary.
         """
 
         create_data = obj_in.model_dump(exclude_unset=True) 
+        skills = await crud_skill.get_or_create_many(db, names=create_data.pop("skills", []))
 
-        # Convert the list of skills to the string format for the model
-        skills_string = skills_list_to_string(create_data.pop("skills", []))
-
-        # Create the SQLAlchemy model instance, adding the foreign key and skills string
         db_obj = self.model(
             **create_data,
             recruiter_profile_id=recruiter_profile_id,
-            required_skills=skills_string # Map schema 'skills' to model 'required_skills'
+            skills=skills
         ) # Use self.model
 
         db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
+        self._invalidate_principal(db, db_obj)
+        await db.flush()
+        await self._refresh_search_vectors(db, [db_obj.id])
+        await crud_stats.add_recruiter_stats(db, {recruiter_profile_id: (1, 0)})
+        await crud_activity.record_job_postings(db, [db_obj])
+        crud_job_match.schedule_refresh(db, job_posting_ids=[db_obj.id])
+        crud_dashboard.invalidate_after_commit(db, [recruiter_profile_id])
+        await save(db, commit=commit)
         return db_obj
 
     async def update(
@@ -65,26 +263,24 @@ class CRUDJobPosting(CRUDBase[JobPosting, JobPostingCreate, JobPostingUpdate]):
         db: AsyncSession,
         *,
         db_obj: JobPosting,
-        obj_in: Union[JobPostingUpdate, Dict[str, Any]] 
+        obj_in: Union[JobPostingUpdate, Dict[str, Any]],
+        commit: bool = False
     ) -> JobPosting:
         """
         Updates an existing job posting.
-        Handles conversion of skills list to string if skills are updated.
+        Replaces its skills if ``skills`` is given; None clears them.
         """
         if isinstance(obj_in, dict):
-            update_data = obj_in
+            update_data = dict(obj_in)
         else:
             
             update_data = obj_in.model_dump(exclude_unset=True) 
 
 
         if "skills" in update_data:
-            skills_list = update_data.pop("skills") 
-            if skills_list is not None:
-                update_data["required_skills"] = skills_list_to_string(skills_list) 
-            else:
-                 
-                 update_data["required_skills"] = None 
+            update_data["skills"] = await crud_skill.get_or_create_many(
+                db, names=update_data["skills"] or []
+            )
 
 
         
@@ -93,10 +289,146 @@ class CRUDJobPosting(CRUDBase[JobPosting, JobPostingCreate, JobPostingUpdate]):
                 setattr(db_obj, field, value)
 
         db.add(db_obj) 
-        await db.commit()
-        await db.refresh(db_obj)
+        self._invalidate_principal(db, db_obj)
+        if any(field in update_data for field in SEARCH_FIELDS):
+            await db.flush()
+            await self._refresh_search_vectors(db, [db_obj.id])
+        crud_dashboard.invalidate_after_commit(db, [db_obj.recruiter_profile_id])
+        if "skills" in update_data:
+            await crud_job_application.refresh_scores(db, job_posting_ids=[db_obj.id])
+            crud_job_match.schedule_refresh(db, job_posting_ids=[db_obj.id])
+        await save(db, commit=commit)
         return db_obj
 
+    async def get_recruiter_profile_ids(
+        self, db: AsyncSession, *, ids: Sequence[int]
+    ) -> Dict[int, int]:
+        """
+        Maps each existing job posting ID in ``ids`` to the recruiter profile that owns it.
+        """
+        if not ids:
+            return {}
+        result = await db.execute(
+            select(self.model.id, self.model.recruiter_profile_id).where(self.model.id.in_(ids))
+        )
+        return {row.id: row.recruiter_profile_id for row in result.all()}
+
+    async def create_many_with_recruiter_profile(
+        self,
+        db: AsyncSession,
+        *,
+        objs_in: Sequence[JobPostingCreate],
+        recruiter_profile_id: int,
+        chunk_size: Optional[int] = None,
+        commit: bool = False
+    ) -> List[JobPosting]:
+        """
+        Creates many job postings for one recruiter profile in chunked INSERT ... RETURNING batches.
+        The skills of all postings are resolved and linked in one batch.
+        """
+        rows = [
+            {**obj_in.model_dump(exclude={"skills"}), "recruiter_profile_id": recruiter_profile_id}
+            for obj_in in objs_in
+        ]
+        created = await self.create_many(db, objs_in=rows, chunk_size=chunk_size)
+        linked = await self._link_skills(
+            db, {db_obj.id: obj_in.skills for db_obj, obj_in in zip(created, objs_in)}
+        )
+        for db_obj in created:
+            set_committed_value(db_obj, "skills", linked[db_obj.id])
+        await self._refresh_search_vectors(db, [db_obj.id for db_obj in created])
+        await crud_stats.add_recruiter_stats(db, {recruiter_profile_id: (len(created), 0)})
+        await crud_activity.record_job_postings(db, created)
+        crud_job_match.schedule_refresh(db, job_posting_ids=[db_obj.id for db_obj in created])
+        crud_dashboard.invalidate_after_commit(db, [recruiter_profile_id])
+        await save(db, commit=commit)
+        return created
+
+    async def update_many(
+        self,
+        db: AsyncSession,
+        *,
+        values: Sequence[Dict[str, Any]],
+        chunk_size: Optional[int] = None,
+        commit: bool = False
+    ) -> List[int]:
+        """
+        Updates many job postings by ID. Rows carrying ``skills`` have their skills replaced
+        in one batch. The postings are locked with SELECT ... FOR UPDATE first; IDs that do not
+        exist are skipped, as are rows with only an ``id``. Returns the IDs written, in input order.
+        """
+        owners: Dict[int, int] = {}
+        for chunk in self._chunks([row["id"] for row in values], chunk_size):
+            result = await db.execute(
+                select(self.model.id, self.model.recruiter_profile_id)
+                .where(self.model.id.in_(chunk))
+                .with_for_update()
+            )
+            owners.update((row.id, row.recruiter_profile_id) for row in result.all())
+        rows = [dict(row) for row in values if row["id"] in owners]
+        search_ids = [row["id"] for row in rows if any(field in row for field in SEARCH_FIELDS)]
+        skills_by_id = {row["id"]: row.pop("skills") or [] for row in rows if "skills" in row}
+        column_rows = [row for row in rows if len(row) > 1]
+        if column_rows:
+            await super().update_many(db, values=column_rows, chunk_size=chunk_size)
+        if skills_by_id:
+            await db.execute(
+                delete(job_posting_skills).where(job_posting_skills.c.job_posting_id.in_(list(skills_by_id)))
+            )
+            await self._link_skills(db, skills_by_id)
+            await crud_job_application.refresh_scores(db, job_posting_ids=skills_by_id)
+            crud_job_match.schedule_refresh(db, job_posting_ids=skills_by_id)
+            self._invalidate_principals(db, [owners[job_posting_id] for job_posting_id in skills_by_id])
+        await self._refresh_search_vectors(db, search_ids)
+        crud_dashboard.invalidate_after_commit(db, owners.values())
+        await save(db, commit=commit)
+        written = {row["id"] for row in column_rows} | set(skills_by_id)
+        return [row["id"] for row in rows if row["id"] in written]
+
+    async def remove(
+        self, db: AsyncSession, *, id: int, commit: bool = False
+    ) -> Optional[JobPosting]:
+        """
+        Remove a job posting by ID. Its applications and their counters go with it
+        (ON DELETE CASCADE), so they are taken off the recruiter's counters too.
+        """
+        totals = await crud_stats.get_posting_totals(db, job_posting_ids=[id])
+        matched = await crud_job_match.get_matched_candidate_ids(db, job_posting_ids=[id])
+        db_obj = await super().remove(db, id=id)
+        if db_obj is not None:
+            recruiter_profile_id, applications = totals[id]
+            await crud_stats.add_recruiter_stats(db, {recruiter_profile_id: (-1, -applications)})
+            crud_dashboard.invalidate_after_commit(db, [recruiter_profile_id])
+            crud_job_match.schedule_refresh(db, candidate_profile_ids=matched)
+        await save(db, commit=commit)
+        return db_obj
+
+    async def remove_many(
+        self,
+        db: AsyncSession,
+        *,
+        ids: Sequence[int],
+        chunk_size: Optional[int] = None,
+        commit: bool = False
+    ) -> List[int]:
+        """
+        Delete many job postings by ID and take them and their applications off the
+        recruiters' counters. Returns the IDs that existed and were deleted.
+        """
+        totals = await crud_stats.get_posting_totals(db, job_posting_ids=ids)
+        matched = await crud_job_match.get_matched_candidate_ids(db, job_posting_ids=ids)
+        deleted = await super().remove_many(db, ids=ids, chunk_size=chunk_size)
+        deltas: Dict[int, Tuple[int, int]] = {}
+        for job_posting_id in deleted:
+            recruiter_profile_id, applications = totals[job_posting_id]
+            postings, applicants = deltas.get(recruiter_profile_id, (0, 0))
+            deltas[recruiter_profile_id] = (postings - 1, applicants - applications)
+        await crud_stats.add_recruiter_stats(db, deltas)
+        crud_dashboard.invalidate_after_commit(db, deltas)
+        crud_job_match.schedule_refresh(db, candidate_profile_ids=matched)
+        await save(db, commit=commit)
+        return deleted
+
 job_posting = CRUDJobPosting(JobPosting)
 
 #job_posting.get, job_posting.get_multi, job_posting.get_by_recruiter_profile_id,
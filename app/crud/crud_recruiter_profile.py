@@ -1,13 +1,22 @@
 from typing import Any, Dict, Optional, Union, List
+from sqlalchemy import bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
+from app.database.database import save
 from app.crud.base import CRUDBase 
 from app.models.recruiter_profile import RecruiterProfile 
 from app.models.job_posting import JobPosting 
 from app.schemas.recruiter_profile import RecruiterProfileCreate, RecruiterProfileUpdate 
 
+_by_user_id_statement = (
+    select(RecruiterProfile)
+    .where(RecruiterProfile.user_id == bindparam("user_id"))
+    .options(selectinload(RecruiterProfile.job_postings))
+)
+
 class CRUDRecruiterProfile(CRUDBase[RecruiterProfile, RecruiterProfileCreate, RecruiterProfileUpdate]):
+    principal_tag = ("user", "user_id")
 
     async def get_by_user_id(
         self, db: AsyncSession, *, user_id: int
@@ -15,45 +24,53 @@ class CRUDRecruiterProfile(CRUDBase[RecruiterProfile, RecruiterProfileCreate, Re
         """
         Retrieves a recruiter profile by user ID, eagerly loading related data.
         """
+        result = await db.execute(_by_user_id_statement, {"user_id": user_id})
+        return result.scalar_one_or_none()
+
+    async def get_with_job_postings(
+        self, db: AsyncSession, *, id: int
+    ) -> Optional[RecruiterProfile]:
+        """
+        Retrieves a recruiter profile by ID together with its user and job postings.
+        """
         statement = (
             select(self.model)
-            .where(self.model.user_id == user_id)
+            .where(self.model.id == id)
             .options(
-                selectinload(self.model.job_postings) 
-        
+                selectinload(self.model.job_postings),
+                selectinload(self.model.user)
             )
         )
         result = await db.execute(statement)
         return result.scalar_one_or_none()
 
     async def create_with_owner(
-        self, db: AsyncSession, *, obj_in: RecruiterProfileCreate, user_id: int
+        self, db: AsyncSession, *, obj_in: RecruiterProfileCreate, user_id: int, commit: bool = False
     ) -> RecruiterProfile:
         """
         Creates a new recruiter profile linked to a user.
+        Its job_postings collection starts out empty and loaded.
         """
         create_data = obj_in.model_dump(exclude_unset=True)
 
-        db_obj = self.model(**create_data, user_id=user_id)
+        db_obj = self.model(**create_data, user_id=user_id, job_postings=[])
 
         db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
-
-        loaded_db_obj = await self.get_by_user_id(db, user_id=user_id)
-        if not loaded_db_obj:
-            raise Exception("Failed to retrieve newly created profile with relationships.")
-        return loaded_db_obj
+        self._invalidate_principal(db, db_obj)
+        await save(db, commit=commit)
+        return db_obj
 
     async def update(
         self,
         db: AsyncSession,
         *,
         db_obj: RecruiterProfile,
-        obj_in: Union[RecruiterProfileUpdate, Dict[str, Any]]
+        obj_in: Union[RecruiterProfileUpdate, Dict[str, Any]],
+        commit: bool = False
     ) -> RecruiterProfile:
         """
         Updates an existing recruiter profile.
+        Relationships keep whatever the caller already loaded on ``db_obj``.
         """
         if isinstance(obj_in, dict):
             update_data = obj_in
@@ -65,12 +82,8 @@ class CRUDRecruiterProfile(CRUDBase[RecruiterProfile, RecruiterProfileCreate, Re
                 setattr(db_obj, field, value)
 
         db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
-
-        loaded_db_obj = await self.get_by_user_id(db, user_id=db_obj.user_id)
-        if not loaded_db_obj:
-            raise Exception("Failed to retrieve updated profile with relationships.")
-        return loaded_db_obj
+        self._invalidate_principal(db, db_obj)
+        await save(db, commit=commit)
+        return db_obj
 
 recruiter_profile = CRUDRecruiterProfile(RecruiterProfile) 
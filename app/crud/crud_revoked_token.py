@@ -0,0 +1,134 @@
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from app.core.bloom import BloomFilter
+from app.core.config import settings
+from app.database.database import save
+from app.models.revoked_token import RevokedToken
+
+
+class CRUDRevokedToken:
+    """
+    Revocation store for JWTs keyed by ``jti``, fronted by an in-process Bloom filter.
+    A negative Bloom lookup answers "not revoked" without touching the database;
+    only possible hits are confirmed against the revoked_tokens table.
+    The filter is rebuilt on startup and catches up with revocations made by other
+    workers every REVOCATION_SYNC_SECONDS. Each sync re-reads the last
+    REVOCATION_SYNC_OVERLAP_SECONDS before the newest ``revoked_at`` seen, since rows
+    do not commit in ``revoked_at`` order.
+    Expired jtis are dropped by the periodic rebuild (REVOCATION_REBUILD_SECONDS, main.py);
+    a sync that takes the filter past its capacity reloads it from the unexpired rows.
+    """
+
+    def __init__(self, model=RevokedToken):
+        self.model = model
+        self._bloom = BloomFilter(settings.REVOCATION_BLOOM_CAPACITY, settings.REVOCATION_BLOOM_ERROR_RATE)
+        self._last_revoked_at: Optional[datetime] = None
+        self._next_sync = 0.0
+        # jtis revoked in this process while a reload is reading the table, added to the new filter.
+        self._revoked_during_reload: Optional[List[str]] = None
+        self.lookups = 0
+        self.reloads = 0
+        self.bloom_negatives = 0
+        self.false_positives = 0
+
+    async def rebuild(self, db: AsyncSession) -> int:
+        """
+        Purges expired rows and reloads the Bloom filter from the unexpired ones.
+        Returns the number of revoked tokens loaded.
+        """
+        await db.execute(delete(self.model).where(self.model.expires_at <= datetime.now(timezone.utc)))
+        await db.commit()
+        return await self._reload(db)
+
+    async def _reload(self, db: AsyncSession) -> int:
+        """Replaces the Bloom filter with one holding the unexpired rows only. Does not write."""
+        if self._revoked_during_reload is not None:
+            return self._bloom.count
+        self._revoked_during_reload = []
+        try:
+            result = await db.execute(
+                select(self.model.jti, self.model.revoked_at)
+                .where(self.model.expires_at > datetime.now(timezone.utc))
+            )
+            rows = result.all()
+            bloom = BloomFilter(
+                max(settings.REVOCATION_BLOOM_CAPACITY, 2 * len(rows)),
+                settings.REVOCATION_BLOOM_ERROR_RATE
+            )
+            bloom.update(row.jti for row in rows)
+            bloom.update(self._revoked_during_reload)
+        finally:
+            self._revoked_during_reload = None
+        self._bloom = bloom
+        self._last_revoked_at = max((row.revoked_at for row in rows), default=None)
+        self._next_sync = time.monotonic() + settings.REVOCATION_SYNC_SECONDS
+        self.reloads += 1
+        return len(rows)
+
+    async def _sync(self, db: AsyncSession) -> None:
+        if time.monotonic() < self._next_sync:
+            return
+        self._next_sync = time.monotonic() + settings.REVOCATION_SYNC_SECONDS
+        statement = select(self.model.jti, self.model.revoked_at)
+        if self._last_revoked_at is not None:
+            overlap = timedelta(seconds=settings.REVOCATION_SYNC_OVERLAP_SECONDS)
+            statement = statement.where(self.model.revoked_at >= self._last_revoked_at - overlap)
+        result = await db.execute(statement)
+        for row in result.all():
+            self._bloom.add(row.jti)
+            if self._last_revoked_at is None or row.revoked_at > self._last_revoked_at:
+                self._last_revoked_at = row.revoked_at
+        if self._bloom.count > self._bloom.capacity:
+            await self._reload(db)
+
+    async def is_revoked(self, db: AsyncSession, *, jti: str) -> bool:
+        """Returns True if the token with this ``jti`` has been revoked."""
+        await self._sync(db)
+        self.lookups += 1
+        if jti not in self._bloom:
+            self.bloom_negatives += 1
+            return False
+        result = await db.execute(select(self.model.jti).where(self.model.jti == jti))
+        revoked = result.scalar_one_or_none() is not None
+        if not revoked:
+            self.false_positives += 1
+        return revoked
+
+    async def revoke(
+        self,
+        db: AsyncSession,
+        *,
+        jti: str,
+        expires_at: datetime,
+        user_id: Optional[int] = None,
+        commit: bool = False
+    ) -> RevokedToken:
+        """Revokes the token with this ``jti``. Revoking an already revoked token is a no-op."""
+        db_obj = await db.get(self.model, jti)
+        if db_obj is None:
+            db_obj = self.model(jti=jti, expires_at=expires_at, user_id=user_id)
+            db.add(db_obj)
+            await save(db, commit=commit)
+        self._bloom.add(jti)
+        if self._revoked_during_reload is not None:
+            self._revoked_during_reload.append(jti)
+        return db_obj
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "bloom_items": self._bloom.count,
+            "bloom_capacity": self._bloom.capacity,
+            "bloom_bits": self._bloom.num_bits,
+            "bloom_hashes": self._bloom.num_hashes,
+            "lookups": self.lookups,
+            "bloom_negatives": self.bloom_negatives,
+            "false_positives": self.false_positives,
+            "reloads": self.reloads,
+        }
+
+
+revoked_token = CRUDRevokedToken(RevokedToken)
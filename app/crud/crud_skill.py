@@ -1,11 +1,59 @@
-from typing import Any, Dict, Optional, Union, List
+from typing import Any, Dict, Optional, Sequence, Union, List
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from app.crud.base import CRUDBase 
-from app.models.skill import CandidateSkill 
-from app.schemas.skill import CandidateSkillCreate, CandidateSkillUpdate 
+from app.database.database import save
+from app.crud import crud_job_application, crud_job_match
+from app.crud.base import CRUDBase, dialect_insert
+from app.models.skill import CandidateSkill, Skill
+from app.schemas.skill import CandidateSkillCreate, CandidateSkillUpdate, SkillCreate
+
+def clean_skill_name(name: str) -> str:
+    """Collapses the whitespace of a skill name, keeping its spelling for display."""
+    return " ".join(name.split())
+
+def normalize_skill_name(name: str) -> str:
+    """Dictionary key of a skill name: case- and whitespace-insensitive."""
+    return clean_skill_name(name).casefold()
+
+class CRUDSkill(CRUDBase[Skill, SkillCreate, SkillCreate]):
+
+    async def get_or_create_many(self, db: AsyncSession, *, names: Sequence[str]) -> List[Skill]:
+        """
+        Resolves skill names to dictionary entries, adding the ones that are missing.
+        Returns one skill per distinct normalized name, in input order; blank names are dropped.
+        Known skills cost one query; new ones are added with a single INSERT ... ON CONFLICT.
+        """
+        spellings: Dict[str, str] = {}
+        for name in names:
+            key = normalize_skill_name(name)
+            if key:
+                spellings.setdefault(key, clean_skill_name(name))
+        if not spellings:
+            return []
+
+        result = await db.execute(select(self.model).where(self.model.normalized_name.in_(list(spellings))))
+        found = {skill.normalized_name: skill for skill in result.scalars().all()}
+        missing = [{"name": spellings[key], "normalized_name": key} for key in spellings if key not in found]
+        if missing:
+            statement = dialect_insert(db, self.model).on_conflict_do_nothing(index_elements=["normalized_name"])
+            result = await db.scalars(statement.returning(self.model), missing)
+            found.update((skill.normalized_name, skill) for skill in result.all())
+            if len(found) < len(spellings):
+                # Another transaction added some of them concurrently.
+                result = await db.execute(
+                    select(self.model).where(
+                        self.model.normalized_name.in_([key for key in spellings if key not in found])
+                    )
+                )
+                found.update((skill.normalized_name, skill) for skill in result.scalars().all())
+        return [found[key] for key in spellings]
 
 class CRUDCandidateSkill(CRUDBase[CandidateSkill, CandidateSkillCreate, CandidateSkillUpdate]):
+    principal_tag = ("candidate_profile", "candidate_profile_id")
+
+    async def _skill_id(self, db: AsyncSession, name: Optional[str]) -> Optional[int]:
+        skills = await skill.get_or_create_many(db, names=[name or ""])
+        return skills[0].id if skills else None
 
     async def get_by_candidate_profile_id(
         self, db: AsyncSession, *, candidate_profile_id: int, skip: int = 0, limit: int = 100
@@ -24,22 +72,71 @@ class CRUDCandidateSkill(CRUDBase[CandidateSkill, CandidateSkillCreate, Candidat
         return result.scalars().all()
 
     async def create_with_profile(
-        self, db: AsyncSession, *, obj_in: CandidateSkillCreate, candidate_profile_id: int
+        self, db: AsyncSession, *, obj_in: CandidateSkillCreate, candidate_profile_id: int, commit: bool = False
     ) -> CandidateSkill:
         """
-        Crée une nouvelle entrée de compétence liée à un profil candidat.
+        Crée une nouvelle entrée de compétence liée à un profil candidat,
+        rattachée à l'entrée correspondante du dictionnaire de compétences.
+        Les scores des candidatures du candidat sont recalculés dans la même transaction,
+        ses correspondances d'offres en arrière-plan.
         """
         
         obj_in_data = obj_in.model_dump(exclude_unset=True) 
 
-        db_obj = self.model(**obj_in_data, candidate_profile_id=candidate_profile_id)
+        db_obj = self.model(
+            **obj_in_data,
+            candidate_profile_id=candidate_profile_id,
+            skill_id=await self._skill_id(db, obj_in_data.get("name"))
+        )
 
         db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
+        self._invalidate_principal(db, db_obj)
+        await db.flush()
+        await crud_job_application.refresh_scores(db, candidate_profile_ids=[candidate_profile_id])
+        crud_job_match.schedule_refresh(db, candidate_profile_ids=[candidate_profile_id])
+        await save(db, commit=commit)
+        return db_obj
+
+    async def update(
+        self,
+        db: AsyncSession,
+        *,
+        db_obj: CandidateSkill,
+        obj_in: Union[CandidateSkillUpdate, Dict[str, Any]],
+        commit: bool = False
+    ) -> CandidateSkill:
+        """
+        Met à jour une compétence; un nouveau nom est rattaché au dictionnaire de compétences
+        et les scores des candidatures du candidat sont recalculés.
+        """
+        update_data = dict(obj_in) if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)
+        renamed = update_data.get("name") is not None
+        if renamed:
+            update_data["skill_id"] = await self._skill_id(db, update_data["name"])
+            crud_job_match.schedule_refresh(db, candidate_profile_ids=[db_obj.candidate_profile_id])
+        db_obj = await super().update(db, db_obj=db_obj, obj_in=update_data)
+        if renamed:
+            await crud_job_application.refresh_scores(db, candidate_profile_ids=[db_obj.candidate_profile_id])
+        await save(db, commit=commit)
+        return db_obj
+
+    async def remove(
+        self, db: AsyncSession, *, id: int, commit: bool = False
+    ) -> Optional[CandidateSkill]:
+        """
+        Supprime une compétence, recalcule les scores des candidatures du candidat et,
+        en arrière-plan, ses correspondances d'offres.
+        """
+        db_obj = await super().remove(db, id=id)
+        if db_obj is not None:
+            await crud_job_application.refresh_scores(db, candidate_profile_ids=[db_obj.candidate_profile_id])
+            crud_job_match.schedule_refresh(db, candidate_profile_ids=[db_obj.candidate_profile_id])
+        await save(db, commit=commit)
         return db_obj
 
+skill = CRUDSkill(Skill)
 candidate_skill = CRUDCandidateSkill(CandidateSkill)
 
-#now use candidate_skill.get, candidate_skill.get_multi, candidate_skill.get_by_candidate_profile_id,
-# candidate_skill.create_with_profile, candidate_skill.update, candidate_skill.remove
+#now use skill.get_or_create_many, candidate_skill.get, candidate_skill.get_multi,
+# candidate_skill.get_by_candidate_profile_id, candidate_skill.create_with_profile, candidate_skill.update,
+# candidate_skill.remove
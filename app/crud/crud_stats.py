@@ -0,0 +1,186 @@
+from collections import Counter
+from typing import Dict, Mapping, Sequence, Tuple
+from sqlalchemy import bindparam, func, literal
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from app.crud.base import dialect_insert
+from app.models.job_application import ApplicationStatus, JobApplication
+from app.models.job_posting import JobPosting
+from app.models.stats import JobPostingStatusCount, RecruiterStats
+
+# Counters are only ever changed by deltas inside the transaction of the write they
+# describe, so concurrent writers add up instead of overwriting each other.
+# Writes that bypass the CRUD layer (e.g. ON DELETE CASCADE from a deleted candidate
+# profile) are repaired by reconcile_counters. Reads select columns rather than entities,
+# so they see upserts made earlier in the same session.
+
+async def add_status_counts(
+    db: AsyncSession, deltas: Mapping[Tuple[int, ApplicationStatus], int]
+) -> None:
+    """Adds ``deltas`` keyed by (job_posting_id, status) to the per-posting application counts."""
+    rows = [
+        {"job_posting_id": job_posting_id, "status": status, "count": delta}
+        for (job_posting_id, status), delta in deltas.items() if delta
+    ]
+    if not rows:
+        return
+    statement = dialect_insert(db, JobPostingStatusCount.__table__)
+    statement = statement.on_conflict_do_update(
+        index_elements=["job_posting_id", "status"],
+        set_={"count": JobPostingStatusCount.__table__.c.count + statement.excluded["count"]}
+    )
+    await db.execute(statement, rows)
+
+async def add_recruiter_stats(
+    db: AsyncSession, deltas: Mapping[int, Tuple[int, int]]
+) -> None:
+    """Adds (job postings, applications) ``deltas`` keyed by recruiter_profile_id to the recruiter counters."""
+    rows = [
+        {"recruiter_profile_id": recruiter_profile_id, "job_postings_count": postings, "applications_count": applications}
+        for recruiter_profile_id, (postings, applications) in deltas.items() if postings or applications
+    ]
+    if not rows:
+        return
+    table = RecruiterStats.__table__
+    statement = dialect_insert(db, table)
+    statement = statement.on_conflict_do_update(
+        index_elements=["recruiter_profile_id"],
+        set_={
+            "job_postings_count": table.c.job_postings_count + statement.excluded["job_postings_count"],
+            "applications_count": table.c.applications_count + statement.excluded["applications_count"],
+        }
+    )
+    await db.execute(statement, rows)
+
+async def add_recruiter_applications_by_posting(
+    db: AsyncSession, deltas: Mapping[int, int]
+) -> None:
+    """
+    Adds application ``deltas`` keyed by job_posting_id to the counters of the postings'
+    recruiters, resolving each recruiter inside the statement (INSERT ... SELECT).
+    """
+    rows = [{"job_posting_id": job_posting_id, "delta": delta} for job_posting_id, delta in deltas.items() if delta]
+    if not rows:
+        return
+    table = RecruiterStats.__table__
+    source = select(
+        JobPosting.recruiter_profile_id, literal(0), bindparam("delta", type_=table.c.applications_count.type)
+    ).where(JobPosting.id == bindparam("job_posting_id"))
+    statement = dialect_insert(db, table).from_select(
+        ["recruiter_profile_id", "job_postings_count", "applications_count"], source
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=["recruiter_profile_id"],
+        set_={"applications_count": table.c.applications_count + statement.excluded["applications_count"]}
+    )
+    await db.execute(statement, rows)
+
+async def get_status_counts(
+    db: AsyncSession, *, job_posting_ids: Sequence[int]
+) -> Dict[int, Dict[ApplicationStatus, int]]:
+    """Per-status application counts of each of the given job postings (missing statuses are 0)."""
+    counts: Dict[int, Dict[ApplicationStatus, int]] = {
+        job_posting_id: {status: 0 for status in ApplicationStatus} for job_posting_id in job_posting_ids
+    }
+    if job_posting_ids:
+        result = await db.execute(
+            select(JobPostingStatusCount.job_posting_id, JobPostingStatusCount.status, JobPostingStatusCount.count)
+            .where(JobPostingStatusCount.job_posting_id.in_(list(job_posting_ids)))
+        )
+        for row in result.all():
+            counts[row.job_posting_id][row.status] = row.count
+    return counts
+
+async def get_recruiter_stats(db: AsyncSession, *, recruiter_profile_id: int) -> Tuple[int, int]:
+    """Returns (job postings, applications) counted for a recruiter profile."""
+    result = await db.execute(
+        select(RecruiterStats.job_postings_count, RecruiterStats.applications_count)
+        .where(RecruiterStats.recruiter_profile_id == recruiter_profile_id)
+    )
+    row = result.one_or_none()
+    if row is None:
+        return 0, 0
+    return row.job_postings_count, row.applications_count
+
+async def get_posting_totals(
+    db: AsyncSession, *, job_posting_ids: Sequence[int]
+) -> Dict[int, Tuple[int, int]]:
+    """Maps each existing job posting in ``job_posting_ids`` to (recruiter_profile_id, counted applications)."""
+    if not job_posting_ids:
+        return {}
+    result = await db.execute(
+        select(JobPosting.id, JobPosting.recruiter_profile_id, func.coalesce(func.sum(JobPostingStatusCount.count), 0))
+        .outerjoin(JobPostingStatusCount, JobPostingStatusCount.job_posting_id == JobPosting.id)
+        .where(JobPosting.id.in_(list(job_posting_ids)))
+        .group_by(JobPosting.id, JobPosting.recruiter_profile_id)
+    )
+    return {row[0]: (row[1], row[2]) for row in result.all()}
+
+async def reconcile_counters(db: AsyncSession) -> Dict[str, int]:
+    """
+    Recounts every counter from job_postings and job_applications and overwrites the ones
+    that drifted. Returns how many counter rows were repaired per table.
+    A write committed between the recount and the overwrite can be missed; that shows up
+    as drift again and is repaired by the next run.
+    """
+    result = await db.execute(
+        select(JobApplication.job_posting_id, JobApplication.status, func.count())
+        .group_by(JobApplication.job_posting_id, JobApplication.status)
+    )
+    actual_status = {(row[0], row[1]): row[2] for row in result.all()}
+    result = await db.execute(
+        select(JobPostingStatusCount.job_posting_id, JobPostingStatusCount.status, JobPostingStatusCount.count)
+    )
+    stored_status = {(row.job_posting_id, row.status): row.count for row in result.all()}
+    status_fixes = [
+        {"job_posting_id": key[0], "status": key[1], "count": actual_status.get(key, 0)}
+        for key in set(actual_status) | set(stored_status)
+        if actual_status.get(key, 0) != stored_status.get(key, 0)
+    ]
+    if status_fixes:
+        table = JobPostingStatusCount.__table__
+        statement = dialect_insert(db, table)
+        await db.execute(
+            statement.on_conflict_do_update(
+                index_elements=["job_posting_id", "status"], set_={"count": statement.excluded["count"]}
+            ),
+            status_fixes
+        )
+
+    result = await db.execute(
+        select(JobPosting.recruiter_profile_id, func.count()).group_by(JobPosting.recruiter_profile_id)
+    )
+    postings = Counter({row[0]: row[1] for row in result.all()})
+    result = await db.execute(
+        select(JobPosting.recruiter_profile_id, func.count())
+        .join(JobApplication, JobApplication.job_posting_id == JobPosting.id)
+        .group_by(JobPosting.recruiter_profile_id)
+    )
+    applications = Counter({row[0]: row[1] for row in result.all()})
+    result = await db.execute(
+        select(RecruiterStats.recruiter_profile_id, RecruiterStats.job_postings_count, RecruiterStats.applications_count)
+    )
+    stored_recruiters = {
+        row.recruiter_profile_id: (row.job_postings_count, row.applications_count) for row in result.all()
+    }
+    recruiter_fixes = [
+        {"recruiter_profile_id": recruiter_profile_id, "job_postings_count": postings[recruiter_profile_id],
+         "applications_count": applications[recruiter_profile_id]}
+        for recruiter_profile_id in set(postings) | set(applications) | set(stored_recruiters)
+        if (postings[recruiter_profile_id], applications[recruiter_profile_id])
+        != stored_recruiters.get(recruiter_profile_id, (0, 0))
+    ]
+    if recruiter_fixes:
+        table = RecruiterStats.__table__
+        statement = dialect_insert(db, table)
+        await db.execute(
+            statement.on_conflict_do_update(
+                index_elements=["recruiter_profile_id"],
+                set_={
+                    "job_postings_count": statement.excluded["job_postings_count"],
+                    "applications_count": statement.excluded["applications_count"],
+                }
+            ),
+            recruiter_fixes
+        )
+    return {"job_posting_status_counts": len(status_fixes), "recruiter_stats": len(recruiter_fixes)}
@@ -1,33 +1,156 @@
-from typing import Any, Dict, Optional, Union, List
+from functools import lru_cache
+from typing import Any, Dict, Optional, Union, List, Sequence, Tuple
+from sqlalchemy import bindparam, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
-from app.models.user import User
+from sqlalchemy.orm import defer, noload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from app.models.user import User, UserRole
 from app.models.candidate_profile import CandidateProfile
 from app.models.recruiter_profile import RecruiterProfile 
 from app.schemas.user import UserCreate, UserUpdate
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash_async
+from app.core.cache import invalidate_principal, token_version_cache
+from app.database.database import after_commit, save
+from app.core.pagination import paginate
 
-async def get_user(db: AsyncSession, user_id: int) -> Optional[User]:
-    """
-    Retrieves a user from the database by their ID (asynchronous).
-    Eagerly loads candidate_profile/recruiter_profile and their nested relationships.
-    """
-    statement = (
-        select(User)
-        .where(User.id == user_id)
-        .options(
+# Relationships a caller of get_user_identity can ask for by name.
+IDENTITY_RELATIONSHIPS = ("candidate_profile", "recruiter_profile", "job_postings")
+
+def _identity_options(load: Sequence[str]) -> list:
+    unknown = set(load) - set(IDENTITY_RELATIONSHIPS)
+    if unknown:
+        raise ValueError(f"Unknown identity relationships: {sorted(unknown)}")
+
+    options = []
+    if "candidate_profile" in load:
+        options.append(
             selectinload(User.candidate_profile).options(
+                defer(CandidateProfile.resume_text, raiseload=True),
                 selectinload(CandidateProfile.experiences),
                 selectinload(CandidateProfile.educations),
                 selectinload(CandidateProfile.candidate_skills)
-            ),
-            selectinload(User.recruiter_profile).options(
-                selectinload(RecruiterProfile.job_postings) 
             )
         )
+    else:
+        options.append(noload(User.candidate_profile))
+
+    if "job_postings" in load:
+        options.append(selectinload(User.recruiter_profile).selectinload(RecruiterProfile.job_postings))
+    elif "recruiter_profile" in load:
+        options.append(selectinload(User.recruiter_profile).raiseload(RecruiterProfile.job_postings))
+    else:
+        options.append(noload(User.recruiter_profile))
+    return options
+
+# The statements below are built once and executed with bound parameters, so the hot
+# lookups skip rebuilding the select and its loader options on every call.
+@lru_cache(maxsize=None)
+def _identity_statement(by: str, load: Tuple[str, ...]):
+    column = User.email if by == "email" else User.id
+    return select(User).where(column == bindparam(by)).options(*_identity_options(load))
+
+async def get_user_identity(
+    db: AsyncSession,
+    *,
+    email: Optional[str] = None,
+    user_id: Optional[int] = None,
+    load: Sequence[str] = ()
+) -> Optional[User]:
+    """
+    Retrieves a user for authentication by email or ID (asynchronous).
+    Only the users row is selected unless ``load`` names relationships from
+    IDENTITY_RELATIONSHIPS; relationships that are not requested read as None.
+    """
+    load = tuple(sorted(set(load)))
+    if email is not None:
+        statement, params = _identity_statement("email", load), {"email": email}
+    elif user_id is not None:
+        statement, params = _identity_statement("user_id", load), {"user_id": user_id}
+    else:
+        raise ValueError("get_user_identity requires an email or a user_id")
+    result = await db.execute(statement, params)
+    return result.scalar_one_or_none()
+
+# Changing any of these revokes the user's outstanding access tokens.
+TOKEN_REVOKING_FIELDS = ("role", "is_active", "is_superuser", "hashed_password")
+
+_token_state_statement = (
+    select(
+        User.token_version,
+        User.is_active,
+        User.role,
+        CandidateProfile.id.label("candidate_profile_id"),
+        RecruiterProfile.id.label("recruiter_profile_id"),
     )
-    result = await db.execute(statement)
+    .outerjoin(CandidateProfile, CandidateProfile.user_id == User.id)
+    .outerjoin(RecruiterProfile, RecruiterProfile.user_id == User.id)
+    .where(User.id == bindparam("user_id"))
+)
+_profile_id_statements = {
+    UserRole.candidate: select(CandidateProfile.id).where(CandidateProfile.user_id == bindparam("user_id")),
+    UserRole.recruiter: select(RecruiterProfile.id).where(RecruiterProfile.user_id == bindparam("user_id")),
+}
+
+async def get_token_state(db: AsyncSession, *, user_id: int) -> Optional[Tuple[int, bool, Optional[int]]]:
+    """
+    Returns (token_version, is_active, profile_id) for a user, or None if the user does not exist.
+    ``profile_id`` is the user's current candidate or recruiter profile for their role, if any.
+    Served from the in-process token version cache when possible; profile writes drop the
+    entry (see cache.invalidate_principal).
+    """
+    state = token_version_cache.get(user_id)
+    if state is None:
+        generation = token_version_cache.generation
+        result = await db.execute(_token_state_statement, {"user_id": user_id})
+        row = result.one_or_none()
+        if row is None:
+            return None
+        profile_id = {
+            UserRole.candidate: row.candidate_profile_id,
+            UserRole.recruiter: row.recruiter_profile_id,
+        }.get(row.role)
+        state = (row.token_version, bool(row.is_active), profile_id)
+        token_version_cache.set(user_id, state, generation=generation)
+    return state
+
+async def get_profile_id(
+    db: AsyncSession, *, user_id: int, role: Optional[str]
+) -> Optional[int]:
+    """
+    Returns the ID of the candidate or recruiter profile matching the user's role, if any.
+    """
+    statement = _profile_id_statements.get(role)
+    if statement is None:
+        return None
+    result = await db.execute(statement, {"user_id": user_id})
+    return result.scalar_one_or_none()
+
+def _forget_user(user_id: int) -> None:
+    """Drops a user's cached principals and token state after a committed write."""
+    invalidate_principal("user", user_id)
+    token_version_cache.pop(user_id)
+
+_user_graph_options = (
+    selectinload(User.candidate_profile).options(
+        selectinload(CandidateProfile.experiences),
+        selectinload(CandidateProfile.educations),
+        selectinload(CandidateProfile.candidate_skills)
+    ),
+    selectinload(User.recruiter_profile).options(
+        selectinload(RecruiterProfile.job_postings)
+    ),
+)
+_user_graph = select(User).options(*_user_graph_options)
+_user_graph_by_id = select(User).where(User.id == bindparam("user_id")).options(*_user_graph_options)
+_user_graph_by_email = select(User).where(User.email == bindparam("email")).options(*_user_graph_options)
+
+async def get_user(db: AsyncSession, user_id: int) -> Optional[User]:
+    """
+    Retrieves a user from the database by their ID (asynchronous).
+    Eagerly loads candidate_profile/recruiter_profile and their nested relationships.
+    """
+    result = await db.execute(_user_graph_by_id, {"user_id": user_id})
     return result.scalar_one_or_none()
 
 async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
@@ -35,72 +158,53 @@ async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
     Retrieves a user from the database by their email address (asynchronous).
     Eagerly loads candidate_profile/recruiter_profile and their nested relationships.
     """
-    statement = (
-        select(User)
-        .where(User.email == email)
-        .options(
-            selectinload(User.candidate_profile).options(
-                selectinload(CandidateProfile.experiences),
-                selectinload(CandidateProfile.educations),
-                selectinload(CandidateProfile.candidate_skills)
-            ),
-            selectinload(User.recruiter_profile).options(
-                selectinload(RecruiterProfile.job_postings)
-            )
-        )
-    )
-    result = await db.execute(statement)
+    result = await db.execute(_user_graph_by_email, {"email": email})
     return result.scalar_one_or_none()
 
-async def get_users(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[User]:
+async def get_users(
+    db: AsyncSession, cursor: Optional[str] = None, limit: int = 100
+) -> Tuple[List[User], Optional[str]]:
     """
-    Retrieves a list of users with optional pagination (asynchronous).
+    Retrieves one page of users ordered by ID, starting after ``cursor`` (asynchronous).
     Eagerly loads candidate_profile/recruiter_profile and their nested relationships for each user.
+    Returns the users and the cursor of the next page.
     """
-    statement = (
-        select(User)
-        .offset(skip)
-        .limit(limit)
-        .options(
-            selectinload(User.candidate_profile).options(
-                selectinload(CandidateProfile.experiences),
-                selectinload(CandidateProfile.educations),
-                selectinload(CandidateProfile.candidate_skills)
-            ),
-            selectinload(User.recruiter_profile).options(
-                selectinload(RecruiterProfile.job_postings)
-            )
-        )
-        .order_by(User.id)
-    )
-    result = await db.execute(statement)
-    return result.scalars().unique().all()
+    return await paginate(db, _user_graph, order_by=[User.id], cursor=cursor, limit=limit)
 
-async def create_user(db: AsyncSession, *, user_in: UserCreate) -> User:
+async def create_user(db: AsyncSession, *, user_in: UserCreate, commit: bool = False) -> User:
     """
     Creates a new user in the database (asynchronous).
-    Hashes the password before saving.
+    Hashes the password before saving. The user is flushed, and committed only if ``commit`` is True.
     """
-    hashed_password = get_password_hash(user_in.password)
+    hashed_password = await get_password_hash_async(user_in.password)
     create_data = user_in.model_dump(exclude={"password"})
     
-    db_user = User(**create_data, hashed_password=hashed_password)
+    # A new user has no profiles yet; setting them marks the relationships as loaded.
+    db_user = User(
+        **create_data,
+        hashed_password=hashed_password,
+        candidate_profile=None,
+        recruiter_profile=None
+    )
 
     db.add(db_user)
-    await db.commit()
-    await db.refresh(db_user)
-
-    loaded_user = await get_user(db, user_id=db_user.id)
-    if not loaded_user:
-        raise Exception("Failed to retrieve newly created user with relationships.")
-    return loaded_user
+    await save(db, commit=commit)
+    return db_user
 
 async def update_user(
-    db: AsyncSession, *, db_user: User, user_in: Union[UserUpdate, Dict[str, Any]]
+    db: AsyncSession,
+    *,
+    db_user: User,
+    user_in: Union[UserUpdate, Dict[str, Any]],
+    commit: bool = False
 ) -> User:
     """
     Updates an existing user in the database (asynchronous).
     Handles hashing the password if it's included in the update data.
+    Cached principals and token state are dropped once the change commits.
+    A change to a TOKEN_REVOKING_FIELDS field increments token_version in SQL, so concurrent
+    updates made through stale instances each revoke the tokens issued before them.
+    Relationships keep whatever the caller already loaded on ``db_user``.
     """
     if isinstance(user_in, dict):
         update_data = user_in
@@ -108,26 +212,36 @@ async def update_user(
         update_data = user_in.model_dump(exclude_unset=True)
 
     if "password" in update_data and update_data["password"]:
-        hashed_password = get_password_hash(update_data["password"])
+        hashed_password = await get_password_hash_async(update_data["password"])
         del update_data["password"]
         update_data["hashed_password"] = hashed_password
     else:
         update_data.pop("password", None)
 
+    revokes_tokens = any(
+        field in update_data and getattr(db_user, field) != update_data[field]
+        for field in TOKEN_REVOKING_FIELDS
+    )
+
     for field, value in update_data.items():
         if hasattr(db_user, field):
             setattr(db_user, field, value)
+    if revokes_tokens:
+        result = await db.execute(
+            update(User)
+            .where(User.id == db_user.id)
+            .values(token_version=func.coalesce(User.token_version, 0) + 1)
+            .returning(User.token_version)
+            .execution_options(synchronize_session=False)
+        )
+        set_committed_value(db_user, "token_version", result.scalar_one())
 
     db.add(db_user)
-    await db.commit()
-    await db.refresh(db_user)
-
-    loaded_user = await get_user(db, user_id=db_user.id)
-    if not loaded_user:
-        raise Exception("Failed to retrieve updated user with relationships.")
-    return loaded_user
+    after_commit(db, lambda: _forget_user(db_user.id))
+    await save(db, commit=commit)
+    return db_user
 
-async def delete_user(db: AsyncSession, *, user_id: int) -> Optional[User]:
+async def delete_user(db: AsyncSession, *, user_id: int, commit: bool = False) -> Optional[User]:
     """
     Deletes a user from the database by their ID (asynchronous).
     Returns the deleted user object, or None if not found.
@@ -136,7 +250,8 @@ async def delete_user(db: AsyncSession, *, user_id: int) -> Optional[User]:
 
     if db_user:
         await db.delete(db_user)
-        await db.commit()
+        after_commit(db, lambda: _forget_user(user_id))
+        await save(db, commit=commit)
         return db_user
     return None
 
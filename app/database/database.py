@@ -1,11 +1,107 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker, declarative_base
-from app.core.config import settings
-from typing import AsyncGenerator # Import AsyncGenerator
+import threading
+import time
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, AsyncSession
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from app.core.config import Settings, settings
+from typing import Any, AsyncGenerator, Callable, Dict # Import AsyncGenerator
 
 DATABASE_URL = settings.DATABASE_URL
 
-engine = create_async_engine(DATABASE_URL, echo=True, future=True)
+
+class PoolWaitStats:
+    """Counters for how long requests wait to check out a pooled connection."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(1000 * self.total_wait / attempts, 3) if attempts else 0.0,
+                "max_wait_ms": round(1000 * self.max_wait, 3),
+            }
+
+
+pool_wait_stats = PoolWaitStats()
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool that records the time spent waiting for a connection.
+    Counters live in ``pool_wait_stats`` so they survive pool recreation on dispose().
+    """
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except Exception:
+            pool_wait_stats.record(time.perf_counter() - started, timed_out=True)
+            raise
+        pool_wait_stats.record(time.perf_counter() - started)
+        return connection
+
+
+def create_engine_from_settings(config: Settings) -> AsyncEngine:
+    """
+    Builds the async engine with pool sizing, recycling, pre-ping and echo taken
+    from ``config``. For asyncpg, the driver statement cache and SQLAlchemy's
+    prepared statement cache are sized from the settings too (set both to 0 behind
+    PgBouncer in transaction mode).
+    """
+    url = make_url(config.DATABASE_URL)
+    connect_args: Dict[str, Any] = {}
+    if url.get_driver_name() == "asyncpg":
+        connect_args["statement_cache_size"] = config.DB_STATEMENT_CACHE_SIZE
+        connect_args["prepared_statement_cache_size"] = config.DB_PREPARED_STATEMENT_CACHE_SIZE
+
+    return create_async_engine(
+        url,
+        echo=config.DB_ECHO,
+        poolclass=InstrumentedAsyncPool,
+        pool_size=config.DB_POOL_SIZE,
+        max_overflow=config.DB_MAX_OVERFLOW,
+        pool_timeout=config.DB_POOL_TIMEOUT,
+        pool_recycle=config.DB_POOL_RECYCLE,
+        pool_pre_ping=config.DB_POOL_PRE_PING,
+        connect_args=connect_args,
+    )
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """Live statistics of the engine's connection pool."""
+    pool = engine.pool
+    return {
+        "pool_size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "timeout_seconds": settings.DB_POOL_TIMEOUT,
+        **pool_wait_stats.stats(),
+    }
+
+
+engine = create_engine_from_settings(settings)
 
 AsyncSessionLocal = sessionmaker(
     autocommit=False,
@@ -19,22 +115,50 @@ Base = declarative_base()
 
 # Dependency to get a database session
 async def get_db() -> AsyncGenerator[AsyncSession, None]: # Use AsyncGenerator for proper typing
+    """
+    Request-scoped unit of work.
+    CRUD calls only flush; the session is committed once after the endpoint returns
+    (before the response is sent) and rolled back if the endpoint raises.
+    """
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            # Commits and rollbacks should ideally be handled in the endpoint/service layer
-            # where the specific database operations are performed.
-            # If an unhandled exception occurs before commit in the endpoint,
-            # the 'async with' block will ensure the transaction is not committed.
+            await session.commit()
         except Exception:
-            # If an exception occurs during the session usage in the endpoint,
-            # it will propagate here. You might want to log it.
-            # The transaction will be rolled back automatically by SQLAlchemy
-            # when the session context manager exits due to an exception,
-            # unless session.commit() was already called successfully.
-            # Explicit rollback here can be redundant if commit isn't called in this dependency.
-            # However, if you want to be absolutely sure:
-            # await session.rollback() # This might be redundant if commit is not attempted here
-            raise # Re-raise the exception so FastAPI can handle it
-        finally:
-            await session.close()
\ No newline at end of file
+            await session.rollback()
+            raise
+
+
+async def save(db: AsyncSession, *, commit: bool = False) -> None:
+    """
+    Sends pending changes to the database. With ``commit=True`` the transaction is
+    committed immediately; otherwise it is only flushed and the caller (usually
+    ``get_db``) commits it.
+    """
+    if commit:
+        await db.commit()
+    else:
+        await db.flush()
+
+
+_AFTER_COMMIT_KEY = "after_commit_callbacks"
+
+
+def after_commit(db: AsyncSession, callback: Callable[[], None]) -> None:
+    """
+    Runs ``callback`` once the session's current transaction commits.
+    Callbacks are dropped if it rolls back. Used to invalidate in-process caches
+    only after the data they were built from has actually changed.
+    """
+    db.sync_session.info.setdefault(_AFTER_COMMIT_KEY, []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit_callbacks(session: Session) -> None:
+    for callback in session.info.pop(_AFTER_COMMIT_KEY, []):
+        callback()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_commit_callbacks(session: Session) -> None:
+    session.info.pop(_AFTER_COMMIT_KEY, None)
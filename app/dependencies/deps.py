@@ -1,63 +1,141 @@
-from typing import Generator, Optional, Any, AsyncGenerator
-from fastapi import Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordBearer
-from jose import jwt, JWTError
+from typing import Generator, Optional, Any, AsyncGenerator, List, Sequence, Tuple
+import math
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from jose import JWTError
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
-from app.schemas.token import TokenData
+from app.schemas.token import TokenPayload
 from app.crud import crud_user
+from app.crud.crud_revoked_token import revoked_token as crud_revoked_token
 from app.models.user import User, UserRole
-from app.crud.crud_recruiter_profile import recruiter_profile as crud_recruiter_profile_instance
 from app.models.recruiter_profile import RecruiterProfile
 from app.core.config import settings
+from app.core.cache import principal_cache
+from app.core.security import decode_token
+from app.core.rate_limit import login_ip_limiter, login_username_limiter
 from app.database.database import get_db
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """
-    Asynchronous Database session dependency.
-    Provides a SQLAlchemy AsyncSession for request handling and closes it afterwards.
-    """
-    from app.database.database import AsyncSessionLocal 
-    async with AsyncSessionLocal() as session:
-        yield session
-
 oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl=f"{settings.API_V1_STR}/auth/token"
 )
 
-async def get_current_user(
-    db: AsyncSession = Depends(get_db),
-    token: str = Depends(oauth2_scheme),
-) -> User:
+def _principal_tags(user: User) -> List[Tuple[str, int]]:
+    tags = [("user", user.id)]
+    if user.candidate_profile is not None:
+        tags.append(("candidate_profile", user.candidate_profile.id))
+    if user.recruiter_profile is not None:
+        tags.append(("recruiter_profile", user.recruiter_profile.id))
+    return tags
+
+async def load_principal(
+    db: AsyncSession, *, email: str, load: Sequence[str] = ()
+) -> Optional[User]:
     """
-    Dependency to get the current user from a JWT token and database.
+    Returns the user for a token subject with the ``load`` relationships, attached to ``db``.
+    Misses are loaded in a short-lived session so the cached instance is never bound
+    to a request session; hits are merged into ``db`` without emitting any SQL.
     """
-    credentials_exception = HTTPException(
+    key = (email, tuple(sorted(load)))
+    cached = principal_cache.get(key)
+    if cached is None:
+        from app.database.database import AsyncSessionLocal
+        generation = principal_cache.generation
+        async with AsyncSessionLocal() as session:
+            cached = await crud_user.get_user_identity(session, email=email, load=load)
+        if cached is None:
+            return None
+        principal_cache.set(key, cached, tags=_principal_tags(cached), generation=generation)
+    return await db.merge(cached, load=False)
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+async def get_token_payload(
+    db: AsyncSession = Depends(get_db),
+    token: str = Depends(oauth2_scheme),
+) -> TokenPayload:
+    """
+    Dependency to get the verified claims of the bearer token.
+    The token's version is compared with the user's current token version (cached
+    in process), so a role change or deactivation revokes tokens issued before it.
+    """
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
-        email: Optional[str] = payload.get("sub")
-        if email is None:
-            raise credentials_exception
-        token_data = TokenData(email=email)
+        payload = decode_token(token)
+        token_payload = TokenPayload(**payload)
+    except (JWTError, ValueError):
+        raise _credentials_exception()
 
-    except (JWTError, AttributeError):
-        raise credentials_exception
+    if token_payload.uid is None or token_payload.ver is None:
+        raise _credentials_exception()
 
-    user = await crud_user.get_user_by_email(db, email=token_data.email)
+    if token_payload.jti and await crud_revoked_token.is_revoked(db, jti=token_payload.jti):
+        raise _credentials_exception()
 
-    if user is None:
-        raise credentials_exception
+    state = await crud_user.get_token_state(db, user_id=token_payload.uid)
+    if state is None or state[0] != token_payload.ver:
+        raise _credentials_exception()
+    if not state[1]:
+        raise HTTPException(status_code=400, detail="Inactive user")
+
+    return token_payload
 
+async def get_current_user(
+    db: AsyncSession = Depends(get_db),
+    token_payload: TokenPayload = Depends(get_token_payload),
+) -> User:
+    """
+    Dependency to get the current user from a JWT token and database.
+    Only the user's own columns are loaded; use get_current_user_with() when
+    the endpoint needs profile relationships.
+    """
+    user = await load_principal(db, email=token_payload.sub)
+    if user is None:
+        raise _credentials_exception()
     return user
 
+def get_current_user_with(*load: str):
+    """
+    Builds a get_current_user dependency that also loads the named relationships
+    (see crud_user.IDENTITY_RELATIONSHIPS), e.g. get_current_user_with("candidate_profile").
+    """
+    unknown = set(load) - set(crud_user.IDENTITY_RELATIONSHIPS)
+    if unknown:
+        raise ValueError(f"Unknown identity relationships: {sorted(unknown)}")
+
+    async def get_current_user_with_relationships(
+        db: AsyncSession = Depends(get_db),
+        token_payload: TokenPayload = Depends(get_token_payload),
+    ) -> User:
+        user = await load_principal(db, email=token_payload.sub, load=load)
+        if user is None:
+            raise _credentials_exception()
+        return user
+    return get_current_user_with_relationships
+
+def require_role(role: UserRole):
+    """
+    Builds a dependency that authorizes the token's role claim, without a database query.
+    """
+    async def get_token_payload_with_role(
+        token_payload: TokenPayload = Depends(get_token_payload),
+    ) -> TokenPayload:
+        if token_payload.role != role.value:
+            raise HTTPException(
+                status_code=403, detail=f"User does not have {role.value} privileges"
+            )
+        return token_payload
+    return get_token_payload_with_role
+
+get_current_candidate_claims = require_role(UserRole.candidate)
+get_current_recruiter_claims = require_role(UserRole.recruiter)
+
 async def get_current_active_user(
     current_user: User = Depends(get_current_user)
 ) -> User:
@@ -70,38 +148,28 @@ async def get_current_active_user(
     return current_user
 
 async def get_current_active_superuser(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    token_payload: TokenPayload = Depends(get_token_payload)
+) -> TokenPayload:
     """
-    Dependency to get the current superuser.
-    Requires the user to be found in the database and be a superuser.
+    Dependency to authorize the current superuser from the token claims.
+    Returns the claims; ``uid`` is the superuser's ID.
     """
-    if not current_user.is_superuser:
+    if not token_payload.su:
         raise HTTPException(
             status_code=403, detail="The user doesn't have enough privileges"
         )
-    return current_user
+    return token_payload
 
 async def get_current_active_recruiter(
-    token: str = Depends(oauth2_scheme),
-    db: AsyncSession = Depends(get_db)
+    token_payload: TokenPayload = Depends(get_current_recruiter_claims),
+    current_user: User = Depends(get_current_user_with("recruiter_profile"))
 ) -> RecruiterProfile:
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        user_id_from_token = payload.get("sub")
-        if user_id_from_token is None:
-            raise credentials_exception
-        user_id = int(user_id_from_token)
-    except (JWTError, ValueError, TypeError): 
-        raise credentials_exception
-    recruiter_profile = await crud_recruiter_profile_instance.get_by_user_id(db, user_id=user_id)
-    
+    """
+    Dependency to get the recruiter profile of the current active recruiter.
+    The role is authorized from the token claims before the profile is loaded;
+    the profile's job postings are not loaded.
+    """
+    recruiter_profile = current_user.recruiter_profile
     if recruiter_profile is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -111,15 +179,76 @@ async def get_current_active_recruiter(
     return recruiter_profile
 
 async def get_current_active_candidate(
-    current_user: User = Depends(get_current_active_user)
+    token_payload: TokenPayload = Depends(get_current_candidate_claims),
+    current_user: User = Depends(get_current_user_with("candidate_profile"))
 ) -> User:
     """
-    Dependency to get the current active candidate user.
-    Requires the user to be active and have the 'candidate' role.
+    Dependency to get the current active candidate user, with their candidate profile loaded.
+    The role is authorized from the token claims before the user is loaded.
     """
-    if current_user.role != UserRole.candidate:
-         raise HTTPException(
-            status_code=403, detail="User does not have candidate privileges"
-        )
     return current_user
 
+async def _profile_id_from_claims(db: AsyncSession, token_payload: TokenPayload, detail: str) -> int:
+    # The ``pid`` claim is only a snapshot: the profile may have been created or deleted since
+    # the token was issued, so the current one comes from the (cached) token state.
+    state = await crud_user.get_token_state(db, user_id=token_payload.uid)
+    profile_id = state[2] if state is not None else None
+    if profile_id is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
+    return profile_id
+
+async def get_current_recruiter_profile_id(
+    db: AsyncSession = Depends(get_db),
+    token_payload: TokenPayload = Depends(get_current_recruiter_claims),
+) -> int:
+    """
+    Dependency to get the current recruiter's profile ID, authorized from the token claims.
+    """
+    return await _profile_id_from_claims(db, token_payload, "Recruiter profile for this user not found.")
+
+async def get_current_candidate_profile_id(
+    db: AsyncSession = Depends(get_db),
+    token_payload: TokenPayload = Depends(get_current_candidate_claims),
+) -> int:
+    """
+    Dependency to get the current candidate's profile ID, authorized from the token claims.
+    """
+    return await _profile_id_from_claims(db, token_payload, "Candidate profile for this user not found.")
+
+def get_client_ip(request: Request) -> str:
+    """
+    The client address the rate limits are keyed on. Behind TRUSTED_PROXY_HOPS reverse
+    proxies it is the X-Forwarded-For entry added by the outermost trusted proxy; entries
+    left of it are client-supplied and are not trusted.
+    """
+    hops = settings.TRUSTED_PROXY_HOPS
+    if hops > 0:
+        forwarded = [
+            address.strip()
+            for header in request.headers.getlist("x-forwarded-for")
+            for address in header.split(",")
+            if address.strip()
+        ]
+        if forwarded:
+            return forwarded[-min(hops, len(forwarded))]
+    return request.client.host if request.client else "unknown"
+
+async def enforce_login_rate_limit(
+    request: Request,
+    form_data: OAuth2PasswordRequestForm = Depends(),
+) -> None:
+    """
+    Dependency to throttle login attempts per client IP and per username.
+    Runs before the user lookup and password verification, so rejected attempts
+    cost neither a query nor a bcrypt hash.
+    """
+    client_ip = get_client_ip(request)
+    username = form_data.username.strip().lower()
+    for limiter, key in ((login_ip_limiter, client_ip), (login_username_limiter, username)):
+        allowed, retry_after = await limiter.hit(key)
+        if not allowed:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many login attempts. Please try again later.",
+                headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+            )
@@ -3,6 +3,11 @@ from .user import User, UserRole
 from .candidate_profile import CandidateProfile
 from .experience import Experience
 from .education import Education
-from .skill import CandidateSkill
+from .skill import CandidateSkill, Skill, job_posting_skills
 from .recruiter_profile import RecruiterProfile 
-from .job_posting import JobPosting, JobType, ExperienceLevel
\ No newline at end of file
+from .job_posting import JobPosting, JobType, ExperienceLevel
+from .job_application import JobApplication, ApplicationStatus
+from .revoked_token import RevokedToken
+from .stats import JobPostingStatusCount, RecruiterStats
+from .activity_event import ActivityEvent, ActivityType
+from .job_match import JobMatch
@@ -0,0 +1,37 @@
+import enum
+from datetime import datetime
+from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey, Enum, Index
+from app.database.database import Base
+
+class ActivityType(str, enum.Enum):
+    """Enum for the kinds of events shown in a recruiter's activity feed."""
+    job_posted = "job_posted"
+    new_application = "new_application"
+    application_status_changed = "application_status_changed"
+
+class ActivityEvent(Base):
+    """
+    Append-only entry of a recruiter's activity feed, written in the same transaction
+    as the change it describes (see crud_activity).
+    The message is rendered at write time so the feed is read from this table alone;
+    the posting and application IDs are kept as plain references and outlive their rows.
+    """
+    __tablename__ = "activity_events"
+
+    id = Column(Integer, primary_key=True)
+    recruiter_profile_id = Column(Integer, ForeignKey("recruiter_profiles.id", ondelete="CASCADE"), nullable=False)
+    type = Column(Enum(ActivityType), nullable=False)
+    job_posting_id = Column(Integer, nullable=True)
+    job_application_id = Column(Integer, nullable=True)
+    message = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<ActivityEvent(id={self.id}, recruiter_profile_id={self.recruiter_profile_id}, type={self.type})>"
+
+
+# The feed pages newest-first within one recruiter (see crud_activity.get_page).
+Index(
+    "ix_activity_events_recruiter_profile_id_created_at",
+    ActivityEvent.recruiter_profile_id, ActivityEvent.created_at.desc(), ActivityEvent.id.desc(),
+)
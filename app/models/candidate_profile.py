@@ -6,6 +6,7 @@ from sqlalchemy.orm import Mapped, mapped_column
 
 class CandidateProfile(Base):
     __tablename__ = "candidate_profiles"
+    __mapper_args__ = {"eager_defaults": True}
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), unique=True, nullable=False)
     bio = Column(Text, nullable=True)
@@ -22,6 +23,9 @@ class CandidateProfile(Base):
     experiences = relationship("Experience", back_populates="candidate_profile", cascade="all, delete-orphan")
     educations = relationship("Education", back_populates="candidate_profile", cascade="all, delete-orphan")
     candidate_skills = relationship("CandidateSkill", back_populates="candidate_profile", cascade="all, delete-orphan")
+    applications = relationship(
+        "JobApplication", back_populates="candidate", cascade="all, delete-orphan", passive_deletes=True
+    )
 
 
     def __repr__(self):
@@ -4,6 +4,7 @@ from app.database.database import Base
 
 class Education(Base):
     __tablename__ = "educations"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     candidate_profile_id = Column(Integer, ForeignKey("candidate_profiles.id"), nullable=False, index=True)
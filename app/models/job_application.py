@@ -1,6 +1,6 @@
 import enum
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from app.database.database import Base
 
@@ -19,10 +19,14 @@ class JobApplication(Base):
     Represents a candidate's application for a specific job posting.
     """
     __tablename__ = "job_applications"
+    # A candidate applies to a posting at most once; submissions rely on it (ON CONFLICT).
+    __table_args__ = (
+        UniqueConstraint("job_posting_id", "candidate_profile_id", name="uq_job_applications_job_posting_candidate"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    job_posting_id = Column(Integer, ForeignKey("job_postings.id"), nullable=False)
-    candidate_profile_id = Column(Integer, ForeignKey("candidate_profiles.id"), nullable=False)
+    job_posting_id = Column(Integer, ForeignKey("job_postings.id", ondelete="CASCADE"), nullable=False)
+    candidate_profile_id = Column(Integer, ForeignKey("candidate_profiles.id", ondelete="CASCADE"), nullable=False)
     full_name = Column(String(255), nullable=False)
     email = Column(String(255), nullable=False)
     phone = Column(String(50), nullable=True)
@@ -33,7 +37,23 @@ class JobApplication(Base):
     
     status = Column(Enum(ApplicationStatus), default=ApplicationStatus.PENDING, nullable=False)
     applied_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # How many of the posting's skills the candidate has, and that as a percentage (0 for
+    # postings without skills). Kept up to date on write, see crud_job_application.refresh_scores.
+    matched_skills = Column(Integer, default=0, server_default="0", nullable=False)
+    required_skills = Column(Integer, default=0, server_default="0", nullable=False)
+    match_score = Column(Integer, default=0, server_default="0", nullable=False)
     
     job_posting = relationship("JobPosting", back_populates="applications")
     candidate = relationship("CandidateProfile", back_populates="applications")
 
+
+# Both listings page newest-first within one parent (see CRUDJobApplication.page_order);
+# the leading foreign key also serves plain lookups and ON DELETE CASCADE.
+Index(
+    "ix_job_applications_job_posting_id_applied_at",
+    JobApplication.job_posting_id, JobApplication.applied_at.desc(), JobApplication.id.desc(),
+)
+Index(
+    "ix_job_applications_candidate_profile_id_applied_at",
+    JobApplication.candidate_profile_id, JobApplication.applied_at.desc(), JobApplication.id.desc(),
+)
@@ -0,0 +1,32 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index
+from app.database.database import Base
+
+
+class JobMatch(Base):
+    """
+    Precomputed ranking entry: one of a candidate's best matching job postings.
+    Only the top CANDIDATE_MATCHES_TOP_K postings per candidate are kept; they are
+    recomputed in the background when the inputs change, see crud_job_match.
+    """
+    __tablename__ = "candidate_job_matches"
+
+    candidate_profile_id = Column(Integer, ForeignKey("candidate_profiles.id", ondelete="CASCADE"), primary_key=True)
+    job_posting_id = Column(Integer, ForeignKey("job_postings.id", ondelete="CASCADE"), primary_key=True, index=True)
+    score = Column(Integer, nullable=False)
+    matched_skills = Column(Integer, nullable=False)
+    required_skills = Column(Integer, nullable=False)
+    computed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return (
+            f"<JobMatch(candidate_profile_id={self.candidate_profile_id}, "
+            f"job_posting_id={self.job_posting_id}, score={self.score})>"
+        )
+
+
+# The candidate dashboard reads the best matches of one candidate.
+Index(
+    "ix_candidate_job_matches_candidate_profile_id_score",
+    JobMatch.candidate_profile_id, JobMatch.score.desc(), JobMatch.job_posting_id.desc(),
+)
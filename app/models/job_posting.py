@@ -1,8 +1,10 @@
 import enum 
-from sqlalchemy import Column, Integer, String, ForeignKey, Text, DateTime, func, Enum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, ForeignKey, Text, DateTime, func, Enum, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 from app.database.database import Base 
 from app.models.recruiter_profile import RecruiterProfile 
+from app.models.skill import Skill, job_posting_skills
 
 class JobType(str, enum.Enum):
     """Enum for job types."""
@@ -23,6 +25,7 @@ class ExperienceLevel(str, enum.Enum):
 
 class JobPosting(Base):
     __tablename__ = "job_postings"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     recruiter_profile_id = Column(Integer, ForeignKey("recruiter_profiles.id"), nullable=False)
@@ -34,18 +37,35 @@ class JobPosting(Base):
     salary_range = Column(String, nullable=True) 
     description = Column(Text, nullable=False)
 
-    required_skills = Column(Text, nullable=True) 
-
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
 
+    # Weighted title/skills/description document for full-text search, maintained by
+    # CRUDJobPosting on Postgres. Never needed on read, so it is not loaded.
+    search_vector = deferred(Column(TSVECTOR().with_variant(Text(), "sqlite"), nullable=True))
+
     # Define the relationship back to the RecruiterProfile model
     recruiter_profile = relationship("RecruiterProfile", back_populates="job_postings")
+    # Loaded with one batched query per set of postings, so listings never load skills per row.
+    skills = relationship(
+        "Skill", secondary=job_posting_skills, lazy="selectin", order_by=Skill.name, passive_deletes=True
+    )
+    applications = relationship(
+        "JobApplication", back_populates="job_posting", cascade="all, delete-orphan", passive_deletes=True
+    )
 
 
     def __repr__(self):
         return f"<JobPosting(id={self.id}, title='{self.title}', recruiter_profile_id={self.recruiter_profile_id})>"
 
+# Listings page newest-first (see CRUDJobPosting.page_order), globally and per recruiter.
+Index("ix_job_postings_created_at", JobPosting.created_at.desc(), JobPosting.id.desc())
+Index(
+    "ix_job_postings_recruiter_profile_id_created_at",
+    JobPosting.recruiter_profile_id, JobPosting.created_at.desc(), JobPosting.id.desc(),
+)
+Index("ix_job_postings_search_vector", JobPosting.search_vector, postgresql_using="gin")
+
 if not hasattr(RecruiterProfile, 'job_postings'):
     RecruiterProfile.job_postings = relationship("JobPosting", back_populates="recruiter_profile")
 
@@ -6,6 +6,7 @@ from app.models.user import User
 
 class RecruiterProfile(Base):
     __tablename__ = "recruiter_profiles"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, func
+from app.database.database import Base
+
+
+class RevokedToken(Base):
+    """A revoked JWT, identified by its ``jti`` claim. Rows can be purged once ``expires_at`` passes."""
+    __tablename__ = "revoked_tokens"
+    __mapper_args__ = {"eager_defaults": True}
+
+    jti = Column(String(64), primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True, index=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    revoked_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<RevokedToken(jti='{self.jti}', user_id={self.user_id})>"
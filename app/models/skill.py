@@ -1,12 +1,36 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Text, DateTime, func
+from sqlalchemy import Column, Integer, String, ForeignKey, Text, DateTime, func, Table, Index
 from sqlalchemy.orm import relationship
 from app.database.database import Base
 from app.models.candidate_profile import CandidateProfile 
 
+class Skill(Base):
+    """Canonical skill dictionary shared by job postings and candidate skills."""
+    __tablename__ = "skills"
+    __mapper_args__ = {"eager_defaults": True}
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, nullable=False)
+    # Case- and whitespace-insensitive key, see crud_skill.normalize_skill_name.
+    normalized_name = Column(String, unique=True, index=True, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<Skill(id={self.id}, name='{self.name}')>"
+
+job_posting_skills = Table(
+    "job_posting_skills",
+    Base.metadata,
+    Column("job_posting_id", Integer, ForeignKey("job_postings.id", ondelete="CASCADE"), primary_key=True),
+    Column("skill_id", Integer, ForeignKey("skills.id", ondelete="CASCADE"), primary_key=True),
+    # Serves skill filters, which look postings up by skill.
+    Index("ix_job_posting_skills_skill_id", "skill_id", "job_posting_id"),
+)
+
 class CandidateSkill(Base):
     __tablename__ = "candidate_skills"
+    __mapper_args__ = {"eager_defaults": True}
     id = Column(Integer, primary_key=True, index=True)
-    candidate_profile_id = Column(Integer, ForeignKey("candidate_profiles.id"), nullable=False)
+    candidate_profile_id = Column(Integer, ForeignKey("candidate_profiles.id"), nullable=False, index=True)
+    skill_id = Column(Integer, ForeignKey("skills.id"), nullable=True, index=True)
     name = Column(String, index=True, nullable=False)
     proficiency = Column(String, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -16,3 +40,11 @@ class CandidateSkill(Base):
     def __repr__(self):
         return f"<CandidateSkill(id={self.id}, name='{self.name}', candidate_profile_id={self.candidate_profile_id})>"
 
+
+# Application scores check which of a posting's skills one candidate has (see
+# crud_job_application.refresh_scores); both columns keep the planner off the skill_id
+# index, which walks every candidate holding the skill.
+Index(
+    "ix_candidate_skills_candidate_profile_id_skill_id",
+    CandidateSkill.candidate_profile_id, CandidateSkill.skill_id,
+)
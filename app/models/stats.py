@@ -0,0 +1,36 @@
+from sqlalchemy import Column, Integer, ForeignKey, Enum
+from app.database.database import Base
+from app.models.job_application import ApplicationStatus
+
+
+class JobPostingStatusCount(Base):
+    """
+    Denormalized number of applications per job posting and status.
+    Maintained in the same transaction as application writes, see crud_stats.
+    """
+    __tablename__ = "job_posting_status_counts"
+
+    job_posting_id = Column(Integer, ForeignKey("job_postings.id", ondelete="CASCADE"), primary_key=True)
+    status = Column(Enum(ApplicationStatus), primary_key=True)
+    count = Column(Integer, nullable=False, default=0, server_default="0")
+
+    def __repr__(self):
+        return f"<JobPostingStatusCount(job_posting_id={self.job_posting_id}, status={self.status}, count={self.count})>"
+
+
+class RecruiterStats(Base):
+    """
+    Denormalized number of job postings and applications per recruiter profile.
+    Maintained in the same transaction as posting and application writes, see crud_stats.
+    """
+    __tablename__ = "recruiter_stats"
+
+    recruiter_profile_id = Column(Integer, ForeignKey("recruiter_profiles.id", ondelete="CASCADE"), primary_key=True)
+    job_postings_count = Column(Integer, nullable=False, default=0, server_default="0")
+    applications_count = Column(Integer, nullable=False, default=0, server_default="0")
+
+    def __repr__(self):
+        return (
+            f"<RecruiterStats(recruiter_profile_id={self.recruiter_profile_id}, "
+            f"job_postings_count={self.job_postings_count}, applications_count={self.applications_count})>"
+        )
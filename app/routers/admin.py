@@ -1,8 +1,17 @@
-from typing import Any, List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from app import crud, schemas
+from app.core.cache import principal_cache
+from app.core.config import settings
+from app.core.security import password_hash_pool, verified_token_cache
+from app.core.dashboard_cache import get_dashboard_cache_backend
+from app.core.rate_limit import get_rate_limit_backend
+from app.core.ranking import resume_term_cache
+from app.database.database import get_pool_stats
 from app.models.user import User, UserRole
+from app.models.recruiter_profile import RecruiterProfile
 from app.dependencies import deps 
 
 router = APIRouter(
@@ -13,24 +22,24 @@ router = APIRouter(
 
 get_current_admin_user = deps.get_current_active_superuser
 
-@router.get("/users", response_model=List[schemas.User])
+@router.get("/users", response_model=schemas.Page[schemas.User])
 async def read_users(
     db: AsyncSession = Depends(deps.get_db),
-    skip: int = 0,
-    limit: int = 100,
-    current_admin: User = Depends(get_current_admin_user)
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=settings.PAGE_MAX_LIMIT),
+    current_admin: schemas.TokenPayload = Depends(get_current_admin_user)
 ) -> Any:
     """
-    Retrieve all users (admin only).
+    Retrieve all users, one page at a time (admin only).
     """
-    users = await crud.get_users(db, skip=skip, limit=limit)
-    return users
+    users, next_cursor = await crud.get_users(db, cursor=cursor, limit=limit)
+    return {"items": users, "next_cursor": next_cursor}
 
 @router.get("/users/{user_id}", response_model=schemas.User)
 async def read_user_by_id(
     user_id: int,
     db: AsyncSession = Depends(deps.get_db),
-    current_admin: User = Depends(get_current_admin_user)
+    current_admin: schemas.TokenPayload = Depends(get_current_admin_user)
 ) -> Any:
     """
     Retrieve a specific user by ID (admin only).
@@ -48,7 +57,7 @@ async def update_user_by_admin(
     user_id: int,
     user_in: schemas.UserUpdate,
     db: AsyncSession = Depends(deps.get_db),
-    current_admin: User = Depends(get_current_admin_user)
+    current_admin: schemas.TokenPayload = Depends(get_current_admin_user)
 ) -> Any:
     """
     Update a user's details by ID (admin only).
@@ -61,7 +70,7 @@ async def update_user_by_admin(
             detail="User not found"
         )
     # Prevent admin from deactivating themselves or changing their own superuser status
-    if user.id == current_admin.id and (user_in.is_active is False or user_in.is_superuser is False):
+    if user.id == current_admin.uid and (user_in.is_active is False or user_in.is_superuser is False):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin cannot deactivate or remove superuser status from themselves."
@@ -81,12 +90,12 @@ async def update_user_by_admin(
 async def delete_user_by_admin(
     user_id: int,
     db: AsyncSession = Depends(deps.get_db),
-    current_admin: User = Depends(get_current_admin_user)
+    current_admin: schemas.TokenPayload = Depends(get_current_admin_user)
 ) -> Any:
     """
     Delete a user by ID (admin only).
     """
-    if user_id == current_admin.id:
+    if user_id == current_admin.uid:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin cannot delete their own account."
@@ -100,17 +109,22 @@ async def delete_user_by_admin(
     return user
 
 
-@router.get("/recruiter-profiles", response_model=List[schemas.RecruiterProfileRead])
+@router.get("/recruiter-profiles", response_model=schemas.Page[schemas.RecruiterProfileRead])
 async def read_all_recruiter_profiles(
     db: AsyncSession = Depends(deps.get_db),
-    skip: int = 0,
-    limit: int = 100,
-    current_admin: User = Depends(get_current_admin_user)
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=settings.PAGE_MAX_LIMIT),
+    current_admin: schemas.TokenPayload = Depends(get_current_admin_user)
 ) -> Any:
     """
-    Retrieve all recruiter profiles (admin only).
+    Retrieve all recruiter profiles, one page at a time (admin only).
     """
-    recruiter_profiles = await crud.recruiter_profile.get_multi(db, skip=skip, limit=limit)
+    recruiter_profiles, next_cursor = await crud.recruiter_profile.get_page(
+        db,
+        cursor=cursor,
+        limit=limit,
+        options=[selectinload(RecruiterProfile.user), selectinload(RecruiterProfile.job_postings)]
+    )
     
     results = []
     for profile in recruiter_profiles:
@@ -154,13 +168,13 @@ async def read_all_recruiter_profiles(
                 updated_at=profile.updated_at,
                 job_postings=[]
             ))
-    return results
+    return {"items": results, "next_cursor": next_cursor}
 
 @router.get("/recruiter-profiles/{profile_id}", response_model=schemas.RecruiterProfileRead)
 async def read_recruiter_profile_by_id(
     profile_id: int,
     db: AsyncSession = Depends(deps.get_db),
-    current_admin: User = Depends(get_current_admin_user)
+    current_admin: schemas.TokenPayload = Depends(get_current_admin_user)
 ) -> Any:
     """
     Retrieve a specific recruiter profile by ID (admin only).
@@ -219,12 +233,13 @@ async def update_recruiter_profile_by_admin(
     profile_id: int,
     profile_in: schemas.RecruiterProfileUpdate,
     db: AsyncSession = Depends(deps.get_db),
-    current_admin: User = Depends(get_current_admin_user)
+    current_admin: schemas.TokenPayload = Depends(get_current_admin_user)
 ) -> Any:
     """
     Update a recruiter profile by ID (admin only).
     """
-    profile = await crud.recruiter_profile.get(db, id=profile_id)
+    # Load the user and job postings up front; the update does not re-select them.
+    profile = await crud.recruiter_profile.get_with_job_postings(db, id=profile_id)
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -232,14 +247,7 @@ async def update_recruiter_profile_by_admin(
         )
     
     updated_profile = await crud.recruiter_profile.update(db=db, db_obj=profile, obj_in=profile_in)
-
-    # Re-fetch the user to ensure updated recruiter_profile relationship is loaded for response
-    updated_user = await crud.get_user(db, user_id=updated_profile.user_id)
-    if not updated_user:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Associated user not found after profile update."
-        )
+    updated_user = updated_profile.user
 
     return schemas.RecruiterProfileRead(
         id=updated_profile.id,
@@ -265,7 +273,7 @@ async def update_recruiter_profile_by_admin(
 async def delete_recruiter_profile_by_admin(
     profile_id: int,
     db: AsyncSession = Depends(deps.get_db),
-    current_admin: User = Depends(get_current_admin_user)
+    current_admin: schemas.TokenPayload = Depends(get_current_admin_user)
 ) -> Any:
     """
     Delete a recruiter profile by ID (admin only).
@@ -307,3 +315,107 @@ async def delete_recruiter_profile_by_admin(
         job_postings=[] # empty after deletion
     )
 
+
+@router.get("/metrics/principal-cache", response_model=Dict[str, Any])
+async def read_principal_cache_metrics(
+    current_admin: schemas.TokenPayload = Depends(get_current_admin_user)
+) -> Any:
+    """
+    Hit/miss counters of the authenticated-user cache used by get_current_user (admin only).
+    Counters are per worker process.
+    """
+    return principal_cache.stats()
+
+
+@router.get("/metrics/password-hashing", response_model=Dict[str, Any])
+async def read_password_hashing_metrics(
+    current_admin: schemas.TokenPayload = Depends(get_current_admin_user)
+) -> Any:
+    """
+    Queue depth and wait times of the bcrypt worker pool (admin only).
+    """
+    return password_hash_pool.stats()
+
+
+@router.get("/metrics/token-cache", response_model=Dict[str, Any])
+async def read_token_cache_metrics(
+    current_admin: schemas.TokenPayload = Depends(get_current_admin_user)
+) -> Any:
+    """
+    Hit/miss counters of the verified-token cache used when decoding JWTs (admin only).
+    """
+    return verified_token_cache.stats()
+
+
+@router.get("/metrics/token-revocation", response_model=Dict[str, Any])
+async def read_token_revocation_metrics(
+    current_admin: schemas.TokenPayload = Depends(get_current_admin_user)
+) -> Any:
+    """
+    Bloom filter size and lookup counters of the token revocation index (admin only).
+    """
+    return crud.revoked_token.stats()
+
+
+@router.get("/metrics/rate-limit", response_model=Dict[str, Any])
+async def read_rate_limit_metrics(
+    current_admin: schemas.TokenPayload = Depends(get_current_admin_user)
+) -> Any:
+    """
+    Allowed/rejected counters of the login rate limiter backend (admin only).
+    """
+    return get_rate_limit_backend().stats()
+
+
+@router.get("/metrics/dashboard-cache", response_model=Dict[str, Any])
+async def read_dashboard_cache_metrics(
+    current_admin: schemas.TokenPayload = Depends(get_current_admin_user)
+) -> Any:
+    """
+    Hit/miss counters of the recruiter dashboard cache backend (admin only).
+    """
+    return get_dashboard_cache_backend().stats()
+
+
+@router.get("/metrics/resume-term-cache", response_model=Dict[str, Any])
+async def read_resume_term_cache_metrics(
+    current_admin: schemas.TokenPayload = Depends(get_current_admin_user)
+) -> Any:
+    """
+    Hit/miss counters and vocabulary size of the resume term cache used by AI search (admin only).
+    """
+    return resume_term_cache.stats()
+
+
+@router.get("/metrics/db-pool", response_model=Dict[str, Any])
+async def read_db_pool_metrics(
+    current_admin: schemas.TokenPayload = Depends(get_current_admin_user)
+) -> Any:
+    """
+    Connection pool usage and checkout wait times for this worker (admin only).
+    """
+    return get_pool_stats()
+
+
+@router.post("/maintenance/reconcile-counters", response_model=Dict[str, int])
+async def reconcile_counters(
+    db: AsyncSession = Depends(deps.get_db),
+    current_admin: schemas.TokenPayload = Depends(get_current_admin_user)
+) -> Any:
+    """
+    Recount the application and job posting counters and repair any drift (admin only).
+    Returns how many counter rows were repaired per table.
+    """
+    return await crud.stats.reconcile_counters(db)
+
+
+@router.post("/maintenance/refresh-job-matches", response_model=Dict[str, int])
+async def refresh_job_matches(
+    db: AsyncSession = Depends(deps.get_db),
+    current_admin: schemas.TokenPayload = Depends(get_current_admin_user)
+) -> Any:
+    """
+    Queue every candidate's job match ranking for a background refresh (admin only),
+    e.g. after a migration or a restart that dropped queued work.
+    """
+    return {"queued": await crud.job_match.schedule_all(db)}
@@ -1,15 +1,22 @@
 import httpx
+import logging
 import os
+import time
 from fastapi import APIRouter, Depends, HTTPException, Body
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Optional, Set
 from app import crud
+from app.core.config import settings
+from app.core.ranking import BM25Index, resume_term_cache, weighted_query
 from app.database.database import get_db 
+from app.models.job_posting import JobPosting
 from pydantic import BaseModel
 
 class AISearchRequest(BaseModel):
     job_id: int 
     candidate_ids: List[int]
+    # Also send every candidate to the AI service and report the recall of the local pre-filter.
+    measure_recall: bool = False
 
 router = APIRouter(
     prefix="/ai-recruiter",
@@ -17,8 +24,194 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+logger = logging.getLogger(__name__)
+
 AGENTIC_RAG_API_URL = os.getenv("AGENTIC_RAG_API_URL", "http://127.0.0.1:8001/agentic-screen")
 
+# Weights of the job posting fields in the local ranking query.
+LOCAL_QUERY_WEIGHTS = {"title": 2.0, "skills": 3.0, "description": 1.0}
+
+
+def job_query(db_job: JobPosting) -> Dict[str, float]:
+    return weighted_query([
+        (db_job.title, LOCAL_QUERY_WEIGHTS["title"]),
+        (" ".join(skill.name for skill in db_job.skills), LOCAL_QUERY_WEIGHTS["skills"]),
+        (db_job.description, LOCAL_QUERY_WEIGHTS["description"]),
+    ])
+
+
+def resume_index(resumes: List[Dict[str, str]]) -> BM25Index:
+    """BM25 index of the resumes keyed by candidate profile ID, from the cached term counts."""
+    return resume_term_cache.index({int(resume["id"]): resume["text"] for resume in resumes})
+
+
+def rank_locally(
+    db_job: JobPosting,
+    resumes: List[Dict[str, str]],
+    index: Optional[BM25Index] = None,
+    fallback_reason: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Ranks the resumes against the job posting with in-process BM25 (app.core.ranking),
+    reusing ``index`` when the caller already built it for these resumes.
+    Candidates whose resume shares no term with the posting are listed as unmatched.
+    """
+    started = time.perf_counter()
+    if index is None:
+        index = resume_index(resumes)
+    ranked = index.rank(job_query(db_job), limit=len(index))
+    ranked_ids = {str(profile_id) for profile_id, _, _ in ranked}
+    return {
+        "job_id": str(db_job.id),
+        "engine": "local-bm25",
+        "fallback_reason": fallback_reason,
+        "results": [
+            {"id": str(profile_id), "rank": rank, "score": round(score, 4), "matched_terms": terms}
+            for rank, (profile_id, score, terms) in enumerate(ranked, start=1)
+        ],
+        "unmatched_ids": [resume["id"] for resume in resumes if resume["id"] not in ranked_ids],
+        "elapsed_ms": elapsed_ms(started),
+    }
+
+
+def elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+def prefilter(
+    db_job: JobPosting, resumes: List[Dict[str, str]], index: BM25Index, skill_ids: Dict[int, Set[int]], top_k: int
+) -> List[Dict[str, str]]:
+    """
+    First retrieval stage: the top_k resumes by number of the posting's skills the candidate
+    has (listed or named in the resume), then by BM25 score of the resume against the posting.
+    """
+    required = {skill.id for skill in db_job.skills}
+    lexical = index.score(job_query(db_job))
+    order = sorted(
+        range(len(resumes)),
+        key=lambda i: (-len(skill_ids.get(int(resumes[i]["id"]), set()) & required), -lexical[i]),
+    )
+    return [resumes[i] for i in order[:top_k]]
+
+
+def prefilter_recall(shortlist: List[Dict[str, str]], unfiltered: Any) -> Optional[float]:
+    """
+    Share of the unfiltered run's best len(shortlist) candidates that the pre-filter kept.
+    None when the AI service response does not list ranked "results" with candidate "id"s.
+    """
+    results = unfiltered.get("results") if isinstance(unfiltered, dict) else None
+    if not isinstance(results, list) or not all(isinstance(item, dict) and "id" in item for item in results):
+        return None
+    best = [str(item["id"]) for item in results[:len(shortlist)]]
+    if not best:
+        return None
+    kept = {resume["id"] for resume in shortlist}
+    return round(sum(resume_id in kept for resume_id in best) / len(best), 4)
+
+
+def ranking_body(response: httpx.Response) -> Optional[Dict[str, Any]]:
+    """
+    The AgenticRAG response body as a JSON object; a bare list is taken as the ranked "results".
+    None when the body is not JSON or is any other JSON value.
+    """
+    try:
+        body = response.json()
+    except ValueError:
+        return None
+    if isinstance(body, list):
+        body = {"results": body}
+    return body if isinstance(body, dict) else None
+
+
+async def call_agentic_rag(client: httpx.AsyncClient, db_job: JobPosting, resumes: List[Dict[str, str]]) -> httpx.Response:
+    agentic_rag_payload = {
+        "job_id": str(db_job.id),
+        "job_description_text": db_job.description, 
+        "resumes": resumes
+    }
+    logger.info("Calling AgenticRAG service at %s with %d resumes", AGENTIC_RAG_API_URL, len(resumes))
+    response = await client.post(AGENTIC_RAG_API_URL, json=agentic_rag_payload)
+    response.raise_for_status()
+    return response
+
+
+async def rank_candidates(
+    db: AsyncSession, db_job: JobPosting, resumes_for_agent: List[Dict[str, str]], *, measure_recall: bool
+) -> Dict[str, Any]:
+    """
+    Depending on AI_SEARCH_MODE the candidates are ranked by the AgenticRAG service, by the
+    local BM25 engine, or by the service with the local engine as fallback when it is
+    unreachable, times out, fails with a server error or answers with something other than
+    a JSON object (a bare list is taken as the ranked results).
+    Only the AI_SEARCH_PREFILTER_TOP_K best candidates of a local pre-filter are sent to the
+    service; the response reports the stage timings and, with measure_recall, the recall of
+    the pre-filter against a run on every candidate.
+    """
+    if settings.AI_SEARCH_MODE == "local":
+        return rank_locally(db_job, resumes_for_agent)
+
+    timings: Dict[str, float] = {}
+    started = time.perf_counter()
+    top_k = settings.AI_SEARCH_PREFILTER_TOP_K
+    shortlist = resumes_for_agent
+    # Built by the pre-filter and reused by the local fallback.
+    index: Optional[BM25Index] = None
+    if 0 < top_k < len(resumes_for_agent):
+        skill_ids = await crud.job_match.get_candidate_skill_ids(
+            db,
+            [int(resume["id"]) for resume in resumes_for_agent],
+            resume_texts={int(resume["id"]): resume["text"] for resume in resumes_for_agent},
+        )
+        index = resume_index(resumes_for_agent)
+        shortlist = prefilter(db_job, resumes_for_agent, index, skill_ids, top_k)
+    timings["prefilter_ms"] = elapsed_ms(started)
+
+    fallback = settings.AI_SEARCH_MODE == "auto"
+    unfiltered_response = None
+    async with httpx.AsyncClient(timeout=settings.AI_SEARCH_REMOTE_TIMEOUT_SECONDS) as client: 
+        try:
+            started = time.perf_counter()
+            response = await call_agentic_rag(client, db_job, shortlist)
+            timings["remote_ms"] = elapsed_ms(started)
+            if measure_recall and len(shortlist) < len(resumes_for_agent):
+                started = time.perf_counter()
+                unfiltered_response = await call_agentic_rag(client, db_job, resumes_for_agent)
+                timings["unfiltered_remote_ms"] = elapsed_ms(started)
+        except (httpx.ConnectError, httpx.TimeoutException) as e:
+            if fallback:
+                return rank_locally(db_job, resumes_for_agent, index, fallback_reason=f"AI service unavailable: {e!r}")
+            raise HTTPException(status_code=503, detail=f"AI service unavailable: {e}")
+        except httpx.HTTPStatusError as e:
+            if fallback and e.response.status_code >= 500:
+                return rank_locally(db_job, resumes_for_agent, index, fallback_reason=f"AI service returned {e.response.status_code}")
+            body = ranking_body(e.response)
+            error_detail = body.get("detail", e.response.text) if body else e.response.text
+            raise HTTPException(status_code=502, detail=f"AI service failed: {error_detail}")
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+    logger.info("Received response from AgenticRAG service for job %s", db_job.id)
+    result = ranking_body(response)
+    if result is None:
+        logger.warning("AgenticRAG service returned an invalid response for job %s", db_job.id)
+        if fallback:
+            return rank_locally(db_job, resumes_for_agent, index, fallback_reason="AI service returned an invalid response")
+        raise HTTPException(status_code=502, detail="AI service returned an invalid response.")
+    recall = None
+    if len(shortlist) == len(resumes_for_agent):
+        recall = 1.0
+    elif unfiltered_response is not None:
+        recall = prefilter_recall(shortlist, ranking_body(unfiltered_response))
+    result["prefilter"] = {
+        "top_k": top_k,
+        "candidates": len(resumes_for_agent),
+        "shortlisted_ids": [resume["id"] for resume in shortlist],
+        "timings_ms": timings,
+        "recall": recall,
+    }
+    return result
+
+
 @router.post("/search", response_model=Dict[str, Any])
 async def search_with_ai(
     request_body: AISearchRequest = Body(...),
@@ -27,52 +220,35 @@ async def search_with_ai(
 ):
     """
     Endpoint for the Recruiter AI Search functionality.
+    The resumes are loaded in batches of (id, resume_text) rows and ranked by rank_candidates;
+    candidates without a profile or without resume text are listed under "skipped".
     """
-    print(f"--- AI Search Endpoint: Received request for Job ID: {request_body.job_id} ---")
+    logger.info("AI search for job %s over %d candidates", request_body.job_id, len(request_body.candidate_ids))
 
-    print("Retrieving job and candidate data from the database...")
-    
     db_job = await crud.job.get(db, id=request_body.job_id)
     if not db_job:
         raise HTTPException(status_code=404, detail=f"Job with ID {request_body.job_id} not found.")
     
-    db_resumes = [
-        {"id": cid, "resume_text": f"This is the resume text for candidate {cid}."} for cid in request_body.candidate_ids
-    ]
-    if not db_resumes:
+    candidate_ids = list(dict.fromkeys(request_body.candidate_ids))
+    resume_texts = await crud.candidate_profile.get_resume_texts(db, ids=candidate_ids)
+    if not resume_texts:
         raise HTTPException(status_code=404, detail="No matching candidates found for the provided IDs.")
 
     resumes_for_agent = []
-    for resume in db_resumes:
-        resume_id = resume.get("id")
-        resume_text = resume.get("resume_text")
-        if resume_text:
-             resumes_for_agent.append({"id": str(resume_id), "text": resume_text})
+    skipped: Dict[str, List[str]] = {"missing_ids": [], "empty_resume_ids": []}
+    for candidate_id in candidate_ids:
+        if candidate_id not in resume_texts:
+            skipped["missing_ids"].append(str(candidate_id))
+        elif not (resume_texts[candidate_id] or "").strip():
+            skipped["empty_resume_ids"].append(str(candidate_id))
         else:
-            print(f"Warning: Resume ID {resume_id} is missing text content and will be skipped.")
+            resumes_for_agent.append({"id": str(candidate_id), "text": resume_texts[candidate_id]})
+    if skipped["missing_ids"] or skipped["empty_resume_ids"]:
+        logger.warning("Skipping candidates without a resume to analyze: %s", skipped)
 
     if not resumes_for_agent:
         raise HTTPException(status_code=400, detail="None of the selected candidates have resume text to analyze.")
 
-    agentic_rag_payload = {
-        "job_id": str(request_body.job_id),
-        "job_description_text": db_job.description, 
-        "resumes": resumes_for_agent
-    }
-    
-    print(f"Data prepared. Calling AgenticRAG service at: {AGENTIC_RAG_API_URL}")
-
-    async with httpx.AsyncClient(timeout=300.0) as client: 
-        try:
-            response = await client.post(AGENTIC_RAG_API_URL, json=agentic_rag_payload)
-            response.raise_for_status()
-        except httpx.ConnectError as e:
-            raise HTTPException(status_code=503, detail=f"AI service unavailable: {e}")
-        except httpx.HTTPStatusError as e:
-            error_detail = e.response.json().get("detail", e.response.text)
-            raise HTTPException(status_code=502, detail=f"AI service failed: {error_detail}")
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
-
-    print("Successfully received response from AgenticRAG service.")
-    return response.json()
+    result = await rank_candidates(db, db_job, resumes_for_agent, measure_recall=request_body.measure_recall)
+    result["skipped"] = skipped
+    return result
@@ -1,4 +1,4 @@
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
@@ -15,6 +15,43 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+async def _create_user_access_token(db: AsyncSession, user: Any) -> str:
+    """
+    Issues an access token carrying the claims that role-gated dependencies
+    authorize from: user ID, role, profile ID and token version.
+    """
+    profile_id = await crud.get_profile_id(db, user_id=user.id, role=user.role)
+    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    return security.create_access_token(
+        subject=user.email,
+        expires_delta=access_token_expires,
+        role=user.role.value if user.role else "user",
+        user_id=user.id,
+        profile_id=profile_id,
+        token_version=user.token_version,
+        is_superuser=bool(user.is_superuser)
+    )
+
+async def _decode_refresh_token(db: AsyncSession, authorization: str) -> dict:
+    """
+    Verifies the refresh token from an ``Authorization: Bearer`` header and
+    rejects it if it has been revoked.
+    """
+    if not authorization.lower().startswith("bearer "):
+        raise HTTPException(status_code=401, detail="Invalid refresh token header.")
+    
+    token = authorization.split(" ")[1]
+
+    try:
+        payload = security.decode_token(token, verify_exp=True)
+    except Exception as e:
+        raise HTTPException(status_code=401, detail="Invalid refresh token.")
+
+    jti = payload.get("jti")
+    if jti and await crud.revoked_token.is_revoked(db, jti=jti):
+        raise HTTPException(status_code=401, detail="Refresh token has been revoked.")
+    return payload
+
 @router.post("/register", response_model=schemas.User)
 async def register_user(
     user_in: schemas.UserCreate,
@@ -23,7 +60,7 @@ async def register_user(
     """
     Registers a new user.
     """
-    user = await crud.get_user_by_email(db, email=user_in.email)
+    user = await crud.get_user_identity(db, email=user_in.email)
     if user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -32,7 +69,11 @@ async def register_user(
     user = await crud.create_user(db=db, user_in=user_in) 
     return user
 
-@router.post("/token", response_model=schemas.Token)
+@router.post(
+    "/token",
+    response_model=schemas.Token,
+    dependencies=[Depends(deps.enforce_login_rate_limit)]
+)
 async def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: AsyncSession = Depends(deps.get_db)
@@ -40,21 +81,15 @@ async def login_for_access_token(
     """
     OAuth2 compatible token endpoint, gets an access token for a user.
     """
-    user = await crud.get_user_by_email(db, email=form_data.username)
-    if not user or not security.verify_password(form_data.password, user.hashed_password):
+    user = await crud.get_user_identity(db, email=form_data.username)
+    if not user or not await security.verify_password_async(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user_role = user.role.value if user.role  else "user"
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = security.create_access_token(
-        subject=user.email,
-        expires_delta=access_token_expires,
-        role=user_role
-    )
+    access_token = await _create_user_access_token(db, user)
 
     refresh_token_expires = timedelta(minutes=settings.REFRESH_TOKEN_EXPIRE_MINUTES)
     refresh_token = security.create_refresh_token(
@@ -73,32 +108,43 @@ async def refresh_access_token(
     """
     Refresh access token using refresh token.
     """
-    if not refresh_token.lower().startswith("bearer "):
-        raise HTTPException(status_code=401, detail="Invalid refresh token header.")
-    
-    token = refresh_token.split(" ")[1]
-
-    try:
-        payload = security.decode_token(token, verify_exp=True)
-    except Exception as e:
-        raise HTTPException(status_code=401, detail="Invalid refresh token.")
+    payload = await _decode_refresh_token(db, refresh_token)
 
     email = payload.get("sub")
     if not email:
         raise HTTPException(status_code=401, detail="Invalid token payload.")
 
-    user = await crud.get_user_by_email(db, email=email)
+    user = await crud.get_user_identity(db, email=email)
     if not user:
         raise HTTPException(status_code=404, detail="User not found.")
 
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    new_access_token = security.create_access_token(
-        subject=email,
-        expires_delta=access_token_expires,
-        role=user.role.value if user.role else "user"
-    )
+    new_access_token = await _create_user_access_token(db, user)
 
     return {"access_token": new_access_token, "token_type": "bearer"}
+
+@router.post("/token/revoke", status_code=status.HTTP_204_NO_CONTENT)
+async def revoke_refresh_token(
+    refresh_token: str = Header(..., alias="Authorization"),
+    db: AsyncSession = Depends(deps.get_db)
+) -> None:
+    """
+    Revoke a refresh token (e.g. on logout). It can no longer be used to obtain access tokens.
+    """
+    payload = await _decode_refresh_token(db, refresh_token)
+
+    jti = payload.get("jti")
+    if not jti:
+        raise HTTPException(status_code=400, detail="Token cannot be revoked: it has no jti claim.")
+
+    user = await crud.get_user_identity(db, email=payload.get("sub"))
+    await crud.revoked_token.revoke(
+        db,
+        jti=jti,
+        expires_at=datetime.fromtimestamp(payload["exp"], tz=timezone.utc),
+        user_id=user.id if user else None
+    )
+    return None
+
 @router.get("/test-auth", response_model=schemas.User)
 async def test_auth(
     current_user: schemas.User = Depends(deps.get_current_active_user) 
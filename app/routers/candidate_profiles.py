@@ -112,8 +112,6 @@ async def update_candidate_profile_for_current_user(
 
     updated_profile = await crud.candidate_profile.update(db=db, db_obj=profile, obj_in=profile_in)
 
-    await db.refresh(current_user, attribute_names=['candidate_profile'])
-
     return schemas.CandidateProfileRead(
         id=updated_profile.id,
         user_id=updated_profile.user_id,
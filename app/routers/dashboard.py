@@ -1,13 +1,14 @@
-from typing import Any, List, Optional 
-import random 
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Any, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
 from app import crud, schemas
+from app.core.config import settings
+from app.core.dashboard_cache import get_dashboard_cache_backend, recruiter_dashboard_key
+from app.models.activity_event import ActivityEvent
+from app.models.candidate_profile import CandidateProfile
 from app.models.user import User
-from app.models.job_posting import JobPosting 
+from app.models.recruiter_profile import RecruiterProfile
 from app.dependencies import deps
-from sqlalchemy import func
 
 router = APIRouter(
     prefix="/dashboard",
@@ -15,14 +16,44 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# Profile fields counted by the completeness percentage.
+RECRUITER_PROFILE_FIELDS = (
+    "company_name", "job_title", "phone_number", "linkedin_profile_url", "website_url",
+    "bio", "location", "company_size", "industry",
+)
+
+def profile_completeness(recruiter_profile: RecruiterProfile) -> int:
+    filled = sum(1 for field in RECRUITER_PROFILE_FIELDS if getattr(recruiter_profile, field))
+    return round(100 * filled / len(RECRUITER_PROFILE_FIELDS))
+
+# Candidate profile fields and collections counted by the completeness percentage,
+# together with the uploaded resume.
+CANDIDATE_PROFILE_FIELDS = (
+    "bio", "phone_number", "location", "linkedin_profile_url", "portfolio_url",
+    "experiences", "educations", "candidate_skills",
+)
+
+def candidate_profile_completeness(candidate_profile: CandidateProfile, has_resume: bool) -> int:
+    filled = sum(1 for field in CANDIDATE_PROFILE_FIELDS if getattr(candidate_profile, field)) + has_resume
+    return round(100 * filled / (len(CANDIDATE_PROFILE_FIELDS) + 1))
+
+def activity_item(event: ActivityEvent) -> schemas.RecentActivityItem:
+    return schemas.RecentActivityItem(
+        id=event.id, type=event.type.value, message=event.message, timestamp=event.created_at.isoformat()
+    )
+
 
 @router.get("/recruiter", response_model=schemas.RecruiterDashboardData)
 async def get_recruiter_dashboard_data(
     db: AsyncSession = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_active_recruiter)
+    token_payload: schemas.TokenPayload = Depends(deps.get_current_recruiter_claims),
+    current_user: User = Depends(deps.get_current_user_with("recruiter_profile"))
 ) -> Any:
     """
     Get data for the recruiter dashboard for the current authenticated recruiter.
+    The figures come from one query (see crud_dashboard.get_recruiter_dashboard) and are
+    cached per recruiter for DASHBOARD_CACHE_TTL_SECONDS; job posting and application
+    writes drop the cached copy.
     """
     recruiter_profile = current_user.recruiter_profile
     if not recruiter_profile:
@@ -31,69 +62,71 @@ async def get_recruiter_dashboard_data(
             detail="Recruiter profile not found for this user."
         )
 
-
     user_name = f"{current_user.first_name or ''} {current_user.last_name or ''}".strip()
     if not user_name:
         user_name = current_user.email 
 
-    
-    statement_count_jobs = select(func.count(JobPosting.id)).where(JobPosting.recruiter_profile_id == recruiter_profile.id)
-    total_active_jobs_result = await db.execute(statement_count_jobs)
-    total_active_jobs = total_active_jobs_result.scalar_one()
-
-
-    simulated_profile_completeness = 80 + random.randint(0, 20) 
-
-    simulated_total_applicants = total_active_jobs * random.randint(5, 15)
-
-    simulated_total_ai_matched_candidates = int(simulated_total_applicants * random.uniform(0.3, 0.7))
-
-    simulated_top_candidate_matches: List[schemas.RecruiterCandidateMatch] = [
-        schemas.RecruiterCandidateMatch(
-            id=101,
-            name="Michael Johnson",
-            avatar="https://i.pravatar.cc/150?img=68",
-            title="Senior Software Engineer",
-            location="San Francisco, CA",
-            experience="6+ years",
-            skills=["Python", "FastAPI", "SQLAlchemy", "Docker"],
-            match_reasons=["Strong backend experience", "Matches required skills"]
-        ),
-        schemas.RecruiterCandidateMatch(
-            id=102,
-            name="Emma Rodriguez",
-            avatar="https://i.pravatar.cc/150?img=69",
-            title="Full Stack Developer",
-            location="Remote",
-            experience="5+ years",
-            skills=["React", "Node.js", "MongoDB", "AWS"],
-            match_reasons=["Full stack expertise", "Experience with tech stack"]
-        ),
-        schemas.RecruiterCandidateMatch(
-            id=103,
-            name="David Chen",
-            avatar="https://i.pravatar.cc/150?img=70", 
-            title="Frontend Lead",
-            location="New York, NY",
-            experience="7+ years",
-            skills=["React", "TypeScript", "GraphQL", "Leadership"],
-            match_reasons=["Leadership experience", "Frontend specialization"]
-        ),
-    ]
-
-
-    simulated_recent_activity: List[schemas.RecentActivityItem] = [
-        schemas.RecentActivityItem(id=1, type="new_application", message="New application for Senior React Developer", timestamp="1 hour ago"),
-        schemas.RecentActivityItem(id=2, type="new_match", message="New high match candidate for Full Stack Engineer", timestamp="Yesterday"),
-        schemas.RecentActivityItem(id=3, type="job_view", message="Your Frontend Engineer job listing received 5 views", timestamp="2 days ago"),
-    ]
-
-    return schemas.RecruiterDashboardData(
+    profile_fields = {
+        "user_name": user_name,
+        "profile_completeness_percentage": profile_completeness(recruiter_profile),
+    }
+
+    cache = get_dashboard_cache_backend()
+    key = recruiter_dashboard_key(recruiter_profile.id)
+    cached = await cache.get(key)
+    if cached is not None:
+        # The profile fields are not covered by the invalidation, so they are never served from cache.
+        return schemas.RecruiterDashboardData.model_validate_json(cached).model_copy(update=profile_fields)
+
+    marker = cache.marker(key)
+    dashboard = await crud.dashboard.get_recruiter_dashboard(db, recruiter_profile_id=recruiter_profile.id)
+    data = schemas.RecruiterDashboardData(**profile_fields, **dashboard)
+    await cache.set(key, data.model_dump_json(), ttl=settings.DASHBOARD_CACHE_TTL_SECONDS, marker=marker)
+    return data
+
+
+@router.get("/recruiter/activity", response_model=schemas.Page[schemas.RecentActivityItem])
+async def get_recruiter_activity(
+    db: AsyncSession = Depends(deps.get_db),
+    recruiter_profile_id: int = Depends(deps.get_current_recruiter_profile_id),
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=settings.PAGE_MAX_LIMIT),
+) -> Any:
+    """
+    The activity feed of the current recruiter (postings, applications and status changes),
+    newest first, one page at a time. Pass ``next_cursor`` back as ``cursor`` for the next page.
+    """
+    events, next_cursor = await crud.activity.get_page(
+        db, recruiter_profile_id=recruiter_profile_id, cursor=cursor, limit=limit
+    )
+    return schemas.Page(items=[activity_item(event) for event in events], next_cursor=next_cursor)
+
+
+@router.get("/candidate", response_model=schemas.CandidateDashboardData)
+async def get_candidate_dashboard_data(
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_active_candidate),
+    limit: int = Query(5, ge=1, le=settings.CANDIDATE_MATCHES_TOP_K),
+) -> Any:
+    """
+    Get data for the candidate dashboard for the current authenticated candidate: their best
+    matching job postings, application counts by status and profile completeness.
+    Matches are precomputed in the background (see crud_job_match) and read with one query.
+    """
+    candidate_profile = current_user.candidate_profile
+    if not candidate_profile:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Candidate profile not found for this user."
+        )
+
+    user_name = f"{current_user.first_name or ''} {current_user.last_name or ''}".strip() or current_user.email
+    dashboard = await crud.job_match.get_candidate_dashboard(
+        db, candidate_profile_id=candidate_profile.id, top_matches=limit
+    )
+    has_resume = dashboard.pop("has_resume")
+    return schemas.CandidateDashboardData(
         user_name=user_name,
-        profile_completeness_percentage=simulated_profile_completeness,
-        total_active_jobs=total_active_jobs,
-        total_applicants=simulated_total_applicants,
-        total_ai_matched_candidates=simulated_total_ai_matched_candidates,
-        top_candidate_matches=simulated_top_candidate_matches,
-        recent_activity=simulated_recent_activity,
+        profile_completeness_percentage=candidate_profile_completeness(candidate_profile, has_resume),
+        **dashboard,
     )
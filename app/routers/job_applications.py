@@ -1,11 +1,13 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
 from app.database.database import get_db
-from app.schemas.job_application import JobApplicationCreate, JobApplicationRead
+from app.schemas.job_application import JobApplicationCreate, JobApplicationRead, JobApplicationStatusUpdate
+from app.schemas.pagination import Page
+from app.schemas.bulk import BulkItemError, BulkResult, partition_owned, validate_bulk_items
 from app.crud.crud_job_application import job_application as crud_job_application
-from app.models.candidate_profile import CandidateProfile
-from app.dependencies.deps import get_current_active_candidate
+from app.dependencies.deps import get_current_candidate_profile_id, get_current_recruiter_profile_id
 
 router = APIRouter(prefix="/job-applications", tags=["Job Applications"])
 
@@ -14,52 +16,85 @@ router = APIRouter(prefix="/job-applications", tags=["Job Applications"])
     response_model=JobApplicationRead,
     status_code=status.HTTP_201_CREATED,
     summary="Submit a new Job Application",
-    description="Allows an authenticated candidate to submit an application for a job posting.",
+    description="Allows an authenticated candidate to submit an application for a job posting. Applying twice to the same posting returns 409.",
 )
 async def submit_job_application(
     *,
     db: AsyncSession = Depends(get_db),
     application_in: JobApplicationCreate,
-    current_candidate: CandidateProfile = Depends(get_current_active_candidate),
+    candidate_profile_id: int = Depends(get_current_candidate_profile_id),
 ) -> JobApplicationRead:
     """
     Endpoint to submit a job application.
     The application is automatically linked to the currently authenticated candidate's profile.
     """
-    if not current_candidate:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Candidate profile not found or not authorized.",
-        )
-    
-    # Check if the candidate has already applied for this job
-    # existing_applications = await crud_job_application.get_multi_by_candidate_and_job(...)
-    # if existing_applications:
-    #     raise HTTPException(
-    #         status_code=status.HTTP_400_BAD_REQUEST,
-    #         detail="You have already applied for this job.",
-    #     )
-
     created_application = await crud_job_application.create_with_candidate(
-        db=db, obj_in=application_in, candidate_profile_id=current_candidate.id
+        db=db, obj_in=application_in, candidate_profile_id=candidate_profile_id
     )
+    if created_application is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="You have already applied for this job.",
+        )
     return created_application
 
 @router.get(
     "/my-applications",
-    response_model=List[JobApplicationRead],
+    response_model=Page[JobApplicationRead],
     summary="Get all applications for the current candidate",
 )
 async def get_my_applications(
     db: AsyncSession = Depends(get_db),
-    current_candidate: CandidateProfile = Depends(get_current_active_candidate),
-    skip: int = 0,
-    limit: int = 100,
-) -> List[JobApplicationRead]:
+    candidate_profile_id: int = Depends(get_current_candidate_profile_id),
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=settings.PAGE_MAX_LIMIT),
+) -> Page[JobApplicationRead]:
     """
-    Retrieves all job applications submitted by the currently authenticated candidate.
+    Retrieves the job applications submitted by the currently authenticated candidate,
+    newest first, one page at a time. Pass ``next_cursor`` back as ``cursor`` for the next page.
     """
-    applications = await crud_job_application.get_multi_by_candidate(
-        db=db, candidate_profile_id=current_candidate.id, skip=skip, limit=limit
+    applications, next_cursor = await crud_job_application.get_multi_by_candidate(
+        db=db, candidate_profile_id=candidate_profile_id, cursor=cursor, limit=limit
     )
-    return applications
+    return Page(items=applications, next_cursor=next_cursor)
+
+@router.patch(
+    "/bulk-status",
+    response_model=BulkResult,
+    summary="Update the status of many applications",
+    description="Lets a recruiter change the status of many applications to their job postings at once, e.g. to reject applicants in bulk.",
+)
+async def update_application_statuses_bulk(
+    *,
+    db: AsyncSession = Depends(get_db),
+    items: List[Dict[str, Any]] = Body(...),
+    recruiter_profile_id: int = Depends(get_current_recruiter_profile_id),
+) -> BulkResult:
+    """
+    Each item holds an application ``id`` and its new ``status``.
+    Items that are invalid, unknown or belong to another recruiter's postings are reported individually.
+    """
+    if len(items) > settings.BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"A bulk request can contain at most {settings.BULK_MAX_ITEMS} items.",
+        )
+    valid, errors = validate_bulk_items(items, JobApplicationStatusUpdate)
+    owners = await crud_job_application.get_recruiter_profile_ids(db=db, ids=[item.id for _, item in valid])
+    owned, ownership_errors = partition_owned(
+        [(index, item.id) for index, item in valid], owners, recruiter_profile_id
+    )
+    items_by_index = dict(valid)
+    updated = await crud_job_application.update_many(
+        db=db,
+        values=[{"id": application_id, "status": items_by_index[index].status} for index, application_id in owned]
+    )
+    # Applications deleted since their ownership was checked.
+    updated_ids = set(updated)
+    ownership_errors.extend(
+        BulkItemError(index=index, id=application_id, detail="Not found")
+        for index, application_id in owned if application_id not in updated_ids
+    )
+    errors = sorted(errors + ownership_errors, key=lambda error: error.index)
+    return BulkResult(succeeded=updated, errors=errors)
+
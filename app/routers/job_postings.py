@@ -1,23 +1,24 @@
-from typing import List, Any
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Dict, List, Any, Optional
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.database.database import get_db 
-from app.schemas.job_posting import JobPostingCreate, JobPostingRead, JobPostingUpdate
+from app.core.config import settings
+from app.schemas.job_posting import JobPostingCreate, JobPostingRead, JobPostingUpdate, JobPostingBulkUpdate
+from app.models.job_posting import ExperienceLevel, JobType
+from app.schemas.pagination import Page
+from app.schemas.bulk import BulkDeleteRequest, BulkItemError, BulkResult, partition_owned, validate_bulk_items
 from app.crud.crud_job_posting import job_posting as crud_job_posting 
-from app.crud.crud_job_posting import skills_string_to_list 
-from app.models.recruiter_profile import RecruiterProfile 
-from app.dependencies.deps import get_current_active_recruiter 
+from app.dependencies.deps import get_current_recruiter_profile_id
 
 
 router = APIRouter(prefix="/job-postings", tags=["Job Postings"])
 
-def enrich_job_posting_read(db_job_posting: Any) -> JobPostingRead:
-    """
-    Helper function to convert stored skills string to list for JobPostingRead schema.
-    """
-    job_posting_data = db_job_posting.__dict__
-    job_posting_data["skills"] = skills_string_to_list(db_job_posting.required_skills)
-    return JobPostingRead.model_validate(job_posting_data)
+def _check_bulk_size(count: int) -> None:
+    if count > settings.BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"A bulk request can contain at most {settings.BULK_MAX_ITEMS} items.",
+        )
 
 
 @router.post(
@@ -31,20 +32,122 @@ async def create_job_posting(
     *,
     db: AsyncSession = Depends(get_db),
     job_posting_in: JobPostingCreate,
-    current_recruiter: RecruiterProfile = Depends(get_current_active_recruiter),
+    recruiter_profile_id: int = Depends(get_current_recruiter_profile_id),
 ) -> JobPostingRead:
-    if not current_recruiter: 
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Recruiter profile not found or not authorized.",
-        )
-    
-    recruiter_profile_id = current_recruiter.id
-
     created_job = await crud_job_posting.create_with_recruiter_profile(
         db=db, obj_in=job_posting_in, recruiter_profile_id=recruiter_profile_id
     )
-    return enrich_job_posting_read(created_job)
+    return JobPostingRead.model_validate(created_job)
+
+
+@router.post(
+    "/bulk",
+    response_model=BulkResult,
+    summary="Create many Job Postings",
+    description="Creates job postings in batches for the authenticated recruiter. Invalid items are reported individually.",
+)
+async def create_job_postings_bulk(
+    *,
+    db: AsyncSession = Depends(get_db),
+    items: List[Dict[str, Any]] = Body(...),
+    recruiter_profile_id: int = Depends(get_current_recruiter_profile_id),
+) -> BulkResult:
+    _check_bulk_size(len(items))
+    valid, errors = validate_bulk_items(items, JobPostingCreate)
+    created = await crud_job_posting.create_many_with_recruiter_profile(
+        db=db, objs_in=[item for _, item in valid], recruiter_profile_id=recruiter_profile_id
+    )
+    return BulkResult(succeeded=[job.id for job in created], errors=errors)
+
+
+@router.patch(
+    "/bulk",
+    response_model=BulkResult,
+    summary="Update many Job Postings",
+    description="Updates job postings by ID in batches. Only the recruiter who created a posting can update it.",
+)
+async def update_job_postings_bulk(
+    *,
+    db: AsyncSession = Depends(get_db),
+    items: List[Dict[str, Any]] = Body(...),
+    recruiter_profile_id: int = Depends(get_current_recruiter_profile_id),
+) -> BulkResult:
+    _check_bulk_size(len(items))
+    valid, errors = validate_bulk_items(items, JobPostingBulkUpdate)
+    owners = await crud_job_posting.get_recruiter_profile_ids(db=db, ids=[item.id for _, item in valid])
+    owned, ownership_errors = partition_owned(
+        [(index, item.id) for index, item in valid], owners, recruiter_profile_id
+    )
+    items_by_index = dict(valid)
+    values: List[Dict[str, Any]] = []
+    index_by_id: Dict[int, int] = {}
+    for index, job_posting_id in owned:
+        row = items_by_index[index].model_dump(exclude_unset=True)
+        if len(row) > 1:
+            values.append(row)
+            index_by_id[job_posting_id] = index
+        else:
+            ownership_errors.append(BulkItemError(index=index, id=job_posting_id, detail="No fields to update"))
+
+    updated = await crud_job_posting.update_many(db=db, values=values)
+    # Postings deleted since their ownership was checked.
+    for job_posting_id in index_by_id.keys() - set(updated):
+        ownership_errors.append(BulkItemError(index=index_by_id[job_posting_id], id=job_posting_id, detail="Not found"))
+    errors = sorted(errors + ownership_errors, key=lambda error: error.index)
+    return BulkResult(succeeded=updated, errors=errors)
+
+
+@router.post(
+    "/bulk-delete",
+    response_model=BulkResult,
+    summary="Delete many Job Postings",
+    description="Deletes job postings by ID in batches. Only the recruiter who created a posting can delete it.",
+)
+async def delete_job_postings_bulk(
+    *,
+    db: AsyncSession = Depends(get_db),
+    request: BulkDeleteRequest,
+    recruiter_profile_id: int = Depends(get_current_recruiter_profile_id),
+) -> BulkResult:
+    _check_bulk_size(len(request.ids))
+    owners = await crud_job_posting.get_recruiter_profile_ids(db=db, ids=request.ids)
+    owned, errors = partition_owned(list(enumerate(request.ids)), owners, recruiter_profile_id)
+    deleted = await crud_job_posting.remove_many(db=db, ids=[job_posting_id for _, job_posting_id in owned])
+    return BulkResult(succeeded=deleted, errors=errors)
+
+
+@router.get(
+    "/search",
+    response_model=Page[JobPostingRead],
+    summary="Search Job Postings",
+    description=(
+        "Full-text search over title, skills and description, best matches first, one page at a time. "
+        "`q` accepts web-search syntax (quoted phrases, `or`, `-term`). Pass `next_cursor` back as `cursor` for the next page."
+    ),
+)
+async def search_job_postings(
+    db: AsyncSession = Depends(get_db),
+    q: str = Query(..., min_length=1, max_length=256),
+    location: Optional[str] = None,
+    type: Optional[JobType] = None,
+    experience_level: Optional[ExperienceLevel] = None,
+    salary_range: Optional[str] = None,
+    skills: List[str] = Query([]),
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=settings.PAGE_MAX_LIMIT),
+) -> Page[JobPostingRead]:
+    db_job_postings, next_cursor = await crud_job_posting.search(
+        db=db,
+        query=q,
+        location=location,
+        type=type,
+        experience_level=experience_level,
+        salary_range=salary_range,
+        skills=skills,
+        cursor=cursor,
+        limit=limit,
+    )
+    return Page(items=[JobPostingRead.model_validate(jp) for jp in db_job_postings], next_cursor=next_cursor)
 
 
 @router.get(
@@ -63,48 +166,48 @@ async def read_job_posting(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Job posting not found"
         )
-    return enrich_job_posting_read(db_job_posting)
+    return JobPostingRead.model_validate(db_job_posting)
 
 
 @router.get(
     "/",
-    response_model=List[JobPostingRead],
+    response_model=Page[JobPostingRead],
     summary="Get all Job Postings",
-    description="Retrieves a list of all job postings, with pagination.",
+    description=(
+        "Retrieves job postings newest first, one page at a time. Pass `next_cursor` back as `cursor` for the next page. "
+        "Repeat `skills` to keep only postings requiring all of the given skills."
+    ),
 )
 async def read_job_postings(
     db: AsyncSession = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
-) -> List[JobPostingRead]:
-    db_job_postings = await crud_job_posting.get_multi(db=db, skip=skip, limit=limit)
-    return [enrich_job_posting_read(jp) for jp in db_job_postings]
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=settings.PAGE_MAX_LIMIT),
+    skills: List[str] = Query([]),
+) -> Page[JobPostingRead]:
+    db_job_postings, next_cursor = await crud_job_posting.get_page(
+        db=db, cursor=cursor, limit=limit, skills=skills
+    )
+    return Page(items=[JobPostingRead.model_validate(jp) for jp in db_job_postings], next_cursor=next_cursor)
 
 
 @router.get(
     "/by-recruiter/me", 
-    response_model=List[JobPostingRead],
+    response_model=Page[JobPostingRead],
     summary="Get Job Postings by the current authenticated Recruiter",
-    description="Retrieves a list of job postings created by the currently authenticated recruiter.",
+    description="Retrieves the job postings created by the currently authenticated recruiter, newest first, one page at a time.",
 )
 async def read_job_postings_by_current_recruiter(
     *,
     db: AsyncSession = Depends(get_db),
-    current_recruiter: RecruiterProfile = Depends(get_current_active_recruiter),
-    skip: int = 0,
-    limit: int = 100,
-) -> List[JobPostingRead]:
-    if not current_recruiter:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Recruiter profile not found or not authorized.",
-        )
-    
-    recruiter_profile_id = current_recruiter.id
-    db_job_postings = await crud_job_posting.get_by_recruiter_profile_id(
-        db=db, recruiter_profile_id=recruiter_profile_id, skip=skip, limit=limit
+    recruiter_profile_id: int = Depends(get_current_recruiter_profile_id),
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=settings.PAGE_MAX_LIMIT),
+    skills: List[str] = Query([]),
+) -> Page[JobPostingRead]:
+    db_job_postings, next_cursor = await crud_job_posting.get_by_recruiter_profile_id(
+        db=db, recruiter_profile_id=recruiter_profile_id, cursor=cursor, limit=limit, skills=skills
     )
-    return [enrich_job_posting_read(jp) for jp in db_job_postings]
+    return Page(items=[JobPostingRead.model_validate(jp) for jp in db_job_postings], next_cursor=next_cursor)
 
 
 @router.put(
@@ -118,14 +221,14 @@ async def update_job_posting(
     db: AsyncSession = Depends(get_db),
     job_posting_id: int,
     job_posting_in: JobPostingUpdate,
-    current_recruiter: RecruiterProfile = Depends(get_current_active_recruiter),
+    recruiter_profile_id: int = Depends(get_current_recruiter_profile_id),
 ) -> JobPostingRead:
     db_job_posting = await crud_job_posting.get(db=db, id=job_posting_id)
     if not db_job_posting:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Job posting not found"
         )
-    if db_job_posting.recruiter_profile_id != current_recruiter.id:
+    if db_job_posting.recruiter_profile_id != recruiter_profile_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to update this job posting",
@@ -134,7 +237,7 @@ async def update_job_posting(
     updated_job_posting = await crud_job_posting.update(
         db=db, db_obj=db_job_posting, obj_in=job_posting_in
     )
-    return enrich_job_posting_read(updated_job_posting)
+    return JobPostingRead.model_validate(updated_job_posting)
 
 
 @router.delete(
@@ -147,14 +250,14 @@ async def delete_job_posting(
     *,
     db: AsyncSession = Depends(get_db),
     job_posting_id: int,
-    current_recruiter: RecruiterProfile = Depends(get_current_active_recruiter),
+    recruiter_profile_id: int = Depends(get_current_recruiter_profile_id),
 ) -> None:
     db_job_posting = await crud_job_posting.get(db=db, id=job_posting_id)
     if not db_job_posting:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Job posting not found"
         )
-    if db_job_posting.recruiter_profile_id != current_recruiter.id:
+    if db_job_posting.recruiter_profile_id != recruiter_profile_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to delete this job posting",
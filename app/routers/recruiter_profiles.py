@@ -111,8 +111,6 @@ async def update_recruiter_profile_for_current_user(
 
     updated_profile = await crud.recruiter_profile.update(db=db, db_obj=profile, obj_in=profile_in)
 
-    await db.refresh(current_user, attribute_names=['recruiter_profile'])
-
     return schemas.RecruiterProfileRead(
         id=updated_profile.id,
         user_id=updated_profile.user_id,
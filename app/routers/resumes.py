@@ -4,7 +4,7 @@ import pypdf # pip install pypdf
 import io
 
 from app.database.database import get_db
-from app.models.candidate_profile import CandidateProfile 
+from app.models.user import User
 # Assuming you have a CRUD function to update a candidate
 from app.crud.crud_candidate_profile import candidate_profile as crud_candidate
 from app.dependencies.deps import get_current_active_candidate
@@ -22,7 +22,7 @@ async def upload_resume(
     *,
     db: AsyncSession = Depends(get_db),
     file: UploadFile = File(...),
-    current_candidate: CandidateProfile = Depends(get_current_active_candidate),
+    current_user: User = Depends(get_current_active_candidate),
 ) -> dict:
     """
     This endpoint handles the one-time action of a candidate uploading their resume.
@@ -30,7 +30,15 @@ async def upload_resume(
     2. Extracts the raw text from the PDF.
     3. Saves the extracted text to the candidate's profile in the database.
     4. Optionally, you could save the original PDF to a file storage (e.g., S3) here.
+    Saving the text queues a background refresh of the candidate's job matches.
     """
+    current_candidate = current_user.candidate_profile
+    if not current_candidate:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Candidate profile not found for this user."
+        )
+
     if file.content_type != "application/pdf":
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -65,6 +73,8 @@ async def upload_resume(
             "text_length": len(extracted_text)
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error during resume processing: {e}")
         raise HTTPException(
@@ -46,9 +46,10 @@ async def read_current_recruiter_data(
 
 @router.get("/admin-only", response_model=schemas.User)
 async def read_admin_only_data(
-    current_superuser: schemas.User = Depends(deps.get_current_active_superuser),
+    current_superuser: schemas.TokenPayload = Depends(deps.get_current_active_superuser),
+    current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """
     Access point for superusers only.
     """
-    return current_superuser
+    return current_user
@@ -1,6 +1,6 @@
 from app.models.user import UserRole 
 from .user import UserBase, UserCreate, UserUpdate, User
-from .token import Token, TokenData
+from .token import Token, TokenData, TokenPayload
 from .cv import ExtractedCVData, CVAnalysisResponse 
 
 from .candidate_profile import (
@@ -22,30 +22,37 @@ from .job_posting import (
     JobPostingCreate,
     JobPostingUpdate,
     JobPostingRead,
+    JobPostingBulkUpdate,
     JobType,
     ExperienceLevel,
 )
 
 from .dashboard import (
     RecruiterDashboardData,
+    CandidateDashboardData,
     CandidateJobMatch,
     RecruiterCandidateMatch,
     RecentActivityItem,
 )
 
+from .pagination import Page
+from .bulk import BulkItemError, BulkResult, BulkDeleteRequest, validate_bulk_items, partition_owned
+
 from .experience import ExperienceData
 from .education import EducationData
-from .skill import CandidateSkillBase
+from .skill import CandidateSkillBase, SkillBase, SkillCreate, SkillRead
 
 __all__ = [
     "UserBase", "UserCreate", "UserUpdate", "User", "UserRole",
-    "Token", "TokenData",
+    "Token", "TokenData", "TokenPayload",
     "ExtractedCVData", "CVAnalysisResponse",
     "CandidateProfileBase", "CandidateProfileCreate", "CandidateProfileUpdate", "CandidateProfileRead",
     "RecruiterProfileBase", "RecruiterProfileCreate", "RecruiterProfileUpdate", "RecruiterProfileRead",
-    "JobPostingBase", "JobPostingCreate", "JobPostingUpdate", "JobPostingRead", "JobType", "ExperienceLevel",
-    "RecruiterDashboardData", "CandidateJobMatch", "RecruiterCandidateMatch", "RecentActivityItem",
+    "JobPostingBase", "JobPostingCreate", "JobPostingUpdate", "JobPostingRead", "JobPostingBulkUpdate", "JobType", "ExperienceLevel",
+    "Page",
+    "BulkItemError", "BulkResult", "BulkDeleteRequest", "validate_bulk_items", "partition_owned",
+    "RecruiterDashboardData", "CandidateDashboardData", "CandidateJobMatch", "RecruiterCandidateMatch", "RecentActivityItem",
     "ExperienceData",
     "EducationData",
-    "CandidateSkillBase",
+    "CandidateSkillBase", "SkillBase", "SkillCreate", "SkillRead",
 ]
@@ -0,0 +1,66 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, TypeVar
+from pydantic import BaseModel, ValidationError
+
+SchemaType = TypeVar("SchemaType", bound=BaseModel)
+
+
+class BulkItemError(BaseModel):
+    """Why one item of a bulk request was not applied."""
+    index: int
+    id: Optional[int] = None
+    detail: Any
+
+
+class BulkResult(BaseModel):
+    """Outcome of a bulk request: IDs that were written and per-item errors for the rest."""
+    succeeded: List[int] = []
+    errors: List[BulkItemError] = []
+
+
+class BulkDeleteRequest(BaseModel):
+    ids: List[int]
+
+
+def validate_bulk_items(
+    items: Sequence[Dict[str, Any]], schema: Type[SchemaType]
+) -> Tuple[List[Tuple[int, SchemaType]], List[BulkItemError]]:
+    """
+    Validates each raw item against ``schema`` on its own, so one bad item is reported
+    instead of rejecting the whole request. Returns (index, item) pairs and errors.
+    """
+    valid: List[Tuple[int, SchemaType]] = []
+    errors: List[BulkItemError] = []
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, schema.model_validate(item)))
+        except ValidationError as e:
+            item_id = item.get("id") if isinstance(item, dict) else None
+            errors.append(BulkItemError(
+                index=index,
+                id=item_id if isinstance(item_id, int) else None,
+                detail=e.errors(include_url=False, include_context=False, include_input=False)
+            ))
+    return valid, errors
+
+
+def partition_owned(
+    ids: Sequence[Tuple[int, int]], owners: Dict[int, int], owner_id: int
+) -> Tuple[List[Tuple[int, int]], List[BulkItemError]]:
+    """
+    Splits (index, id) pairs into those owned by ``owner_id`` and errors for IDs that
+    do not exist, belong to someone else or repeat an earlier item.
+    """
+    owned: List[Tuple[int, int]] = []
+    errors: List[BulkItemError] = []
+    seen = set()
+    for index, item_id in ids:
+        if item_id in seen:
+            errors.append(BulkItemError(index=index, id=item_id, detail="Duplicate ID in request"))
+        elif item_id not in owners:
+            errors.append(BulkItemError(index=index, id=item_id, detail="Not found"))
+        elif owners[item_id] != owner_id:
+            errors.append(BulkItemError(index=index, id=item_id, detail="Not authorized"))
+        else:
+            owned.append((index, item_id))
+        seen.add(item_id)
+    return owned, errors
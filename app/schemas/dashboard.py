@@ -1,5 +1,5 @@
 from pydantic import BaseModel, HttpUrl
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 class CandidateJobMatch(BaseModel):
@@ -11,6 +11,7 @@ class CandidateJobMatch(BaseModel):
     salary: Optional[str] = None
     skills: List[str] = []
     match_reasons: List[str] = [] 
+    match_score: Optional[int] = None
 
 
 class RecruiterCandidateMatch(BaseModel):
@@ -64,9 +65,20 @@ class RecruiterDashboardData(BaseModel):
     total_active_jobs: int
     total_applicants: int
     total_ai_matched_candidates: int
+    # Applicants per ApplicationStatus value.
+    applicants_by_status: Dict[str, int] = {}
     top_candidate_matches: List[RecruiterCandidateMatch] = []
     recent_activity: List[RecentActivityItem] = []
 
     model_config = {"from_attributes": True}
 
 
+class CandidateDashboardData(BaseModel):
+    user_name: str
+    profile_completeness_percentage: int
+    total_applications: int
+    # Applications per ApplicationStatus value.
+    applications_by_status: Dict[str, int] = {}
+    top_job_matches: List[CandidateJobMatch] = []
+
+    model_config = {"from_attributes": True}
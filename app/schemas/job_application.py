@@ -2,6 +2,8 @@ from pydantic import BaseModel, ConfigDict, EmailStr
 from typing import Optional
 from datetime import datetime
 from app.models.job_application import ApplicationStatus
+from app.schemas.job_posting import JobPostingRead
+from app.schemas.candidate_profile import CandidateProfileRead
 
 class JobApplicationBase(BaseModel):
     """Base Pydantic schema for job application data."""
@@ -24,6 +26,11 @@ class JobApplicationUpdate(BaseModel):
     status: ApplicationStatus
 
 
+class JobApplicationStatusUpdate(JobApplicationUpdate):
+    """One item of a bulk status update."""
+    id: int
+
+
 class JobApplicationRead(JobApplicationBase):
     """Schema for reading/returning a Job Application from the API."""
     id: int
@@ -34,8 +41,5 @@ class JobApplicationRead(JobApplicationBase):
 
 
 class JobApplicationReadDetailed(JobApplicationRead):
-    from app.schemas.job_posting import JobPostingRead 
-    from app.schemas.candidate_profile import CandidateProfileRead
-
     job_posting: JobPostingRead
     candidate: CandidateProfileRead
@@ -1,6 +1,6 @@
 from typing import List, Optional
 from datetime import datetime
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, field_validator
 from app.models.job_posting import JobType, ExperienceLevel
 
 class JobPostingBase(BaseModel):
@@ -29,6 +29,10 @@ class JobPostingUpdate(JobPostingBase):
     description: Optional[str] = None
     skills: Optional[List[str]] = None  
 
+class JobPostingBulkUpdate(JobPostingUpdate):
+    """One item of a bulk Job Posting update."""
+    id: int
+
 class JobPostingRead(JobPostingBase):
     """Schema for reading/returning a Job Posting."""
     id: int 
@@ -36,7 +40,13 @@ class JobPostingRead(JobPostingBase):
     created_at: datetime
     updated_at: datetime
     skills: List[str] = []
-    
+
+    @field_validator("skills", mode="before")
+    @classmethod
+    def skill_names(cls, value):
+        """Accepts the model's Skill objects as well as plain names."""
+        return [getattr(skill, "name", skill) for skill in value or []]
+
 class JobPostingListResponse(BaseModel):
     items: List[JobPostingRead]
     total: int
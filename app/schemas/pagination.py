@@ -0,0 +1,13 @@
+from typing import Generic, List, Optional, TypeVar
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """
+    One page of a cursor-paginated listing.
+    Pass ``next_cursor`` back as ``cursor`` to get the following page; it is None on the last page.
+    """
+    items: List[T]
+    next_cursor: Optional[str] = None
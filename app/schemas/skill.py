@@ -1,6 +1,20 @@
 from typing import Optional
 from datetime import datetime
 from pydantic import BaseModel, ConfigDict
+
+class SkillBase(BaseModel):
+    """Base schema for an entry of the skill dictionary."""
+    name: str
+    model_config = ConfigDict(from_attributes=True)
+
+class SkillCreate(SkillBase):
+    """Schema for adding a skill to the dictionary."""
+    pass
+
+class SkillRead(SkillBase):
+    """Schema for reading/returning a skill of the dictionary."""
+    id: int
+
 class CandidateSkillBase(BaseModel):
     """Base schema for Candidate Skill data."""
     name: str
@@ -20,6 +34,7 @@ class CandidateSkillRead(CandidateSkillBase):
     """Schema for reading/returning a Candidate Skill, including DB-generated fields."""
     id: int
     candidate_profile_id: int
+    skill_id: Optional[int] = None
     created_at: datetime
     updated_at: datetime
     model_config = ConfigDict(from_attributes=True)
@@ -16,4 +16,16 @@ class Token(BaseModel):
 
 class TokenData(BaseModel):
     email: Optional[str] = None 
-    roles: Optional[List[str]] = [] 
\ No newline at end of file
+    roles: Optional[List[str]] = [] 
+
+
+class TokenPayload(BaseModel):
+    """Verified claims of an access token."""
+    sub: str
+    uid: Optional[int] = None
+    role: Optional[str] = None
+    pid: Optional[int] = None
+    su: bool = False
+    ver: Optional[int] = None
+    exp: Optional[int] = None
+    jti: Optional[str] = None
\ No newline at end of file
@@ -1,4 +1,8 @@
-from fastapi import FastAPI
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.routers import auth
 from app.routers import users
@@ -11,14 +15,76 @@ from app.routers import admin
 from app.routers import ai_recruiter
 from app.routers import job_applications
 from app.core.config import settings
+from app.core.pagination import InvalidCursorError
+from app import crud
+from app.database.database import AsyncSessionLocal
 
 print(f"Database URL from settings: {settings.DATABASE_URL}")
 print(f"Secret Key loaded: {'Yes' if settings.SECRET_KEY else 'No'}")
 
+logger = logging.getLogger(__name__)
+
+async def reconcile_counters_periodically(interval: int) -> None:
+    """Repairs drift of the denormalized counters every ``interval`` seconds."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with AsyncSessionLocal() as db:
+                repaired = await crud.stats.reconcile_counters(db)
+                await db.commit()
+            if any(repaired.values()):
+                logger.warning("Repaired drifted counters: %s", repaired)
+        except Exception:
+            logger.exception("Counter reconciliation failed")
+
+async def rebuild_revocations_periodically(interval: int) -> None:
+    """Drops expired revoked tokens from the table and the Bloom filter every ``interval`` seconds."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with AsyncSessionLocal() as db:
+                await crud.revoked_token.rebuild(db)
+        except Exception:
+            logger.exception("Revoked token rebuild failed")
+
+async def refresh_job_matches_continuously(delay: float) -> None:
+    """Recomputes queued candidate job matches, waiting ``delay`` seconds to batch bursts of writes."""
+    while True:
+        await crud.job_match.wait_for_pending()
+        await asyncio.sleep(delay)
+        try:
+            async with AsyncSessionLocal() as db:
+                await crud.job_match.refresh_pending(db)
+                await db.commit()
+        except Exception:
+            logger.exception("Job match refresh failed")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load revoked token ids into the in-process Bloom filter before serving requests.
+    async with AsyncSessionLocal() as db:
+        await crud.revoked_token.rebuild(db)
+    reconciler = None
+    if settings.COUNTER_RECONCILE_SECONDS > 0:
+        reconciler = asyncio.create_task(reconcile_counters_periodically(settings.COUNTER_RECONCILE_SECONDS))
+    revocation_rebuilder = None
+    if settings.REVOCATION_REBUILD_SECONDS > 0:
+        revocation_rebuilder = asyncio.create_task(rebuild_revocations_periodically(settings.REVOCATION_REBUILD_SECONDS))
+    match_refresher = asyncio.create_task(
+        refresh_job_matches_continuously(settings.CANDIDATE_MATCH_REFRESH_DELAY_SECONDS)
+    )
+    yield
+    for task in (reconciler, revocation_rebuilder, match_refresher):
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
 app = FastAPI(
     title="AI Match Connect API",
     description="API for AI Match Connect platform, connecting candidates and recruiters.",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 
@@ -36,6 +102,10 @@ app.add_middleware(
     allow_headers=["*"],    
 )
 
+@app.exception_handler(InvalidCursorError)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursorError) -> JSONResponse:
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
+
 @app.get("/health", status_code=200)
 def health_check():
     """
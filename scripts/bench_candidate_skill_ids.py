@@ -0,0 +1,64 @@
+"""
+Cost of crud.job_match.get_candidate_skill_ids, the skill lookup of the AI search
+pre-filter, over candidates whose resumes name skills of a large skill dictionary.
+
+    python scripts/bench_candidate_skill_ids.py [--candidates 2000] [--skills 5000] [--calls 5]
+"""
+import argparse
+import asyncio
+import random
+
+import benchlib
+
+from sqlalchemy import insert  # noqa: E402
+
+from app import crud  # noqa: E402
+from app.database.database import AsyncSessionLocal  # noqa: E402
+from app.models import CandidateProfile, CandidateSkill, Skill, User, UserRole  # noqa: E402
+
+
+async def seed(db, candidates: int, skills: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    words = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(3, 10))) for _ in range(20000)]
+    names = list(dict.fromkeys(" ".join(rng.sample(words[:2000], rng.choice((1, 1, 2, 3)))) for _ in range(skills)))
+    await db.execute(insert(Skill), [
+        {"id": i, "name": name.title(), "normalized_name": name} for i, name in enumerate(names, 1)
+    ])
+    await db.execute(insert(User), [
+        {"id": i, "email": f"user{i}@example.com", "hashed_password": "x", "role": UserRole.candidate}
+        for i in range(1, candidates + 1)
+    ])
+    await db.execute(insert(CandidateProfile), [
+        {"id": i, "user_id": i, "resume_text": " ".join(rng.choices(words, k=rng.randint(300, 800)) + rng.sample(names, 10))}
+        for i in range(1, candidates + 1)
+    ])
+    await db.execute(insert(CandidateSkill), [
+        {"candidate_profile_id": i, "skill_id": skill_id, "name": names[skill_id - 1]}
+        for i in range(1, candidates + 1) for skill_id in rng.sample(range(1, len(names) + 1), 5)
+    ])
+    await db.commit()
+
+
+async def main(candidates: int, skills: int, calls: int) -> None:
+    await benchlib.fresh_schema()
+    async with AsyncSessionLocal() as db:
+        await seed(db, candidates, skills)
+        ids = list(range(1, candidates + 1))
+        resume_texts = await crud.candidate_profile.get_resume_texts(db, ids=ids)
+
+        samples = await benchlib.timed(lambda: crud.job_match.get_candidate_skill_ids(db, ids), calls)
+        print(f"{'loading resumes':<16} {benchlib.summary(samples)}")
+        samples = await benchlib.timed(
+            lambda: crud.job_match.get_candidate_skill_ids(db, ids, resume_texts=resume_texts), calls
+        )
+        print(f"{'resumes passed':<16} {benchlib.summary(samples)}")
+    await benchlib.engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--candidates", type=int, default=2000)
+    parser.add_argument("--skills", type=int, default=5000)
+    parser.add_argument("--calls", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.candidates, args.skills, args.calls))
@@ -0,0 +1,75 @@
+"""
+Page latency against page depth for the job postings listing: OFFSET/LIMIT (as before the
+cursors) against keyset pagination on (created_at, id) through crud.job.get_page.
+
+    python scripts/bench_pagination.py [--rows 200000] [--limit 20] [--repeat 5]
+"""
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+
+import benchlib
+
+from sqlalchemy import insert, select  # noqa: E402
+
+from app import crud  # noqa: E402
+from app.core.pagination import encode_cursor  # noqa: E402
+from app.database.database import AsyncSessionLocal  # noqa: E402
+from app.models import ExperienceLevel, JobPosting, JobType, RecruiterProfile, User, UserRole  # noqa: E402
+
+SEED_CHUNK = 10000
+
+
+async def seed(db, rows: int) -> None:
+    await db.execute(insert(User), [{"id": 1, "email": "recruiter@example.com", "hashed_password": "x", "role": UserRole.recruiter}])
+    await db.execute(insert(RecruiterProfile), [{"id": 1, "user_id": 1, "company_name": "Company"}])
+    now = datetime.utcnow()
+    table = JobPosting.__table__
+    for start in range(0, rows, SEED_CHUNK):
+        await db.execute(insert(table), [
+            {"recruiter_profile_id": 1, "title": f"Job {i}", "location": "Paris", "type": JobType.full_time,
+             "experience_level": ExperienceLevel.mid, "description": "APIs",
+             "created_at": now - timedelta(seconds=i), "updated_at": now}
+            for i in range(start, min(rows, start + SEED_CHUNK))
+        ])
+    await db.commit()
+
+
+async def main(rows: int, limit: int, repeat: int) -> None:
+    await benchlib.fresh_schema()
+    async with AsyncSessionLocal() as db:
+        await seed(db, rows)
+        ordered = select(JobPosting).order_by(JobPosting.created_at.desc(), JobPosting.id.desc())
+        print(f"{rows} job postings, {limit} per page, best of {repeat}")
+        print(f"{'depth':>8} {'offset':>10} {'keyset':>10}")
+        for depth in sorted({0, 1000, 10000, rows // 4, rows // 2, rows - limit}):
+            cursor = None
+            if depth:
+                # The cursor the previous page would have returned: the sort key of row ``depth - 1``.
+                last = (await db.execute(
+                    select(JobPosting.created_at, JobPosting.id)
+                    .order_by(JobPosting.created_at.desc(), JobPosting.id.desc()).offset(depth - 1).limit(1)
+                )).one()
+                cursor = encode_cursor([last.created_at, last.id])
+
+            async def by_offset():
+                return (await db.execute(ordered.offset(depth).limit(limit))).scalars().all()
+
+            async def by_keyset():
+                return (await crud.job.get_page(db, cursor=cursor, limit=limit))[0]
+
+            assert [p.id for p in await by_offset()] == [p.id for p in await by_keyset()]
+            offset_time = min(await benchlib.timed(by_offset, repeat))
+            keyset_time = min(await benchlib.timed(by_keyset, repeat))
+            db.expunge_all()
+            print(f"{depth:>8} {offset_time * 1000:>8.2f}ms {keyset_time * 1000:>8.2f}ms")
+    await benchlib.engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.limit, args.repeat))
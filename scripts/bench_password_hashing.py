@@ -0,0 +1,78 @@
+"""
+Latency of an unrelated endpoint (GET /job-postings/) while idle and during a login storm,
+with bcrypt on the password hash pool and, for comparison, inline on the event loop as
+before the pool. A login holds a database connection while it waits for its hash, so keep
+--logins under DB_POOL_SIZE + DB_MAX_OVERFLOW to measure the event loop, not the pool.
+
+    python scripts/bench_password_hashing.py [--logins 12] [--probes 200]
+"""
+import argparse
+import asyncio
+import os
+import time
+
+os.environ["LOGIN_RATE_LIMIT_PER_IP"] = "1000000"
+
+import benchlib  # noqa: E402
+
+import httpx  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from app.core import security  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.database.database import AsyncSessionLocal  # noqa: E402
+from app.models import User, UserRole  # noqa: E402
+from main import app  # noqa: E402
+
+PASSWORD = "secret-password"
+
+
+async def run_inline(fn, *args):
+    return fn(*args)
+
+
+async def storm(client: httpx.AsyncClient, logins: int) -> list:
+    """Probes the unrelated endpoint back to back until every login of the storm is done."""
+    async def login(i: int) -> None:
+        response = await client.post("/auth/token", data={"username": f"user{i}@example.com", "password": PASSWORD})
+        assert response.status_code == 200, response.text
+
+    storming = asyncio.gather(*(login(i) for i in range(logins)))
+    samples = []
+    while not storming.done():
+        started = time.perf_counter()
+        await client.get("/job-postings/")
+        samples.append(time.perf_counter() - started)
+    await storming
+    return samples
+
+
+async def main(logins: int, probes: int) -> None:
+    await benchlib.fresh_schema()
+    hashed = security.get_password_hash(PASSWORD)
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(User), [
+            {"email": f"user{i}@example.com", "hashed_password": hashed, "role": UserRole.candidate}
+            for i in range(logins)
+        ])
+        await db.commit()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url=f"http://bench{settings.API_V1_STR}") as client:
+        print("idle:           ", benchlib.summary(await benchlib.timed(lambda: client.get("/job-postings/"), probes)))
+        print("storm, pool:    ", benchlib.summary(await storm(client, logins)))
+        pool_run = security.password_hash_pool.run
+        security.password_hash_pool.run = run_inline
+        try:
+            print("storm, inline:  ", benchlib.summary(await storm(client, logins)))
+        finally:
+            security.password_hash_pool.run = pool_run
+    await benchlib.engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--logins", type=int, default=12)
+    parser.add_argument("--probes", type=int, default=200, help="requests of the idle baseline")
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.probes))
@@ -0,0 +1,89 @@
+"""
+Latency of crud_dashboard.get_recruiter_dashboard for one recruiter with many applications
+(the dashboard cache is bypassed: every call runs the query).
+
+    python scripts/bench_recruiter_dashboard.py [--postings 20] [--applications 10000] [--calls 200]
+"""
+import argparse
+import asyncio
+import random
+from datetime import datetime, timedelta
+
+import benchlib
+
+from sqlalchemy import insert  # noqa: E402
+
+from app.crud import crud_dashboard, crud_job_application  # noqa: E402
+from app.database.database import AsyncSessionLocal  # noqa: E402
+from app.models import (  # noqa: E402
+    CandidateProfile, CandidateSkill, ExperienceLevel, JobApplication, JobPosting, JobType, RecruiterProfile, Skill,
+    User, UserRole, job_posting_skills,
+)
+
+SKILLS = 50
+SKILLS_PER_POSTING = 6
+SKILLS_PER_CANDIDATE = 8
+SEED_CHUNK = 5000
+
+
+async def insert_chunked(db, target, rows) -> None:
+    for start in range(0, len(rows), SEED_CHUNK):
+        await db.execute(insert(target), rows[start:start + SEED_CHUNK])
+
+
+async def seed(db, postings: int, applications: int) -> None:
+    rng = random.Random(0)
+    candidates = max(1, applications // 4)
+    now = datetime.utcnow()
+    await insert_chunked(db, User, [
+        {"id": i, "email": f"user{i}@example.com", "hashed_password": "x",
+         "role": UserRole.recruiter if i == 1 else UserRole.candidate}
+        for i in range(1, candidates + 2)
+    ])
+    await db.execute(insert(RecruiterProfile), [{"id": 1, "user_id": 1, "company_name": "Company"}])
+    await insert_chunked(db, CandidateProfile, [{"id": i, "user_id": i + 1} for i in range(1, candidates + 1)])
+    await insert_chunked(db, Skill, [{"id": i, "name": f"Skill {i}", "normalized_name": f"skill {i}"} for i in range(1, SKILLS + 1)])
+    await insert_chunked(db, JobPosting, [
+        {"id": i, "recruiter_profile_id": 1, "title": f"Job {i}", "location": "Paris", "type": JobType.full_time,
+         "experience_level": ExperienceLevel.mid, "description": "APIs"}
+        for i in range(1, postings + 1)
+    ])
+    await insert_chunked(db, job_posting_skills, [
+        {"job_posting_id": p, "skill_id": s}
+        for p in range(1, postings + 1) for s in rng.sample(range(1, SKILLS + 1), SKILLS_PER_POSTING)
+    ])
+    await insert_chunked(db, CandidateSkill, [
+        {"candidate_profile_id": c, "skill_id": s, "name": f"Skill {s}"}
+        for c in range(1, candidates + 1) for s in rng.sample(range(1, SKILLS + 1), SKILLS_PER_CANDIDATE)
+    ])
+    pairs = rng.sample([(p, c) for p in range(1, postings + 1) for c in range(1, candidates + 1)], applications)
+    await insert_chunked(db, JobApplication, [
+        {"job_posting_id": p, "candidate_profile_id": c, "full_name": f"Candidate {c}", "email": f"user{c + 1}@example.com",
+         "cover_letter": "Hello", "applied_at": now - timedelta(seconds=i)}
+        for i, (p, c) in enumerate(pairs)
+    ])
+    await crud_job_application.refresh_scores(db, job_posting_ids=range(1, postings + 1))
+    await db.commit()
+
+
+async def main(postings: int, applications: int, calls: int) -> None:
+    await benchlib.fresh_schema()
+    async with AsyncSessionLocal() as db:
+        await seed(db, postings, applications)
+        print(f"{postings} postings, {applications} applications")
+
+        async def load():
+            return await crud_dashboard.get_recruiter_dashboard(db, recruiter_profile_id=1)
+
+        await load()
+        print("get_recruiter_dashboard:", benchlib.summary(await benchlib.timed(load, calls)))
+    await benchlib.engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--postings", type=int, default=20)
+    parser.add_argument("--applications", type=int, default=10000)
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.postings, args.applications, args.calls))
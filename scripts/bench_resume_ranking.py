@@ -0,0 +1,59 @@
+"""
+Per-search cost of the local BM25 stage of AI search over synthetic resumes: indexing the
+resume texts on every search (as before the term cache) against building the index from
+resume_term_cache, cold (first search) and warm. "auto" mode with a pre-filter used to
+index the resumes twice when the AI service was unavailable.
+
+    python scripts/bench_resume_ranking.py [--resumes 2000] [--searches 20]
+"""
+import argparse
+import random
+import time
+
+import benchlib
+
+from app.core.ranking import BM25Index, resume_term_cache, weighted_query  # noqa: E402
+
+
+def resumes(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    words = [
+        "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(3, 10))) for _ in range(20000)
+    ]
+    # Zipf-like word frequencies, 300-800 words per resume.
+    weights = [1 / rank for rank in range(1, len(words) + 1)]
+    texts = {i: " ".join(rng.choices(words, weights, k=rng.randint(300, 800))) for i in range(1, count + 1)}
+    return texts, weighted_query([(" ".join(words[10:60:5]), 2.0), (" ".join(words[500:520]), 3.0)])
+
+
+def search(index: BM25Index, query) -> None:
+    index.rank(query, limit=len(index))
+
+
+def run(name: str, build, query, searches: int) -> None:
+    samples = []
+    for _ in range(searches):
+        started = time.perf_counter()
+        search(build(), query)
+        samples.append(time.perf_counter() - started)
+    print(f"{name:<22} {benchlib.summary(samples)}")
+
+
+def main(count: int, searches: int) -> None:
+    texts, query = resumes(count)
+    resume_term_cache.entries.clear()
+
+    run("texts, every search", lambda: BM25Index.from_texts(texts), query, searches)
+    started = time.perf_counter()
+    search(resume_term_cache.index(texts), query)
+    print(f"{'term cache, cold':<22} {(time.perf_counter() - started) * 1000:.2f} ms")
+    run("term cache, warm", lambda: resume_term_cache.index(texts), query, searches)
+    print("cache:", resume_term_cache.stats())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=2000)
+    parser.add_argument("--searches", type=int, default=20)
+    args = parser.parse_args()
+    main(args.resumes, args.searches)
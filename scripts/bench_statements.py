@@ -0,0 +1,91 @@
+"""
+Per-call ORM overhead of the hot lookups: the prebuilt statements executed with bound
+parameters against the same select and loader options rebuilt on every call (as before).
+
+    python scripts/bench_statements.py [--calls 3000]
+"""
+import argparse
+import asyncio
+import time
+
+import benchlib
+
+from sqlalchemy import insert  # noqa: E402
+from sqlalchemy.future import select  # noqa: E402
+from sqlalchemy.orm import selectinload  # noqa: E402
+
+from app import crud  # noqa: E402
+from app.database.database import AsyncSessionLocal  # noqa: E402
+from app.models import CandidateProfile, RecruiterProfile, User, UserRole  # noqa: E402
+
+EMAIL = "candidate@example.com"
+
+
+def user_graph_by_email(email: str):
+    return select(User).where(User.email == email).options(
+        selectinload(User.candidate_profile).options(
+            selectinload(CandidateProfile.experiences),
+            selectinload(CandidateProfile.educations),
+            selectinload(CandidateProfile.candidate_skills)
+        ),
+        selectinload(User.recruiter_profile).options(
+            selectinload(RecruiterProfile.job_postings)
+        ),
+    )
+
+
+def profile_by_user_id(user_id: int):
+    return select(CandidateProfile).where(CandidateProfile.user_id == user_id).options(
+        selectinload(CandidateProfile.experiences),
+        selectinload(CandidateProfile.educations),
+        selectinload(CandidateProfile.candidate_skills)
+    )
+
+
+async def rebuilt(db, statement):
+    return (await db.execute(statement)).scalar_one_or_none()
+
+
+async def per_call(call, calls: int) -> float:
+    """Mean seconds per call over ``calls`` calls, after a warm-up that fills the compiled cache."""
+    for _ in range(50):
+        await call()
+    started = time.perf_counter()
+    for _ in range(calls):
+        await call()
+    return (time.perf_counter() - started) / calls
+
+
+async def main(calls: int) -> None:
+    await benchlib.fresh_schema()
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(User), [{"id": 1, "email": EMAIL, "hashed_password": "x", "role": UserRole.candidate}])
+        await db.execute(insert(CandidateProfile), [{"id": 1, "user_id": 1}])
+        await db.commit()
+
+        cases = [
+            ("get_user_by_email", lambda: crud.get_user_by_email(db, EMAIL),
+             lambda: rebuilt(db, user_graph_by_email(EMAIL))),
+            ("candidate get_by_user_id", lambda: crud.candidate_profile.get_by_user_id(db, user_id=1),
+             lambda: rebuilt(db, profile_by_user_id(1))),
+            ("CRUDBase.get", lambda: crud.candidate_profile.get(db, 1),
+             lambda: rebuilt(db, select(CandidateProfile).where(CandidateProfile.id == 1))),
+        ]
+        print(f"{calls} calls each, us per call")
+        print(f"{'lookup':<26} {'rebuilt':>9} {'prebuilt':>9}")
+        for name, prebuilt, rebuilt_call in cases:
+            rebuilt_time = await per_call(rebuilt_call, calls)
+            prebuilt_time = await per_call(prebuilt, calls)
+            print(f"{name:<26} {rebuilt_time * 1e6:>9.0f} {prebuilt_time * 1e6:>9.0f}")
+
+        started = time.perf_counter()
+        for _ in range(calls):
+            user_graph_by_email(EMAIL)
+        print(f"building the user graph select alone: {(time.perf_counter() - started) / calls * 1e6:.0f} us")
+    await benchlib.engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=3000)
+    asyncio.run(main(parser.parse_args().calls))
@@ -0,0 +1,37 @@
+"""
+Per-call cost of verifying an access token: jwt.decode on every call (as before the cache)
+against security.decode_token, whose verified payloads are memoized until the token expires.
+
+    python scripts/bench_token_cache.py [--calls 20000]
+"""
+import argparse
+import timeit
+
+import benchlib  # noqa: F401
+
+from jose import jwt  # noqa: E402
+
+from app.core import security  # noqa: E402
+from app.core.config import settings  # noqa: E402
+
+
+def main(calls: int) -> None:
+    token = security.create_access_token("bench@example.com", role="candidate", user_id=1, profile_id=1, token_version=0)
+    security.verified_token_cache.clear()
+
+    def uncached():
+        jwt.decode(token, settings.SECRET_KEY, algorithms=[security.ALGORITHM])
+
+    def cached():
+        security.decode_token(token)
+
+    for name, call in (("jwt.decode", uncached), ("decode_token", cached)):
+        best = min(timeit.repeat(call, number=calls, repeat=5))
+        print(f"{name:<13} {best / calls * 1e6:.2f} us per call")
+    print("cache:", security.verified_token_cache.stats())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20000)
+    main(parser.parse_args().calls)
@@ -0,0 +1,49 @@
+"""
+Shared setup of the benchmark scripts. Import it before anything from ``app``: it points
+DATABASE_URL at a throwaway SQLite file, or at BENCH_DATABASE_URL when that is set
+(use a disposable database, the benchmarks drop and recreate every table).
+"""
+import os
+import sys
+import tempfile
+import time
+from typing import Awaitable, Callable, List, Sequence
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ["DATABASE_URL"] = (
+    os.environ.get("BENCH_DATABASE_URL")
+    or f"sqlite+aiosqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+)
+os.environ.setdefault("SECRET_KEY", "bench-secret-key")
+
+import app.crud  # noqa: E402,F401  Registers every model and resolves the security <-> crud import cycle.
+from app.database.database import Base, engine  # noqa: E402
+
+
+async def fresh_schema() -> None:
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+        await connection.run_sync(Base.metadata.create_all)
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def summary(samples: Sequence[float]) -> str:
+    """p50/p99/max of samples given in seconds, in milliseconds."""
+    return (
+        f"n={len(samples)} p50={percentile(samples, 0.5) * 1000:.2f} ms "
+        f"p99={percentile(samples, 0.99) * 1000:.2f} ms max={max(samples) * 1000:.2f} ms"
+    )
+
+
+async def timed(call: Callable[[], Awaitable[object]], repeat: int) -> List[float]:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await call()
+        samples.append(time.perf_counter() - started)
+    return samples
@@ -0,0 +1,94 @@
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Iterator, List
+
+# Test dependencies: pip install -r requirements-dev.txt
+# The tests always run against a throwaway SQLite file, whatever the environment points at.
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{os.path.join(tempfile.gettempdir(), 'ai_match_connect_tests.db')}"
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ.setdefault("LOGIN_RATE_LIMIT_PER_IP", "1000")
+os.environ.setdefault("LOGIN_RATE_LIMIT_PER_USERNAME", "1000")
+
+import httpx
+import pytest
+from sqlalchemy import event
+
+import app.crud  # noqa: F401  Registers every model and resolves the security <-> crud import cycle.
+from app.core.cache import principal_cache, token_version_cache
+from app.core.config import settings
+from app.database.database import AsyncSessionLocal, Base, engine
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def db():
+    """A session on a freshly created schema."""
+    principal_cache.clear()
+    token_version_cache.clear()
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+        await connection.run_sync(Base.metadata.create_all)
+    async with AsyncSessionLocal() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+async def client(db):
+    """An HTTP client for the application, on the same fresh schema as ``db``."""
+    from main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url=f"http://test{settings.API_V1_STR}") as client:
+        yield client
+
+
+@pytest.fixture
+def sign_up(client):
+    """Registers a user and returns the bearer headers of a fresh access token."""
+    async def sign_up(email: str, role: str = "candidate", password: str = "secret-password") -> dict:
+        response = await client.post("/auth/register", json={"email": email, "password": password, "role": role})
+        assert response.status_code == 200, response.text
+        response = await client.post("/auth/token", data={"username": email, "password": password})
+        assert response.status_code == 200, response.text
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+    return sign_up
+
+
+@pytest.fixture
+async def recruiter(db, sign_up):
+    """Bearer headers of a recruiter with a profile (created directly: POST /recruiter-profiles/ needs one already)."""
+    from app import crud, schemas
+
+    headers = await sign_up("recruiter@example.com", role="recruiter")
+    user = await crud.get_user_identity(db, email="recruiter@example.com")
+    await crud.recruiter_profile.create_with_owner(
+        db, obj_in=schemas.RecruiterProfileCreate(company_name="Acme"), user_id=user.id, commit=True
+    )
+    return headers
+
+
+@pytest.fixture
+def count_statements():
+    """
+    Context manager collecting the SQL statements sent to the database inside it,
+    e.g. ``with count_statements() as statements: ...; assert len(statements) <= 2``.
+    """
+    @contextmanager
+    def count_statements() -> Iterator[List[str]]:
+        statements: List[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", record)
+    return count_statements
@@ -0,0 +1,61 @@
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.models import JobPosting
+from app.routers import ai_recruiter
+
+pytestmark = pytest.mark.anyio
+
+RESUMES = [
+    {"id": "1", "text": "Python developer with FastAPI."},
+    {"id": "2", "text": "Frontend developer, React."},
+]
+
+
+@pytest.fixture
+def remote(monkeypatch):
+    """Makes the AgenticRAG service answer with the given JSON body; the pre-filter is off."""
+    monkeypatch.setattr(settings, "AI_SEARCH_PREFILTER_TOP_K", 0)
+
+    def answer(body):
+        async def call_agentic_rag(client, db_job, resumes):
+            return httpx.Response(200, json=body, request=httpx.Request("POST", ai_recruiter.AGENTIC_RAG_API_URL))
+        monkeypatch.setattr(ai_recruiter, "call_agentic_rag", call_agentic_rag)
+    return answer
+
+
+def job() -> JobPosting:
+    return JobPosting(id=1, title="Python developer", description="FastAPI services", skills=[])
+
+
+async def test_bare_list_response_is_taken_as_the_results(monkeypatch, remote):
+    monkeypatch.setattr(settings, "AI_SEARCH_MODE", "remote")
+    remote([{"id": "1"}, {"id": "2"}])
+
+    result = await ai_recruiter.rank_candidates(None, job(), RESUMES, measure_recall=False)
+
+    assert result["results"] == [{"id": "1"}, {"id": "2"}]
+    assert result["prefilter"]["recall"] == 1.0
+
+
+@pytest.mark.parametrize("body", ["ranked", 42, None])
+async def test_invalid_response_is_a_bad_gateway(monkeypatch, remote, body):
+    monkeypatch.setattr(settings, "AI_SEARCH_MODE", "remote")
+    remote(body)
+
+    with pytest.raises(HTTPException) as error:
+        await ai_recruiter.rank_candidates(None, job(), RESUMES, measure_recall=False)
+    assert error.value.status_code == 502
+
+
+async def test_invalid_response_falls_back_to_local_ranking(monkeypatch, remote):
+    monkeypatch.setattr(settings, "AI_SEARCH_MODE", "auto")
+    remote("ranked")
+
+    result = await ai_recruiter.rank_candidates(None, job(), RESUMES, measure_recall=False)
+
+    assert result["engine"] == "local-bm25"
+    assert result["fallback_reason"] == "AI service returned an invalid response"
+    assert [item["id"] for item in result["results"]] == ["1", "2"]
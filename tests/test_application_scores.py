@@ -0,0 +1,95 @@
+import pytest
+from sqlalchemy import insert, select
+
+from app import crud
+from app.crud.crud_job_application import job_application
+from app.models import CandidateProfile, ExperienceLevel, JobApplication, JobType, RecruiterProfile, User, UserRole
+from app.schemas.job_application import JobApplicationCreate
+from app.schemas.job_posting import JobPostingCreate, JobPostingUpdate
+from app.schemas.skill import CandidateSkillCreate
+
+pytestmark = pytest.mark.anyio
+
+
+async def seed_profiles(db, candidates: int) -> None:
+    await db.execute(insert(User), [
+        {"id": i, "email": f"user{i}@example.com", "hashed_password": "x",
+         "role": UserRole.recruiter if i == 1 else UserRole.candidate}
+        for i in range(1, candidates + 2)
+    ])
+    await db.execute(insert(RecruiterProfile), [{"id": 1, "user_id": 1, "company_name": "Company"}])
+    await db.execute(insert(CandidateProfile), [{"id": i, "user_id": i + 1} for i in range(1, candidates + 1)])
+
+
+async def post(db, *skills):
+    return await crud.job.create_with_recruiter_profile(
+        db,
+        obj_in=JobPostingCreate(
+            title="Developer", location="Paris", type=JobType.full_time, experience_level=ExperienceLevel.mid,
+            description="APIs", skills=list(skills),
+        ),
+        recruiter_profile_id=1,
+    )
+
+
+async def add_skill(db, candidate_profile_id, name):
+    return await crud.candidate_skill.create_with_profile(
+        db, obj_in=CandidateSkillCreate(name=name), candidate_profile_id=candidate_profile_id
+    )
+
+
+async def apply(db, job_posting_id, candidate_profile_id):
+    return await job_application.create_with_candidate(
+        db,
+        obj_in=JobApplicationCreate(
+            job_posting_id=job_posting_id, full_name="Candidate", email="candidate@example.com", cover_letter="Hi"
+        ),
+        candidate_profile_id=candidate_profile_id,
+    )
+
+
+async def score_of(db, application_id):
+    result = await db.execute(
+        select(JobApplication.matched_skills, JobApplication.required_skills, JobApplication.match_score)
+        .where(JobApplication.id == application_id)
+    )
+    return tuple(result.one())
+
+
+async def test_scores_follow_skill_changes(db):
+    await seed_profiles(db, 1)
+    posting = await post(db, "Python", "SQL", "Go", "Rust")
+    python = await add_skill(db, 1, "Python")
+    sql = await add_skill(db, 1, "SQL")
+    application = await apply(db, posting.id, 1)
+    assert await score_of(db, application.id) == (2, 4, 50)
+
+    await add_skill(db, 1, "Go")
+    assert await score_of(db, application.id) == (3, 4, 75)
+
+    await crud.candidate_skill.remove(db, id=sql.id)
+    assert await score_of(db, application.id) == (2, 4, 50)
+
+    await crud.candidate_skill.update(db, db_obj=python, obj_in={"name": "Java"})
+    assert await score_of(db, application.id) == (1, 4, 25)
+
+    await crud.job.update(db, db_obj=posting, obj_in=JobPostingUpdate(skills=["Go", "Java"]))
+    assert await score_of(db, application.id) == (2, 2, 100)
+
+    await crud.job.update_many(db, values=[{"id": posting.id, "skills": []}])
+    assert await score_of(db, application.id) == (0, 0, 0)
+
+
+async def test_dashboard_lists_each_candidates_best_application(db):
+    await seed_profiles(db, 3)
+    postings = [await post(db, "Python", "SQL"), await post(db, "Python", "Go"), await post(db, "Rust")]
+    for name in ("Python", "SQL", "Go"):
+        await add_skill(db, 1, name)
+    await add_skill(db, 2, "Python")
+    await add_skill(db, 3, "Rust")
+    for candidate_profile_id, posting_index in ((1, 0), (1, 1), (1, 2), (2, 0), (3, 2)):
+        await apply(db, postings[posting_index].id, candidate_profile_id)
+
+    dashboard = await crud.dashboard.get_recruiter_dashboard(db, recruiter_profile_id=1, top_candidates=2)
+    assert [(match.id, match.match_score) for match in dashboard["top_candidate_matches"]] == [(3, 100), (1, 100)]
+    assert dashboard["total_ai_matched_candidates"] == 3
@@ -0,0 +1,34 @@
+import pytest
+from sqlalchemy import insert
+
+from app import crud
+from app.models import CandidateProfile, CandidateSkill, Skill, User, UserRole
+
+pytestmark = pytest.mark.anyio
+
+SKILLS = ["python", "c++", "node.js", "machine learning", "amazon web services cloud", "go"]
+
+
+async def seed(db) -> None:
+    await db.execute(insert(Skill), [
+        {"id": i, "name": name, "normalized_name": name} for i, name in enumerate(SKILLS, 1)
+    ])
+    await db.execute(insert(User), [
+        {"id": i, "email": f"user{i}@example.com", "hashed_password": "x", "role": UserRole.candidate} for i in (1, 2, 3)
+    ])
+    await db.execute(insert(CandidateProfile), [
+        {"id": 1, "user_id": 1, "resume_text": "Built (C++) services, Node.js; Machine   Learning! Amazon Web Services Cloud."},
+        {"id": 2, "user_id": 2, "resume_text": "Learning machine maintenance, going places."},
+        {"id": 3, "user_id": 3, "resume_text": None},
+    ])
+    await db.execute(insert(CandidateSkill), [{"candidate_profile_id": 3, "skill_id": 1, "name": "Python"}])
+
+
+async def test_resumes_are_matched_against_the_skill_dictionary(db):
+    await seed(db)
+    expected = {1: {2, 3, 4}, 2: set(), 3: {1}, 4: set()}
+
+    assert await crud.job_match.get_candidate_skill_ids(db, [1, 2, 3, 4]) == expected
+
+    resume_texts = await crud.candidate_profile.get_resume_texts(db, ids=[1, 2, 3, 4])
+    assert await crud.job_match.get_candidate_skill_ids(db, [1, 2, 3, 4], resume_texts=resume_texts) == expected
@@ -0,0 +1,55 @@
+import pytest
+
+from app import crud, schemas
+
+pytestmark = pytest.mark.anyio
+
+# Every single-row write is one INSERT/UPDATE ... RETURNING, plus at most one more statement.
+MAX_STATEMENTS = 2
+
+
+async def test_user_and_profile_writes(db, count_statements):
+    with count_statements() as statements:
+        user = await crud.create_user(
+            db, user_in=schemas.UserCreate(email="cam@example.com", password="pw", role="candidate"), commit=True
+        )
+    assert len(statements) <= MAX_STATEMENTS, statements
+    assert user.id is not None and user.created_at is not None
+
+    with count_statements() as statements:
+        profile = await crud.candidate_profile.create_with_owner(
+            db, obj_in=schemas.CandidateProfileCreate(location="Paris"), user_id=user.id, commit=True
+        )
+    assert len(statements) <= MAX_STATEMENTS, statements
+    # Server-generated columns come back with the INSERT; collections start out loaded.
+    assert profile.id is not None and profile.created_at is not None
+    assert profile.experiences == [] and profile.educations == [] and profile.candidate_skills == []
+
+    with count_statements() as statements:
+        profile = await crud.candidate_profile.update(db, db_obj=profile, obj_in={"bio": "Backend developer"}, commit=True)
+    assert len(statements) <= MAX_STATEMENTS, statements
+    assert profile.bio == "Backend developer" and profile.updated_at is not None
+
+
+async def test_recruiter_profile_writes(db, count_statements):
+    user = await crud.create_user(
+        db, user_in=schemas.UserCreate(email="rita@example.com", password="pw", role="recruiter"), commit=True
+    )
+    with count_statements() as statements:
+        profile = await crud.recruiter_profile.create_with_owner(
+            db, obj_in=schemas.RecruiterProfileCreate(company_name="Acme"), user_id=user.id, commit=True
+        )
+    assert len(statements) <= MAX_STATEMENTS, statements
+    assert profile.id is not None and profile.job_postings == []
+
+    with count_statements() as statements:
+        profile = await crud.recruiter_profile.update(
+            db, db_obj=profile, obj_in=schemas.RecruiterProfileUpdate(job_title="Head of talent"), commit=True
+        )
+    assert len(statements) <= MAX_STATEMENTS, statements
+    assert profile.job_title == "Head of talent"
+
+    with count_statements() as statements:
+        user = await crud.update_user(db, db_user=user, user_in={"first_name": "Rita"}, commit=True)
+    assert len(statements) <= MAX_STATEMENTS, statements
+    assert user.first_name == "Rita"
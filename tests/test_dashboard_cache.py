@@ -0,0 +1,38 @@
+import pytest
+
+from app.core.dashboard_cache import DashboardCacheBackend, LocalDashboardCacheBackend
+
+pytestmark = pytest.mark.anyio
+
+
+def test_backend_must_implement_every_operation():
+    with pytest.raises(TypeError):
+        DashboardCacheBackend()
+
+
+async def test_invalidation_only_cancels_fills_of_its_own_key():
+    cache = LocalDashboardCacheBackend(maxsize=8, ttl=60)
+    first, second = cache.marker("first"), cache.marker("second")
+
+    cache.invalidate("first")
+    await cache.set("first", "stale", ttl=60, marker=first)
+    await cache.set("second", "fresh", ttl=60, marker=second)
+
+    assert await cache.get("first") is None
+    assert await cache.get("second") == "fresh"
+    assert cache.stats()["cancelled_fills"] == 1
+
+    await cache.set("first", "fresh", ttl=60, marker=cache.marker("first"))
+    assert await cache.get("first") == "fresh"
+
+
+async def test_dropped_stamps_never_let_a_stale_fill_through():
+    cache = LocalDashboardCacheBackend(maxsize=2, ttl=60)
+    marker = cache.marker("first")
+    cache.invalidate("first")
+    # Pushes the stamp of "first" out of the two that are kept.
+    cache.invalidate("second")
+    cache.invalidate("third")
+
+    await cache.set("first", "stale", ttl=60, marker=marker)
+    assert await cache.get("first") is None
@@ -0,0 +1,59 @@
+import pytest
+from sqlalchemy import insert
+
+from app.crud import crud_stats
+from app.crud.crud_job_application import job_application
+from app.database.database import AsyncSessionLocal
+from app.models import (
+    ApplicationStatus, CandidateProfile, ExperienceLevel, JobPosting, JobType, RecruiterProfile, User, UserRole,
+)
+from app.schemas.job_application import JobApplicationCreate
+
+pytestmark = pytest.mark.anyio
+
+
+async def apply(db):
+    await db.execute(insert(User), [
+        {"id": 1, "email": "recruiter@example.com", "hashed_password": "x", "role": UserRole.recruiter},
+        {"id": 2, "email": "candidate@example.com", "hashed_password": "x", "role": UserRole.candidate},
+    ])
+    await db.execute(insert(RecruiterProfile), [{"id": 1, "user_id": 1, "company_name": "Company"}])
+    await db.execute(insert(CandidateProfile), [{"id": 1, "user_id": 2}])
+    await db.execute(insert(JobPosting), [{
+        "id": 1, "recruiter_profile_id": 1, "title": "Developer", "location": "Paris",
+        "type": JobType.full_time, "experience_level": ExperienceLevel.mid, "description": "APIs",
+    }])
+    return await job_application.create_with_candidate(
+        db,
+        obj_in=JobApplicationCreate(job_posting_id=1, full_name="Candidate", email="candidate@example.com", cover_letter="Hi"),
+        candidate_profile_id=1,
+        commit=True,
+    )
+
+
+async def test_update_counts_from_the_committed_status(db):
+    stale = await apply(db)
+
+    # Another request changes the status after ``stale`` was loaded.
+    async with AsyncSessionLocal() as other:
+        current = await job_application.get(other, stale.id)
+        await job_application.update(other, db_obj=current, obj_in={"status": ApplicationStatus.REVIEWED}, commit=True)
+    assert stale.status == ApplicationStatus.PENDING
+
+    await job_application.update(db, db_obj=stale, obj_in={"status": ApplicationStatus.REJECTED}, commit=True)
+
+    counts = (await crud_stats.get_status_counts(db, job_posting_ids=[1]))[1]
+    assert {status: count for status, count in counts.items() if count} == {ApplicationStatus.REJECTED: 1}
+
+
+async def test_update_many_skips_missing_applications(db):
+    application = await apply(db)
+
+    updated = await job_application.update_many(
+        db, values=[{"id": 999, "status": ApplicationStatus.REVIEWED}, {"id": application.id, "status": ApplicationStatus.REVIEWED}],
+        commit=True,
+    )
+
+    assert updated == [application.id]
+    counts = (await crud_stats.get_status_counts(db, job_posting_ids=[1]))[1]
+    assert {status: count for status, count in counts.items() if count} == {ApplicationStatus.REVIEWED: 1}
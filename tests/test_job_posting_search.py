@@ -0,0 +1,67 @@
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+POSTING = {
+    "title": "Developer", "location": "Paris", "type": "full-time",
+    "experience_level": "mid", "description": "Building services", "skills": ["Python"],
+}
+
+
+async def post(client, headers, **fields):
+    response = await client.post("/job-postings/", headers=headers, json={**POSTING, **fields})
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+async def search(client, **params):
+    response = await client.get("/job-postings/search", params=params)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+async def test_search_requires_every_term_and_ranks_title_first(client, recruiter):
+    in_title = await post(client, recruiter, title="Rust", description="Developer wanted")
+    in_skills = await post(client, recruiter, title="Engineer", skills=["Rust"])
+    in_description = await post(client, recruiter, title="Engineer", description="Rust")
+    await post(client, recruiter, title="Go developer", skills=["Go"])
+
+    body = await search(client, q="rust")
+    assert [item["id"] for item in body["items"]] == [in_title, in_skills, in_description]
+    assert body["next_cursor"] is None
+    assert (await search(client, q="RUST!"))["items"] == body["items"]
+    assert [item["id"] for item in (await search(client, q="rust developer"))["items"]] == [in_title]
+    assert (await search(client, q="haskell"))["items"] == []
+
+
+async def test_search_filters(client, recruiter):
+    match = await post(client, recruiter, location="Lyon", type="part-time", experience_level="senior", skills=["Python", "SQL"])
+    await post(client, recruiter, location="Lyon", type="part-time", experience_level="senior")
+    await post(client, recruiter, location="Paris", type="part-time", experience_level="senior", skills=["Python", "SQL"])
+    await post(client, recruiter, location="Lyon", type="full-time", experience_level="senior", skills=["Python", "SQL"])
+    await post(client, recruiter, location="Lyon", type="part-time", experience_level="mid", skills=["Python", "SQL"])
+
+    body = await search(
+        client, q="developer", location="lyon", type="part-time", experience_level="senior", skills=["sql", "Python"]
+    )
+    assert [item["id"] for item in body["items"]] == [match]
+
+
+async def test_search_pages_on_rank_and_id(client, recruiter):
+    # Equal ranks are ordered by id, newest first; the cursor must not repeat or skip any of them.
+    best = await post(client, recruiter, description="Developer")
+    ties = [await post(client, recruiter) for _ in range(4)]
+    worst = await post(client, recruiter, title="Senior", description="Developer wanted")
+
+    seen, cursor = [], None
+    while True:
+        params = {"q": "developer", "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        body = await search(client, **params)
+        assert len(body["items"]) <= 2
+        seen += [item["id"] for item in body["items"]]
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == [best, *reversed(ties), worst]
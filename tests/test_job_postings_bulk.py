@@ -0,0 +1,65 @@
+import pytest
+
+from app.crud.crud_job_posting import job_posting as crud_job_posting
+
+pytestmark = pytest.mark.anyio
+
+POSTING = {
+    "title": "Backend developer", "location": "Paris", "type": "full-time",
+    "experience_level": "mid", "description": "APIs", "skills": ["Python"],
+}
+
+
+async def test_bulk_update_reports_items_without_fields(client, recruiter):
+    first, second = [
+        (await client.post("/job-postings/", headers=recruiter, json={**POSTING, "title": title})).json()["id"]
+        for title in ("First", "Second")
+    ]
+
+    response = await client.patch(
+        "/job-postings/bulk",
+        headers=recruiter,
+        json=[{"id": first, "title": "First, renamed"}, {"id": second}, {"id": 999, "title": "Missing"}],
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["succeeded"] == [first]
+    assert [(error["index"], error["id"], error["detail"]) for error in body["errors"]] == [
+        (1, second, "No fields to update"),
+        (2, 999, "Not found"),
+    ]
+    assert (await client.get(f"/job-postings/{first}")).json()["title"] == "First, renamed"
+    assert (await client.get(f"/job-postings/{second}")).json()["title"] == "Second"
+
+
+async def test_bulk_update_replaces_skills(client, recruiter):
+    posting_id = (await client.post("/job-postings/", headers=recruiter, json=POSTING)).json()["id"]
+
+    response = await client.patch("/job-postings/bulk", headers=recruiter, json=[{"id": posting_id, "skills": ["Go", "SQL"]}])
+    assert response.json() == {"succeeded": [posting_id], "errors": []}
+    skills = (await client.get(f"/job-postings/{posting_id}")).json()["skills"]
+    assert sorted(skill if isinstance(skill, str) else skill["name"] for skill in skills) == ["Go", "SQL"]
+
+
+async def test_bulk_update_reports_postings_deleted_after_the_ownership_check(client, recruiter, monkeypatch):
+    kept, deleted = [
+        (await client.post("/job-postings/", headers=recruiter, json={**POSTING, "title": title})).json()["id"]
+        for title in ("Kept", "Deleted")
+    ]
+    check_ownership = crud_job_posting.get_recruiter_profile_ids
+
+    async def get_recruiter_profile_ids(db, ids):
+        owners = await check_ownership(db=db, ids=ids)
+        monkeypatch.undo()
+        # Another request deletes the posting once its ownership was checked.
+        assert (await client.delete(f"/job-postings/{deleted}", headers=recruiter)).status_code == 204
+        return owners
+    monkeypatch.setattr(crud_job_posting, "get_recruiter_profile_ids", get_recruiter_profile_ids)
+
+    response = await client.patch(
+        "/job-postings/bulk",
+        headers=recruiter,
+        json=[{"id": deleted, "title": "Renamed", "skills": ["Go"]}, {"id": kept, "title": "Renamed"}],
+    )
+    assert response.status_code == 200
+    assert response.json() == {"succeeded": [kept], "errors": [{"index": 0, "id": deleted, "detail": "Not found"}]}
@@ -0,0 +1,40 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.security import PasswordHashPool
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_cancelled_waiters_leave_the_queue():
+    pool = PasswordHashPool(max_workers=1, max_queue=2)
+    release = threading.Event()
+    calls = []
+
+    def work(value):
+        release.wait(5)
+        calls.append(value)
+        return value
+
+    first = asyncio.create_task(pool.run(work, 1))
+    await asyncio.sleep(0.05)
+    waiting = [asyncio.create_task(pool.run(work, value)) for value in (2, 3)]
+    await asyncio.sleep(0.05)
+    assert (pool.queued, pool.running) == (2, 1)
+    with pytest.raises(HTTPException):
+        await pool.run(work, 4)
+
+    for task in waiting:
+        task.cancel()
+    await asyncio.gather(*waiting, return_exceptions=True)
+    assert pool.queued == 0
+
+    release.set()
+    assert await first == 1
+    assert [await pool.run(work, value) for value in (5, 6, 7)] == [5, 6, 7]
+    # The cancelled jobs never ran.
+    assert calls == [1, 5, 6, 7]
+    assert pool.stats()["queued"] == 0 and pool.stats()["completed"] == 4
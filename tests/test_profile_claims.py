@@ -0,0 +1,56 @@
+import pytest
+
+from app import crud, schemas
+
+pytestmark = pytest.mark.anyio
+
+POSTING = {
+    "title": "Backend developer", "location": "Paris", "type": "full-time",
+    "experience_level": "mid", "description": "APIs", "skills": ["Python"],
+}
+APPLICATION = {"full_name": "Cam Doe", "email": "cam@example.com", "cover_letter": "Hello"}
+
+
+async def create_recruiter_profile(db, email):
+    # POST /recruiter-profiles/ requires an existing profile (get_current_active_recruiter).
+    user = await crud.get_user_identity(db, email=email)
+    profile = await crud.recruiter_profile.create_with_owner(
+        db, obj_in=schemas.RecruiterProfileCreate(company_name="Acme"), user_id=user.id, commit=True
+    )
+    return profile.id
+
+
+async def login(client, email):
+    response = await client.post("/auth/token", data={"username": email, "password": "secret-password"})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def test_profile_created_after_login_is_used(db, client, sign_up):
+    recruiter = await sign_up("rita@example.com", role="recruiter")
+    assert (await client.post("/job-postings/", headers=recruiter, json=POSTING)).status_code == 404
+
+    await create_recruiter_profile(db, "rita@example.com")
+    assert (await client.post("/job-postings/", headers=recruiter, json=POSTING)).status_code == 201
+
+
+async def test_deleted_candidate_profile_is_not_used_from_the_token(db, client, sign_up):
+    recruiter = await sign_up("rita@example.com", role="recruiter")
+    await create_recruiter_profile(db, "rita@example.com")
+    posting_id = (await client.post("/job-postings/", headers=recruiter, json=POSTING)).json()["id"]
+
+    assert (await client.post("/candidate-profiles/", headers=await sign_up("cam@example.com"), json={})).status_code == 201
+    # A token issued while the profile exists carries its ID in the ``pid`` claim.
+    candidate = await login(client, "cam@example.com")
+
+    assert (await client.delete("/candidate-profiles/me", headers=candidate)).status_code == 200
+    response = await client.post("/job-applications/", headers=candidate, json={**APPLICATION, "job_posting_id": posting_id})
+    assert response.status_code == 404
+
+
+async def test_deleted_recruiter_profile_is_not_used_from_the_token(db, client, sign_up):
+    await sign_up("rita@example.com", role="recruiter")
+    profile_id = await create_recruiter_profile(db, "rita@example.com")
+    recruiter = await login(client, "rita@example.com")
+
+    await crud.recruiter_profile.remove(db, id=profile_id, commit=True)
+    assert (await client.post("/job-postings/", headers=recruiter, json=POSTING)).status_code == 404
@@ -0,0 +1,42 @@
+import pytest
+from starlette.requests import Request
+
+from app.core.config import settings
+from app.core.rate_limit import LocalRateLimitBackend, RateLimitBackend, TokenBucketLimiter
+from app.dependencies.deps import get_client_ip
+
+pytestmark = pytest.mark.anyio
+
+
+def make_request(*forwarded_for: str) -> Request:
+    headers = [(b"x-forwarded-for", value.encode()) for value in forwarded_for]
+    return Request({"type": "http", "headers": headers, "client": ("10.0.0.1", 4321)})
+
+
+def test_backend_must_implement_acquire():
+    with pytest.raises(TypeError):
+        RateLimitBackend()
+
+
+async def test_token_bucket_rejects_past_the_limit():
+    limiter = TokenBucketLimiter("test", limit=2, window_seconds=60, backend=LocalRateLimitBackend(shards=4))
+    results = [await limiter.hit("key") for _ in range(3)]
+    assert [allowed for allowed, _ in results] == [True, True, False]
+    assert results[-1][1] > 0
+    assert (await limiter.hit("other key"))[0]
+
+
+@pytest.mark.parametrize(
+    "hops, headers, expected",
+    [
+        (0, ("203.0.113.7",), "10.0.0.1"),
+        (1, (), "10.0.0.1"),
+        (1, ("203.0.113.7",), "203.0.113.7"),
+        (1, ("198.51.100.1, 203.0.113.7",), "203.0.113.7"),
+        (2, ("198.51.100.1, 203.0.113.7", "192.0.2.10"), "203.0.113.7"),
+        (3, ("203.0.113.7",), "203.0.113.7"),
+    ],
+)
+def test_client_ip_behind_trusted_proxies(monkeypatch, hops, headers, expected):
+    monkeypatch.setattr(settings, "TRUSTED_PROXY_HOPS", hops)
+    assert get_client_ip(make_request(*headers)) == expected
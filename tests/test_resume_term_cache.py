@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+from sqlalchemy import insert
+
+from app import crud
+from app.core.ranking import BM25Index, TermCountCache, resume_term_cache
+from app.models import CandidateProfile, User, UserRole
+
+pytestmark = pytest.mark.anyio
+
+RESUMES = {
+    1: "Python developer, FastAPI and PostgreSQL. Python for data pipelines.",
+    2: "Go and Rust engineer; some Python.",
+    3: "Frontend: React, TypeScript, node.js.",
+}
+QUERY = {"python": 3.0, "postgresql": 1.0, "rust": 2.0}
+
+
+def test_index_from_cached_counts_matches_index_from_texts():
+    cache = TermCountCache(maxsize=8, ttl=60, max_terms=1000)
+    cache.index({3: RESUMES[3], 1: RESUMES[1]})
+    index = cache.index(RESUMES)
+    expected = BM25Index.from_texts(RESUMES)
+
+    assert np.allclose(index.score(QUERY), expected.score(QUERY))
+    assert index.rank(QUERY, limit=3) == expected.rank(QUERY, limit=3)
+    assert cache.stats()["hits"] == 2
+
+
+def test_changed_text_is_counted_again():
+    cache = TermCountCache(maxsize=8, ttl=60, max_terms=1000)
+    cache.put(2, RESUMES[2])
+
+    index = cache.index({2: "Kotlin engineer"})
+    assert index.rank({"kotlin": 1.0}, limit=1)[0][0] == 2
+    assert index.score({"rust": 1.0}).tolist() == [0.0]
+    assert cache.stats()["stale"] == 1
+
+
+def test_vocabulary_is_replaced_once_it_outgrows_the_limit():
+    cache = TermCountCache(maxsize=8, ttl=60, max_terms=5)
+    cache.index(RESUMES)
+    assert cache.stats()["terms"] > 5
+
+    index = cache.index({1: RESUMES[1]})
+    assert cache.stats()["resets"] == 1
+    assert cache.stats()["size"] == 1
+    assert index.rank(QUERY, limit=1)[0][0] == 1
+
+
+async def test_uploaded_resume_is_counted_once_committed(db):
+    resume_term_cache.entries.clear()
+    await db.execute(insert(User), [{"id": 1, "email": "user1@example.com", "hashed_password": "x", "role": UserRole.candidate}])
+    await db.execute(insert(CandidateProfile), [{"id": 1, "user_id": 1}])
+    profile = await crud.candidate_profile.get(db, id=1)
+
+    await crud.candidate_profile.update(db, db_obj=profile, obj_in={"resume_text": RESUMES[1]})
+    assert resume_term_cache.entries.get(1) is None
+    await db.commit()
+
+    stale = resume_term_cache.stats()["stale"]
+    resume_term_cache.index({1: RESUMES[1]})
+    assert resume_term_cache.stats()["stale"] == stale
+    assert resume_term_cache.entries.get(1)[0] == hash(RESUMES[1])
@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.config import settings
+from app.crud.crud_revoked_token import CRUDRevokedToken
+from app.models.revoked_token import RevokedToken
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_sync_picks_up_revocations_committed_out_of_order(db):
+    now = datetime.now(timezone.utc)
+    expires_at = now + timedelta(hours=1)
+    db.add(RevokedToken(jti="seen", expires_at=expires_at, revoked_at=now))
+    await db.commit()
+
+    worker = CRUDRevokedToken()
+    await worker.rebuild(db)
+    assert await worker.is_revoked(db, jti="seen")
+
+    # Another worker's revocation whose transaction started before "seen" was written,
+    # but committed after this worker's last sync.
+    db.add(RevokedToken(jti="late", expires_at=expires_at, revoked_at=now - timedelta(seconds=5)))
+    await db.commit()
+    worker._next_sync = 0.0
+    assert await worker.is_revoked(db, jti="late")
+    assert not await worker.is_revoked(db, jti="never-revoked")
+
+
+async def test_resyncing_the_overlap_window_does_not_count_tokens_again(db):
+    now = datetime.now(timezone.utc)
+    db.add_all([RevokedToken(jti=f"jti-{i}", expires_at=now + timedelta(hours=1), revoked_at=now) for i in range(3)])
+    await db.commit()
+
+    worker = CRUDRevokedToken()
+    await worker.rebuild(db)
+    for _ in range(3):
+        worker._next_sync = 0.0
+        await worker.is_revoked(db, jti="jti-0")
+    assert worker.stats()["bloom_items"] == 3
+
+
+async def test_filter_past_capacity_is_reloaded_without_expired_tokens(db, monkeypatch):
+    monkeypatch.setattr(settings, "REVOCATION_BLOOM_CAPACITY", 2)
+    now = datetime.now(timezone.utc)
+    worker = CRUDRevokedToken()
+    await worker.rebuild(db)
+
+    db.add_all([
+        RevokedToken(jti="expired", expires_at=now - timedelta(minutes=1), revoked_at=now - timedelta(hours=1)),
+        RevokedToken(jti="first", expires_at=now + timedelta(hours=1), revoked_at=now),
+        RevokedToken(jti="second", expires_at=now + timedelta(hours=1), revoked_at=now),
+    ])
+    await db.commit()
+    worker._next_sync = 0.0
+    assert await worker.is_revoked(db, jti="first")
+
+    stats = worker.stats()
+    assert stats["reloads"] == 2
+    assert stats["bloom_items"] == 2
+    assert stats["bloom_capacity"] == 4
+    assert "expired" not in worker._bloom
+    assert await worker.is_revoked(db, jti="second")
+
+
+async def test_rebuild_purges_expired_tokens(db):
+    now = datetime.now(timezone.utc)
+    db.add_all([
+        RevokedToken(jti="expired", expires_at=now - timedelta(minutes=1)),
+        RevokedToken(jti="live", expires_at=now + timedelta(hours=1)),
+    ])
+    await db.commit()
+
+    assert await CRUDRevokedToken().rebuild(db) == 1
+    assert await db.get(RevokedToken, "expired") is None
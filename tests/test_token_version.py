@@ -0,0 +1,32 @@
+import pytest
+from sqlalchemy import insert, select
+
+from app import crud
+from app.database.database import AsyncSessionLocal
+from app.models import User, UserRole
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_concurrent_revoking_updates_each_bump_the_token_version(db):
+    await db.execute(insert(User), [{"id": 1, "email": "user@example.com", "hashed_password": "x", "role": UserRole.candidate}])
+    await db.commit()
+    stale = await db.get(User, 1)
+
+    # Another request revokes the user's tokens after ``stale`` was loaded.
+    async with AsyncSessionLocal() as other:
+        current = await other.get(User, 1)
+        await crud.update_user(other, db_user=current, user_in={"role": UserRole.recruiter}, commit=True)
+        assert current.token_version == 1
+
+    await crud.update_user(db, db_user=stale, user_in={"is_active": False}, commit=True)
+    assert stale.token_version == 2
+    assert (await db.execute(select(User.token_version).where(User.id == 1))).scalar_one() == 2
+
+
+async def test_other_changes_keep_the_token_version(db):
+    await db.execute(insert(User), [{"id": 1, "email": "user@example.com", "hashed_password": "x", "role": UserRole.candidate}])
+    user = await db.get(User, 1)
+
+    await crud.update_user(db, db_user=user, user_in={"role": UserRole.candidate}, commit=True)
+    assert (await db.execute(select(User.token_version).where(User.id == 1))).scalar_one() == 0